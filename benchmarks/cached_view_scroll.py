@@ -0,0 +1,52 @@
+"""Headless benchmark for painting a full-screen `CachedView` while scrolling.
+
+Run with `python -m benchmarks.cached_view_scroll`.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from textual.app import App, ComposeResult
+from textual.widget import Widget
+
+from feathers.widgets import CachedView
+
+ENTRIES = 10_000
+FRAMES = 500
+
+
+class ScrollApp(App):
+    def compose(self) -> ComposeResult:
+        yield CachedView(id="view", auto_scroll=False)
+
+
+def _frame_time(view: CachedView, batched: bool) -> float:
+    region = view.size.region
+    render_lines = view.render_lines if batched else lambda crop: Widget.render_lines(view, crop)
+    view._line_cache.clear()
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        view.scroll_to(y=frame * 3 % (ENTRIES - region.height), animate=False)
+        view._styles_cache.clear()
+        render_lines(region)
+    return (time.perf_counter() - start) / FRAMES
+
+
+async def main() -> None:
+    app = ScrollApp()
+    async with app.run_test(size=(200, 60)) as pilot:
+        view = app.query_one(CachedView)
+        for i in range(ENTRIES):
+            view.add_entry(f"{i} You can write a lot of content without loosing performance " * 2)
+        await pilot.pause()
+
+        row_by_row = _frame_time(view, batched=False)
+        batched = _frame_time(view, batched=True)
+        print(f"render_line per row : {row_by_row * 1000:.3f} ms/frame")
+        print(f"render_lines batched: {batched * 1000:.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+"""Benchmark for diffing two 200k line files, as DiffView does in its background thread.
+
+Run with `python -m benchmarks.diff`.
+"""
+from __future__ import annotations
+
+import random
+import time
+
+from feathers.widgets import DiffView
+from feathers.widgets._diff_view import _diff
+
+LINES = 200_000
+
+
+def _run(label: str, before: list[str], after: list[str]) -> None:
+    start = time.perf_counter()
+    first_change = None
+    changes = 0
+    for tag, *_ in _diff(before, after, DiffView.window):
+        if tag != "equal":
+            changes += 1
+            if first_change is None:
+                first_change = time.perf_counter() - start
+    total = time.perf_counter() - start
+    first = "-" if first_change is None else f"{first_change * 1_000:.1f} ms"
+    print(f"{label:<22}: first change {first}, {changes} changes in {total * 1_000:.0f} ms")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    before = [
+        f"2023-06-01 12:{i // 60 % 60:02d}:{i % 60:02d} INFO worker-{i % 8} handled request {i}" for i in range(LINES)
+    ]
+
+    mostly_same = list(before)
+    for _ in range(100):
+        mostly_same[rng.randrange(LINES)] = "changed"
+    _run("100 scattered changes", before, mostly_same)
+
+    shuffled = list(before)
+    for _ in range(20):
+        start = rng.randrange(LINES - 1000)
+        block = shuffled[start : start + 1000]
+        rng.shuffle(block)
+        shuffled[start : start + 1000] = block
+    _run("20 shuffled blocks", before, shuffled)
+    _run("identical", before, list(before))
+
+
+if __name__ == "__main__":
+    main()
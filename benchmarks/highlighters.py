@@ -0,0 +1,50 @@
+"""Benchmark for the highlighters available to `CachedView`, on log lines which repeat a lot.
+
+Run with `python -m benchmarks.highlighters`.
+"""
+from __future__ import annotations
+
+import random
+import time
+
+from rich.highlighter import Highlighter, ReprHighlighter
+from rich.text import Text
+
+from feathers.highlighters import CombinedRegexHighlighter, LogLevelHighlighter, MemoizedHighlighter
+
+LINES = 20_000
+DISTINCT = 500
+
+
+def _lines() -> list[str]:
+    rng = random.Random(0)
+    levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
+    templates = [
+        f"{levels[i % 4]} worker-{i % 7} handled GET /api/items/{i} in {i * 0.37:.2f}ms from 10.0.{i % 255}.1 ok=True"
+        for i in range(DISTINCT)
+    ]
+    return [rng.choice(templates) for _ in range(LINES)]
+
+
+def _time(highlighter: Highlighter, lines: list[str]) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        highlighter(Text(line))
+    return (time.perf_counter() - start) / len(lines)
+
+
+def main() -> None:
+    lines = _lines()
+    highlighters: dict[str, Highlighter] = {
+        "ReprHighlighter": ReprHighlighter(),
+        "MemoizedHighlighter(Repr)": MemoizedHighlighter(ReprHighlighter()),
+        "CombinedRegexHighlighter": CombinedRegexHighlighter(),
+        "LogLevelHighlighter": LogLevelHighlighter(),
+    }
+    print(f"{LINES} lines, {DISTINCT} distinct")
+    for name, highlighter in highlighters.items():
+        print(f"{name:<26}: {_time(highlighter, lines) * 1_000_000:.1f} us/line")
+
+
+if __name__ == "__main__":
+    main()
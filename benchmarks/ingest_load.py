@@ -0,0 +1,113 @@
+"""Load generator for an `IngestServer`: several producers sending entries as fast as possible, or at a given rate.
+
+Without an address, it starts a headless app with an `IngestServer` on a temporary Unix socket and reports how fast
+the entries reach the view. With `--unix` or `--tcp`, it sends to the `IngestServer` of an app you are running, at the
+address its `start_unix` or `start_tcp` returned.
+
+Run with `python -m benchmarks.ingest_load`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from textual.app import App, ComposeResult
+
+from feathers.server import IngestClient, IngestServer
+from feathers.widgets import CachedView
+
+
+class IngestApp(App):
+    def compose(self) -> ComposeResult:
+        yield CachedView(id="view")
+
+
+def _produce(address: str | tuple[str, int], producer: int, args: argparse.Namespace) -> None:
+    entries = [
+        f"producer {producer} entry {i} GET /api/items?page={i % 97} 200 {i % 1000}ms" for i in range(args.count)
+    ]
+    with IngestClient(address, framing=args.framing) as client:
+        start = time.perf_counter()
+        for sent in range(0, args.count, args.batch):
+            client.send_many(entries[sent : sent + args.batch])
+            if args.rate:
+                # sleep until the time at which these entries are due
+                delay = start + (sent + args.batch) / args.rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+
+def _run_producers(address: str | tuple[str, int], args: argparse.Namespace) -> float:
+    threads = [
+        threading.Thread(target=_produce, args=(address, producer, args), daemon=True)
+        for producer in range(args.connections)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+async def _self_hosted(args: argparse.Namespace) -> None:
+    total = args.connections * args.count
+    app = IngestApp()
+    async with app.run_test(size=(200, 60)) as pilot:
+        view = app.query_one(CachedView)
+        server = IngestServer(view, framing=args.framing, max_pending=args.max_pending)
+        with tempfile.TemporaryDirectory() as directory:
+            address = await server.start_unix(Path(directory) / "ingest.sock")
+            start = time.perf_counter()
+            sending = asyncio.get_running_loop().run_in_executor(None, _run_producers, address, args)
+            while server.frames < total:
+                await pilot.pause(0.01)
+            received = time.perf_counter() - start
+            while server.connections:
+                await pilot.pause(0.01)
+            elapsed = time.perf_counter() - start
+            await sending
+            await server.close()
+
+    print(f"producers    : {args.connections} x {args.count} entries, {args.framing} framing")
+    print(f"received     : {total / received:,.0f} entries/s, {server.bytes_received / received / 1e6:.1f} MB/s")
+    print(f"written      : {total / elapsed:,.0f} entries/s")
+    print(f"read pauses  : {server.read_pauses}")
+    print(f"entries shown: {len(view._renderables_cache._all_renderables):,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--unix", metavar="PATH", help="send to the server listening on this Unix domain socket")
+    target.add_argument("--tcp", metavar="HOST:PORT", help="send to the server listening on this TCP address")
+    parser.add_argument("--framing", choices=["newline", "length"], default="newline")
+    parser.add_argument("--connections", type=int, default=4, help="number of producers")
+    parser.add_argument("--count", type=int, default=25_000, help="entries sent by each producer")
+    parser.add_argument("--batch", type=int, default=100, help="entries sent per write")
+    parser.add_argument(
+        "--max-pending", type=int, default=10_000, help="entries waiting per producer above which reading it stops"
+    )
+    parser.add_argument("--rate", type=float, default=0, help="entries per second of each producer, 0 for no limit")
+    args = parser.parse_args()
+
+    if args.unix is None and args.tcp is None:
+        asyncio.run(_self_hosted(args))
+        return
+    address: str | tuple[str, int]
+    if args.unix is not None:
+        address = args.unix
+    else:
+        host, _, port = args.tcp.rpartition(":")
+        address = (host, int(port))
+    elapsed = _run_producers(address, args)
+    total = args.connections * args.count
+    print(f"sent {total:,} entries in {elapsed:.2f} s, {total / elapsed:,.0f} entries/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark for adding, sorting and filtering 1M structured log rows in a LogTable.
+
+Run with `python -m benchmarks.log_table`.
+"""
+from __future__ import annotations
+
+import random
+import time
+
+from feathers.widgets import LogTable
+
+ROWS = 1_000_000
+LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+HOSTS = [f"web-{i:02d}" for i in range(50)]
+
+
+def _timed(label: str, work) -> None:
+    start = time.perf_counter()
+    work()
+    print(f"{label:<20}: {(time.perf_counter() - start) * 1_000:.0f} ms")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    rows = [(rng.choice(LEVELS), rng.choice(HOSTS), rng.randrange(10_000), f"request {i % 1000}") for i in range(ROWS)]
+    table = LogTable(["level", "host", "latency", "message"])
+
+    _timed("add 1M rows", lambda: table.add_rows(rows))
+    _timed("sort by latency", lambda: table.sort("latency"))
+    _timed("sort by host", lambda: table.sort("host", reverse=True))
+    _timed("filter on level", lambda: table.filter("level", lambda level: level == "ERROR"))
+    _timed("render 50 rows", lambda: [table._row_line(table.row_at(line) or 0) for line in range(1, 51)])
+    print(f"{table.shown_count} rows shown")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark for adding values to a Sparkline and rendering it, as a 1 kHz metric would.
+
+Run with `python -m benchmarks.sparkline`.
+"""
+from __future__ import annotations
+
+import io
+import math
+import time
+
+from rich.console import Console
+
+from feathers.renderables import Sparkline
+
+CAPACITY = 100_000
+SAMPLES = 1_000_000
+WIDTH = 120
+
+
+def main() -> None:
+    console = Console(width=WIDTH, file=io.StringIO(), color_system="truecolor")
+    sparkline = Sparkline(CAPACITY)
+    values = [50 + 40 * math.sin(i / 5_000) for i in range(SAMPLES)]
+
+    start = time.perf_counter()
+    sparkline.extend(values[:CAPACITY])
+    console.print(sparkline)
+    print(f"fill and first render: {(time.perf_counter() - start) * 1_000:.0f} ms")
+
+    renders = 0
+    start = time.perf_counter()
+    for value in values[CAPACITY:]:
+        if sparkline.append(value):
+            console.print(sparkline)
+            renders += 1
+    elapsed = time.perf_counter() - start
+    print(f"append              : {elapsed / (SAMPLES - CAPACITY) * 1_000_000:.2f} us/value, {renders} renders")
+
+    start = time.perf_counter()
+    for width in range(80, 100):
+        console.print(sparkline, width=width)
+    print(f"rebuild for a width : {(time.perf_counter() - start) / 20 * 1_000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark for cropping a 10k column line at increasing horizontal offsets, as horizontal scrolling does.
+
+Run with `python -m benchmarks.wide_crop`.
+"""
+from __future__ import annotations
+
+import time
+
+from rich.console import Console
+from rich.highlighter import ReprHighlighter
+from rich.text import Text
+from textual.strip import Strip
+
+from feathers.cache import RenderablesCache, RenderableWithOptions
+
+COLUMNS = 10_000
+VIEWPORT = 200
+FRAMES = 2_000
+
+
+def _crop_time(strip: Strip) -> float:
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        scroll_x = frame * 5 % (strip.cell_length - VIEWPORT)
+        strip.crop(scroll_x, scroll_x + VIEWPORT)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main() -> None:
+    row = ",".join(f"{i},{i * 0.5},'value {i}'" for i in range(COLUMNS))[:COLUMNS]
+    cache = RenderablesCache(Console(width=COLUMNS))
+    cache.content_width = VIEWPORT
+    cache.add(RenderableWithOptions(ReprHighlighter()(Text(row)), width=COLUMNS, expand=True))
+    indexed = cache.strip_at(0)
+    assert indexed is not None
+    plain = Strip(list(indexed), indexed.cell_length)
+
+    print(f"{len(indexed)} segments, {indexed.cell_length} cells")
+    print(f"Strip.crop        : {_crop_time(plain) * 1_000_000:.1f} us/frame")
+    print(f"indexed strip crop: {_crop_time(indexed) * 1_000_000:.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from collections import OrderedDict
-from dataclasses import dataclass
-from typing import NewType
-
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from itertools import accumulate
+from time import perf_counter
+from typing import NewType, cast
+
+from rich.cells import cell_len
 from rich.console import Console, ConsoleOptions, RenderableType
+from rich.markdown import Markdown
 from rich.measure import Measurement
 from rich.segment import Segment
+from rich.style import Style
+from rich.syntax import Syntax
 from rich.text import Text
+from textual import log
 from textual.geometry import Size
 from textual.strip import Strip
 
@@ -16,9 +27,107 @@ class CacheListener:
     def on_cache_update(self):
         pass
 
+    def on_deferred_render(self):
+        """Called from a worker thread when a deferred render is done.
+
+        `RenderablesCache.complete_deferred` should then be called on the event loop.
+        """
+        pass
+
 
 CacheId = NewType("CacheId", str)
 
+# rough per-object memory costs used to estimate the size of rendered strips
+_STRIP_BYTES = 120
+_SEGMENT_BYTES = 150
+# beyond this many pending changes, they are merged in a single open range
+_MAX_CHANGES = 64
+# once over budget, evict down to this fraction of the budget so eviction does not run on every add
+_EVICT_TO = 0.8
+
+
+# renderables bigger than this are rendered off the event loop when there is a render budget
+_CHEAP_TEXT_LENGTH = 10_000
+# renders run in a few threads, so that a slow renderable does not hold back the ones submitted after it
+_RENDER_WORKERS = 4
+# number of lines of plain text shown while a renderable is rendered in the background
+_PLACEHOLDER_LINES = 3
+_PLACEHOLDER_STYLE = Style(dim=True, italic=True)
+# strips with more segments than this get an index of segment offsets to crop them quickly
+_INDEXED_SEGMENTS = 64
+
+
+class _IndexedStrip(Strip):
+    """A strip which keeps the cell offset of each segment, so it is cropped in O(log segments + cropped segments)
+
+    `Strip.crop` walks the segments from the start of the line, which gets slow on very wide lines scrolled
+    horizontally. The offsets are only worked out on the first crop.
+    """
+
+    __slots__ = ["_offsets"]
+
+    def __init__(self, segments: Iterable[Segment], cell_length: int | None = None) -> None:
+        super().__init__(segments, cell_length)
+        self._offsets: list[int] | None = None
+
+    def crop(self, start: int, end: int | None = None) -> Strip:
+        start = max(0, start)
+        end = self.cell_length if end is None else min(self.cell_length, end)
+        if start == 0 and end == self.cell_length:
+            return self
+        if start >= end:
+            return Strip([], 0)
+        cache_key = (start, end)
+        cached = self._crop_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        offsets = self._offsets
+        if offsets is None:
+            offsets = self._offsets = list(
+                accumulate((cell_len(segment.text) for segment in self._segments), initial=0)
+            )
+        # the segments from first up to last overlap the cells from start to end
+        first = bisect_right(offsets, start) - 1
+        last = bisect_left(offsets, end, first + 1)
+        segments = self._segments[first:last]
+        if offsets[last] > end:
+            segments[-1] = segments[-1].split_cells(end - offsets[last - 1])[0]
+        if start > offsets[first]:
+            segments[0] = segments[0].split_cells(start - offsets[first])[1]
+
+        strip = Strip(segments, end - start)
+        self._crop_cache[cache_key] = strip
+        return strip
+
+
+def _strip_bytes(strip: Strip) -> int:
+    return _STRIP_BYTES + sum(_SEGMENT_BYTES + len(segment.text) for segment in strip)
+
+
+def _is_cheap(renderable: RenderableType) -> bool:
+    return isinstance(renderable, Text) and len(renderable) <= _CHEAP_TEXT_LENGTH
+
+
+def _plain_text(renderable: RenderableType) -> str | None:
+    """Get the plain text of a renderable, if it is cheap to get. Any renderable can provide a `plain` property"""
+    if isinstance(renderable, str):
+        return renderable
+    if isinstance(renderable, Markdown):
+        return renderable.markup
+    if isinstance(renderable, Syntax):
+        return renderable.code
+    plain = getattr(renderable, "plain", None)
+    return plain if isinstance(plain, str) else None
+
+
+@dataclass
+class _DeferredRender:
+    # the strips and the seconds spent rendering them, not counting the time waiting for a thread
+    future: Future[tuple[list[Strip], float]]
+    width: int | None
+    version: int
+
 
 @dataclass
 class RenderableWithOptions:
@@ -28,6 +137,42 @@ class RenderableWithOptions:
     expand: bool | None = False
     strink: bool | None = True
     wrap: bool = False
+    timestamp: float | None = None
+
+
+class _LineIndex:
+    """A Fenwick tree of line counts by renderable position, to find the first line of a renderable in O(log n)"""
+
+    def __init__(self) -> None:
+        self._tree: list[int] = [0]
+        self._counts: list[int] = [0]
+
+    def append(self, count: int) -> int:
+        """Add a position at the end and return it"""
+        position = len(self._tree)
+        lowest = position & -position
+        self._tree.append(count + self.prefix(position - 1) - self.prefix(position - lowest))
+        self._counts.append(count)
+        return position
+
+    def set(self, position: int, count: int) -> None:
+        delta = count - self._counts[position]
+        self._counts[position] = count
+        while delta and position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def prefix(self, position: int) -> int:
+        """Sum of the line counts up to and including `position`"""
+        total = 0
+        while position > 0:
+            total += self._tree[position]
+            position -= position & -position
+        return total
+
+    def clear(self) -> None:
+        self._tree = [0]
+        self._counts = [0]
 
 
 class RenderablesCache:
@@ -36,10 +181,34 @@ class RenderablesCache:
     A renderables can result in Strips which are cached. The renderables can
     be added and removed and Strips are cached for better performance.
 
+    If a `byte_budget` is given and the strips are estimated to use more memory than that, the strips of the least
+    recently used renderables are dropped. Their line counts are kept, so the virtual size stays exact, and they are
+    rendered again when accessed.
+
+    If a `render_budget` is given, renderables which are not plain short texts are rendered in a worker thread. A
+    renderable which is not rendered within the budget (in seconds) is shown as a placeholder with the start of its
+    plain text, and swapped in by `complete_deferred` once rendered. The listener is told through
+    `on_deferred_render`. Renderables which read the state of a widget must not be rendered in a thread: they
+    should have a true `render_on_event_loop` attribute, and are then rendered on the event loop whatever the budget.
+
+    While `preview_mode` is set, renderables which are not plain short texts but have a plain text are rendered as
+    that plain text, without any styling. `upgrade_previews` renders them fully once preview mode is off.
+
+    Attributes:
+        preview_mode: Render cheap previews instead of full renderables
+        evictions: Number of times the strips of a renderable were dropped to stay within the byte budget
+        rerenders: Number of times dropped strips were rendered again
+        deferred_renders: Number of renderables which went over the render budget
     """
 
     def __init__(
-        self, console: Console, options: ConsoleOptions | None = None, listener: CacheListener | None = None
+        self,
+        console: Console,
+        options: ConsoleOptions | None = None,
+        listener: CacheListener | None = None,
+        *,
+        byte_budget: int | None = None,
+        render_budget: float | None = None,
     ) -> None:
         self._console = console
         self._options = options if options is not None else console.options
@@ -48,10 +217,46 @@ class RenderablesCache:
         self._all_renderables: OrderedDict[CacheId, RenderableWithOptions] = OrderedDict()
         self._renderables_added: list[CacheId] = []
         self._renderables_removed: list[CacheId] = []
-        self._cache: list[tuple[CacheId, Strip]] = []
+        # a strip is None if it was evicted
+        self._cache: list[tuple[CacheId, Strip | None]] = []
+        self._line_counts: dict[CacheId, int] = {}
+        self._positions: dict[CacheId, int] = {}
+        self._line_index = _LineIndex()
+        # (timestamp, sequence, id) for the renderables with a timestamp, sorted
+        self._time_index: list[tuple[float, int, CacheId]] = []
+        self._timestamps: dict[CacheId, tuple[float, int]] = {}
+        self._sequence = 0
+        self._widths: dict[CacheId, int] = {}
         self._virtual_size: Size = Size(0, 0)
+        self._changes: list[tuple[int, int | None]] = []
+
+        self._byte_budget = byte_budget
+        self._bytes = 0
+        self._entry_bytes: dict[CacheId, int] = {}
+        # renderables with strips in memory, least recently used first
+        self._resident: OrderedDict[CacheId, None] = OrderedDict()
+        # renderables which were accessed last and should not be evicted
+        self._protected: set[CacheId] = set()
+        self.evictions = 0
+        self.rerenders = 0
+
+        self._render_budget = render_budget
+        self._executor: ThreadPoolExecutor | None = None
+        self._deferred: dict[CacheId, _DeferredRender] = {}
+        # bumped by `rerender`, so a render submitted before the renderable changed is not swapped in
+        self._versions: dict[CacheId, int] = {}
+        self.deferred_renders = 0
+
+        self.preview_mode = False
+        self._previews: set[CacheId] = set()
+        self._paused = False
 
         self._content_width: int | None = None
+        # entries rendered at a width other than content_width, waiting for `reflow_step`
+        self._stale: set[CacheId] = set()
+        self._reflow_order: list[CacheId] = []
+        self._reflow_position: int = 0
+        self._reflow_line: int | None = 0
 
     @property
     def virtual_size(self) -> Size:
@@ -67,30 +272,389 @@ class RenderablesCache:
             self._content_width = value
             self.refresh()
 
+    @property
+    def is_reflowing(self) -> bool:
+        """True if some entries are still rendered at a previous content width"""
+        return bool(self._stale)
+
+    @property
+    def has_previews(self) -> bool:
+        """True if some renderables are rendered as previews"""
+        return bool(self._previews)
+
+    @property
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def pause(self) -> None:
+        """Queue added renderables without rendering them, until `resume`. Removed renderables are dropped at once"""
+        self._paused = True
+
+    def resume(self) -> None:
+        """Render the renderables added while paused"""
+        self._paused = False
+        self._update_cache()
+
+    @property
+    def byte_budget(self) -> int | None:
+        return self._byte_budget
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Estimated memory used by the strips in cache. Only tracked if there is a byte budget"""
+        return self._bytes
+
+    def pop_changes(self) -> list[tuple[int, int | None]]:
+        """Get the ranges of lines which changed since the last call, as (start, end) tuples.
+
+        The end is None if lines were inserted or removed at start, which shifts all the lines below.
+        """
+        changes, self._changes = self._changes, []
+        return changes
+
+    def _changed(self, start: int, end: int | None) -> None:
+        if len(self._changes) >= _MAX_CHANGES:
+            start = min(start, min(change[0] for change in self._changes))
+            self._changes.clear()
+            end = None
+        self._changes.append((start, end))
+
     def strip_at(self, index: int) -> Strip | None:
         """Get the strip at given index from cache"""
         if index >= len(self._cache):
             return None
-        return self._cache[index][1]
+        id, strip = self._cache[index]
+        if strip is None:
+            self._restore(index)
+            self._evict()
+            return self._cache[index][1] if index < len(self._cache) else None
+        if self._byte_budget is not None:
+            self._resident.move_to_end(id)
+        return strip
+
+    def strips_between(self, start: int, end: int) -> list[Strip]:
+        """Get the strips from `start` up to (not including) `end`. Missing lines are not returned"""
+        start, end = max(0, start), max(0, end)
+        if self._byte_budget is None:
+            return cast("list[Strip]", [strip for _, strip in self._cache[start:end]])
+
+        restored = False
+        for index in range(start, min(end, len(self._cache))):
+            if self._cache[index][1] is None:
+                self._restore(index)
+                restored = True
+
+        lines = self._cache[start:end]
+        self._protected = {id for id, _ in lines}
+        for id in self._protected:
+            self._resident.move_to_end(id)
+        if restored:
+            self._evict()
+        return cast("list[Strip]", [strip for _, strip in lines])
 
     def add(self, renderable: RenderableWithOptions):
         """Add a new renderable. Pass the id in renderable if you intend to update or remove it later"""
-        renderable_id = CacheId(renderable.id) if renderable.id else CacheId(str(id(renderable)))
-        if renderable_id not in self._all_renderables:
-            self._all_renderables[renderable_id] = renderable
-            self._renderables_added.append(renderable_id)
+        if self._queue_add(renderable):
+            self._update_cache()
+
+    def add_many(self, renderables: Iterable[RenderableWithOptions]):
+        """Add new renderables with a single cache update"""
+        added = False
+        for renderable in renderables:
+            added = self._queue_add(renderable) or added
+        if added:
             self._update_cache()
 
+    def _queue_add(self, renderable: RenderableWithOptions) -> bool:
+        renderable_id = CacheId(renderable.id) if renderable.id else CacheId(str(id(renderable)))
+        if renderable_id in self._all_renderables:
+            return False
+        self._all_renderables[renderable_id] = renderable
+        self._renderables_added.append(renderable_id)
+        if renderable.timestamp is not None:
+            self._index_time(renderable_id, renderable.timestamp)
+        return True
+
+    def _index_time(self, id: CacheId, timestamp: float) -> None:
+        self._sequence += 1
+        key = (timestamp, self._sequence, id)
+        self._timestamps[id] = key[:2]
+        # renderables mostly come in time order, which makes this an append
+        if not self._time_index or self._time_index[-1] <= key:
+            self._time_index.append(key)
+        else:
+            insort(self._time_index, key)
+
+    def _unindex_time(self, id: CacheId) -> None:
+        key = self._timestamps.pop(id, None)
+        if key is None:
+            return
+        index = bisect_left(self._time_index, (*key, id))
+        if index < len(self._time_index) and self._time_index[index][2] == id:
+            del self._time_index[index]
+
+    def line_at_time(self, timestamp: float) -> int | None:
+        """Get the first line of the earliest renderable with a timestamp at or after `timestamp`, in O(log n)"""
+        time_index = self._time_index
+        for position in range(bisect_left(time_index, (timestamp,)), len(time_index)):
+            line = self.line_of(time_index[position][2])
+            if line is not None:
+                return line
+        return None
+
+    def ids_between_times(self, start: float, end: float) -> list[CacheId]:
+        """Get the ids of the renderables with a timestamp from `start` up to (not including) `end`, in time order"""
+        first = bisect_left(self._time_index, (start,))
+        last = bisect_left(self._time_index, (end,))
+        return [id for _, _, id in self._time_index[first:last]]
+
     def remove(self, id: str):
         """Remove the renderable from cache. If missing, the operation is ignored"""
         renderable_id = CacheId(id)
         if id in self._all_renderables:
-            self._renderables_removed.append(renderable_id)
+            paused_removal = False
+            if renderable_id in self._renderables_added:
+                # never rendered, nothing to remove from cache
+                self._renderables_added.remove(renderable_id)
+            elif self._paused:
+                # dropping lines is cheap, and lines left without their renderable could not be reflowed or restored
+                paused_removal = True
+            else:
+                self._renderables_removed.append(renderable_id)
             self._all_renderables.pop(renderable_id)
-            self._update_cache()
+            self._drop_deferred(renderable_id)
+            self._versions.pop(renderable_id, None)
+            self._unindex_time(renderable_id)
+            self._stale.discard(renderable_id)
+            # line offsets before the reflow position may have shifted
+            self._reflow_line = None
+            if paused_removal:
+                self._remove_from_cache(renderable_id)
+                if self._listener is not None:
+                    self._listener.on_cache_update()
+            else:
+                self._update_cache()
+
+    def get(self, id: str) -> RenderableWithOptions | None:
+        """Get the renderable with given id, or None if it is missing"""
+        return self._all_renderables.get(CacheId(id))
+
+    def rerender(self, id: str) -> None:
+        """Render again the renderable with given id, after it changed. If missing, the operation is ignored"""
+        renderable_id = CacheId(id)
+        start = self.line_of(renderable_id)
+        if start is None:
+            return
+        self._versions[renderable_id] = self._versions.get(renderable_id, 0) + 1
+        self._reflow_entry(renderable_id, start)
+        self._evict()
+        if self._listener is not None:
+            self._listener.on_cache_update()
+
+    def entry_at(self, index: int) -> tuple[CacheId, int] | None:
+        """Get the id of the renderable at line `index` and the offset of that line within the renderable"""
+        if not 0 <= index < len(self._cache):
+            return None
+        id = self._cache[index][0]
+        start = index
+        while start > 0 and self._cache[start - 1][0] == id:
+            start -= 1
+        return id, index - start
+
+    def line_of(self, id: str) -> int | None:
+        """Get the first line of the renderable with given id, or None if it is missing"""
+        position = self._positions.get(CacheId(id))
+        if position is None:
+            return None
+        return self._line_index.prefix(position - 1)
+
+    def reflow(self, width: int, first_line: int = 0, last_line: int = 0) -> None:
+        """Change the content width without re-rendering everything at once.
+
+        The renderables overlapping lines `first_line` to `last_line` (usually the viewport) are re-rendered right
+        away. The remaining renderables keep their current strips until `reflow_step` gets to them. Calling this
+        again before the reflow is complete starts over with the new width.
+
+        Args:
+            width: The new content width.
+            first_line: First line to reflow right away.
+            last_line: Line after the last line to reflow right away.
+        """
+        if width == self._content_width and not self._stale:
+            return
+        if not self._content_width or not self._cache:
+            self.content_width = width
+            return
+
+        self._content_width = width
+        self._stale = set(self._line_counts)
+        self._reflow_order = list(self._line_counts)
+        self._reflow_position = 0
+        self._reflow_line = 0
+
+        entry = self.entry_at(min(first_line, len(self._cache) - 1))
+        if entry is not None:
+            id, offset = entry
+            line = first_line - offset
+            reflowed = set()
+            while line < last_line and line < len(self._cache):
+                id = self._cache[line][0]
+                reflowed.add(id)
+                line += self._reflow_entry(id, line)
+            self._protected = reflowed
+        # the evicted renderables were rendered again to count their lines
+        self._evict()
+
+        if self._listener is not None:
+            self._listener.on_cache_update()
+
+    def reflow_step(self, budget: float) -> bool:
+        """Re-render stale renderables, in order, for about `budget` seconds.
+
+        Args:
+            budget: The time budget in seconds. At least one renderable is processed per call.
+
+        Returns:
+            True if the reflow is complete.
+        """
+        if not self._stale:
+            return True
+        if self._reflow_line is None:
+            # a renderable was removed, work out the line offset of the reflow position again
+            self._reflow_line = sum(self._line_counts.get(id, 0) for id in self._reflow_order[: self._reflow_position])
+
+        deadline = perf_counter() + budget
+        order, line_counts = self._reflow_order, self._line_counts
+        while self._reflow_position < len(order):
+            id = order[self._reflow_position]
+            self._reflow_position += 1
+            if id not in line_counts:
+                continue
+            if id in self._stale:
+                self._reflow_line += self._reflow_entry(id, self._reflow_line)
+                if perf_counter() >= deadline:
+                    break
+            else:
+                self._reflow_line += line_counts[id]
+        self._evict()
+
+        if self._reflow_position >= len(order):
+            self._stale.clear()
+            self._refresh_virtual_size()
+        if self._listener is not None:
+            self._listener.on_cache_update()
+        return not self._stale
+
+    def upgrade_previews(self, budget: float, first_line: int = 0, last_line: int = 0) -> bool:
+        """Render fully the renderables rendered as previews, for about `budget` seconds.
+
+        The previews overlapping lines `first_line` to `last_line` (usually the viewport) are upgraded first, the rest
+        in order. Nothing is upgraded while `preview_mode` is set.
+
+        Args:
+            budget: The time budget in seconds. At least one renderable is upgraded per call.
+            first_line: First line to upgrade first.
+            last_line: Line after the last line to upgrade first.
+
+        Returns:
+            True if no preview is left.
+        """
+        if not self._previews or self.preview_mode:
+            return not self._previews
+
+        deadline = perf_counter() + budget
+        previews = self._previews
+        entry = self.entry_at(first_line)
+        if entry is not None:
+            line = first_line - entry[1]
+            while line < last_line and line < len(self._cache):
+                id = self._cache[line][0]
+                line += self._reflow_entry(id, line) if id in previews else self._line_counts[id]
+
+        line = 0
+        for id, count in self._line_counts.items():
+            if perf_counter() >= deadline or not previews:
+                break
+            line += self._reflow_entry(id, line) if id in previews else count
+
+        self._evict()
+        if self._listener is not None:
+            self._listener.on_cache_update()
+        return not previews
+
+    def prefetch(self, first_line: int, last_line: int, budget: float) -> int:
+        """Render again the evicted renderables from line `first_line` up to `last_line`, for about `budget` seconds.
+
+        Args:
+            first_line: First line to prefetch.
+            last_line: Line after the last line to prefetch.
+            budget: The time budget in seconds. At least one renderable is rendered per call.
+
+        Returns:
+            The line to continue from, `last_line` or more once done.
+        """
+        if self._byte_budget is None:
+            return last_line
+
+        deadline = perf_counter() + budget
+        line = max(first_line, 0)
+        restored = False
+        while line < min(last_line, len(self._cache)):
+            if self._cache[line][1] is None:
+                if restored and perf_counter() >= deadline:
+                    break
+                self._restore(line)
+                restored = True
+            line += 1
+        else:
+            line = max(line, last_line)
+        if restored:
+            self._evict()
+        return line
+
+    def complete_deferred(self) -> None:
+        """Swap in the strips of the deferred renders which are done. Must be called on the event loop"""
+        updated = False
+        for id in [id for id, deferred in self._deferred.items() if deferred.future.done()]:
+            deferred = self._deferred.pop(id)
+            if id not in self._line_counts or deferred.future.cancelled():
+                continue
+            error = deferred.future.exception()
+            if error is not None:
+                log.error(f"Rendering {id!r} failed: {error!r}")
+                continue
+
+            lines, elapsed = deferred.future.result()
+            if self._render_budget is not None and elapsed > self._render_budget:
+                log.warning(f"Rendering {id!r} took {elapsed:.3f}s, over the {self._render_budget}s budget")
+            start = self.line_of(id)
+            if start is None:
+                continue
+            if deferred.width == self._content_width:
+                self._store(id, start, self._line_counts[id], lines)
+            else:
+                # the content width changed while rendering, render again at the new width
+                self._reflow_entry(id, start)
+            updated = True
+
+        if updated:
+            self._evict()
+            if self._listener is not None:
+                self._listener.on_cache_update()
 
     def refresh(self) -> None:
+        self._changed(0, None)
         self._cache.clear()
+        self._line_counts.clear()
+        self._positions.clear()
+        self._line_index.clear()
+        self._widths.clear()
+        self._stale.clear()
+        self._previews.clear()
+        self._bytes = 0
+        self._entry_bytes.clear()
+        self._resident.clear()
+        self._protected.clear()
         self._renderables_added.clear()
         self._renderables_removed.clear()
         for id in self._all_renderables.keys():
@@ -100,10 +664,22 @@ class RenderablesCache:
 
     def clear(self) -> None:
         self._all_renderables.clear()
+        self._time_index.clear()
+        self._timestamps.clear()
+        self._versions.clear()
+        self.close()
         self.refresh()
 
+    def close(self) -> None:
+        """Cancel the deferred renders and stop the render threads. A later render starts new ones"""
+        for id in list(self._deferred):
+            self._drop_deferred(id)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def _update_cache(self) -> None:
-        if not self._content_width:
+        if not self._content_width or self._paused:
             return None
         is_updated = False
 
@@ -117,29 +693,168 @@ class RenderablesCache:
             self._remove_from_cache(id)
         self._renderables_removed.clear()
 
-        if is_updated and self._listener is not None:
-            self._listener.on_cache_update()
+        if is_updated:
+            self._evict()
+            if self._listener is not None:
+                self._listener.on_cache_update()
 
     def _add_to_cache(self, id: CacheId, renderable: RenderableWithOptions) -> None:
-        strips = self._extract_lines(renderable)
-        if strips is None:
+        self._line_counts[id] = 0
+        self._positions[id] = self._line_index.append(0)
+        self._store(id, len(self._cache), 0, self._render_lines(id, renderable))
+        self._protected = {id}
+
+    def _reflow_entry(self, id: CacheId, start: int) -> int:
+        """Re-render the renderable starting at line `start` and return its new line count"""
+        return self._store(id, start, self._line_counts[id], self._render_lines(id, self._all_renderables[id]))
+
+    def _render_lines(self, id: CacheId, renderable: RenderableWithOptions) -> list[Strip]:
+        """Render a renderable, or get a preview or a placeholder if it is not rendered within the render budget"""
+        renderable_type = renderable.renderableType
+        version = self._versions.get(id, 0)
+        deferred = self._deferred.get(id)
+        if deferred is not None:
+            if deferred.width == self._content_width and deferred.version == version and not self.preview_mode:
+                # still rendering what is needed
+                return self._placeholder(renderable)
+            # rendered at another width or for an older version of the renderable, its strips are of no use
+            self._drop_deferred(id)
+
+        if _is_cheap(renderable_type):
+            return self._extract_lines(renderable) or []
+
+        if self.preview_mode:
+            plain = _plain_text(renderable_type)
+            if plain is not None:
+                self._previews.add(id)
+                return self._extract_lines(replace(renderable, renderableType=Text(plain))) or []
+        self._previews.discard(id)
+
+        if self._render_budget is None or getattr(renderable_type, "render_on_event_loop", False):
+            return self._extract_lines(renderable) or []
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=_RENDER_WORKERS, thread_name_prefix="feathers-render")
+        width = self._content_width
+        future = self._executor.submit(self._timed_render, renderable, width)
+        try:
+            lines, _ = future.result(timeout=self._render_budget)
+            return lines
+        except FutureTimeoutError:
+            self._deferred[id] = _DeferredRender(future, width, version)
+            self.deferred_renders += 1
+            future.add_done_callback(self._on_deferred_done)
+            return self._placeholder(renderable)
+
+    def _timed_render(self, renderable: RenderableWithOptions, width: int | None) -> tuple[list[Strip], float]:
+        """Render in a worker thread, timing the render itself rather than the wait for a free thread"""
+        started = perf_counter()
+        lines = self._extract_lines(renderable, width) or []
+        return lines, perf_counter() - started
+
+    def _drop_deferred(self, id: CacheId) -> None:
+        deferred = self._deferred.pop(id, None)
+        if deferred is not None:
+            deferred.future.cancel()
+
+    def _on_deferred_done(self, future: Future[tuple[list[Strip], float]]) -> None:
+        if self._listener is not None and not future.cancelled():
+            self._listener.on_deferred_render()
+
+    def _placeholder(self, renderable: RenderableWithOptions) -> list[Strip]:
+        width = renderable.width or self._content_width or self._console.width
+        plain = _plain_text(renderable.renderableType)
+        lines = plain.splitlines() if plain is not None else []
+        kind = type(renderable.renderableType).__name__
+
+        strips = [Strip([Segment(line)], cell_len(line)).crop(0, width) for line in lines[:_PLACEHOLDER_LINES]]
+        status = f"… rendering {kind}" if not lines else f"… rendering {kind} ({len(lines)} lines)"
+        strips.append(Strip([Segment(status, _PLACEHOLDER_STYLE)], cell_len(status)).crop(0, width))
+        return strips
+
+    def _restore(self, index: int) -> None:
+        """Render again the evicted renderable at line `index`"""
+        entry = self.entry_at(index)
+        if entry is None:
             return
-        for strip in strips:
-            self._cache.append((id, strip))
+        id, offset = entry
+        old_count = self._line_counts[id]
+        # the strips are rendered again as they were, so this is not a change unless the line count differs
+        count = self._store(id, index - offset, old_count, self._render_lines(id, self._all_renderables[id]), False)
+        self.rerenders += 1
+        if count != old_count and self._listener is not None:
+            self._listener.on_cache_update()
+
+    def _store(self, id: CacheId, start: int, old_count: int, strips: list[Strip], changed: bool = True) -> int:
+        """Put the strips of a renderable in place of its `old_count` lines at `start`, and return the line count"""
+        if len(strips) != old_count:
+            self._changed(start, None)
+        elif changed and strips:
+            self._changed(start, start + len(strips))
+        self._cache[start : start + old_count] = [(id, strip) for strip in strips]
+        self._line_counts[id] = len(strips)
+        self._line_index.set(self._positions[id], len(strips))
+        self._widths[id] = max((strip.cell_length for strip in strips), default=0)
+        self._stale.discard(id)
+
+        if self._byte_budget is not None:
+            size = sum(_strip_bytes(strip) for strip in strips)
+            self._bytes += size - self._entry_bytes.get(id, 0)
+            self._entry_bytes[id] = size
+            self._resident[id] = None
+            self._resident.move_to_end(id)
+
+        # while reflowing, the widest line is only known again once all the stale renderables are reflowed
+        self._virtual_size = Size(max(self._virtual_size.width, self._widths[id]), len(self._cache))
+        return len(strips)
+
+    def _evict(self) -> None:
+        """Drop the strips of least recently used renderables until the cache is within the byte budget"""
+        if self._byte_budget is None or self._bytes <= self._byte_budget:
+            return
+
+        target = self._byte_budget * _EVICT_TO
+        freed = 0
+        victims: set[CacheId] = set()
+        for id in self._resident:
+            if self._bytes - freed <= target:
+                break
+            if id not in self._protected:
+                victims.add(id)
+                freed += self._entry_bytes[id]
+        if not victims:
+            return
+
+        line = 0
+        for id, count in self._line_counts.items():
+            if id in victims:
+                self._cache[line : line + count] = [(id, None)] * count
+                self._resident.pop(id)
+                self._entry_bytes.pop(id)
+            line += count
+        self._bytes -= freed
+        self.evictions += len(victims)
 
     def _remove_from_cache(self, id: CacheId) -> None:
-        # By iterating over the list in reverse order, we can safely remove items without changing
-        # the indices of the remaining items in the list. This approach can be more memory-efficient
-        # than making a copy of the list to iterate over, especially for large lists, since we only need
-        # to keep track of the current index and don't need to create a copy of the list.
-        for i in range(len(self._cache) - 1, -1, -1):
-            if id in self._cache[i]:
-                self._cache.pop(i)
+        start = self.line_of(id)
+        count = self._line_counts.pop(id, 0)
+        position = self._positions.pop(id, None)
+        if position is not None:
+            self._line_index.set(position, 0)
+        self._widths.pop(id, None)
+        self._bytes -= self._entry_bytes.pop(id, 0)
+        self._resident.pop(id, None)
+        self._previews.discard(id)
+        if start is None or not count:
+            return
+        self._changed(start, None)
+        del self._cache[start : start + count]
         self._refresh_virtual_size()
 
     def _extract_lines(
         self,
         renderable: RenderableWithOptions,
+        content_width: int | None = None,
     ) -> list[Strip] | None:
         renderableType, width, expand, shrink, wrap = (
             renderable.renderableType,
@@ -154,7 +869,9 @@ class RenderablesCache:
             render_options = render_options.update(overflow="ignore", no_wrap=True)
 
         render_width = Measurement.get(self._console, render_options, renderableType).maximum
-        optimal_width = self._content_width if width is None else width
+        if content_width is None:
+            content_width = self._content_width
+        optimal_width = content_width if width is None else width
 
         if optimal_width:
             if expand and render_width < optimal_width:
@@ -167,18 +884,13 @@ class RenderablesCache:
         if not lines:
             return None
 
-        strips = Strip.from_lines(lines)
+        strips = [_IndexedStrip(line) if len(line) > _INDEXED_SEGMENTS else Strip(line) for line in lines]
         for strip in strips:
             strip.adjust_cell_length(render_width)
-
-        max_width = max(strip.cell_length for strip in strips)
-        new_width = max(self._virtual_size.width, max_width)
-        new_height = self._virtual_size.height + len(strips)
-        self._virtual_size = Size(new_width, new_height)
         return strips
 
     def _refresh_virtual_size(self):
-        max_width = max(strip[1].cell_length for strip in self._cache)
+        max_width = max(self._widths.values(), default=0)
         self._virtual_size = Size(max_width, len(self._cache))
 
     def __len__(self) -> int:
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from typing import ClassVar
+
+from rich.highlighter import Highlighter
+from rich.text import Span, Text
+from textual._cache import LRUCache
+
+
+class MemoizedHighlighter(Highlighter):
+    """Remembers the spans another highlighter adds to each distinct string, to add them again without its work.
+
+    Logs repeat a lot of lines, which then cost a dictionary lookup instead of running every regex again.
+
+    Attributes:
+        hits: Number of strings highlighted from memory
+        misses: Number of strings highlighted by the wrapped highlighter
+    """
+
+    def __init__(self, highlighter: Highlighter, *, maxsize: int = 4096, max_length: int = 4096) -> None:
+        """Create a MemoizedHighlighter.
+
+        Args:
+            highlighter: The highlighter doing the work.
+            maxsize: Maximum number of distinct strings remembered, least recently used are forgotten first.
+            max_length: Strings longer than this are highlighted without being remembered.
+        """
+        self.highlighter = highlighter
+        self.max_length = max_length
+        self.hits = 0
+        self.misses = 0
+        self._spans: LRUCache[str, list[Span]] = LRUCache(maxsize)
+
+    def highlight(self, text: Text) -> None:
+        plain = text.plain
+        if len(plain) > self.max_length:
+            self.highlighter.highlight(text)
+            return
+
+        spans = self._spans.get(plain)
+        if spans is not None:
+            self.hits += 1
+            text.spans.extend(spans)
+            return
+
+        self.misses += 1
+        first = len(text.spans)
+        self.highlighter.highlight(text)
+        self._spans[plain] = text.spans[first:]
+
+    def clear(self) -> None:
+        """Forget the remembered spans"""
+        self._spans.clear()
+
+
+class CombinedRegexHighlighter(Highlighter):
+    """Highlights with a single compiled regex, in one pass over the text.
+
+    The patterns are combined as named alternatives, and each match is styled with `base_style` followed by the name
+    of the pattern which matched. Where several patterns could match at the same position, the first one wins.
+    Patterns must not have named groups of their own.
+    """
+
+    patterns: ClassVar[Mapping[str, str]] = {
+        "uuid": r"\b[a-fA-F0-9]{8}-(?:[a-fA-F0-9]{4}-){3}[a-fA-F0-9]{12}\b",
+        "url": r"\b(?:file|https?|wss?)://[-0-9a-zA-Z$_+!`(),.?/;:&=%#~@]*",
+        "ipv4": r"\b[0-9]{1,3}(?:\.[0-9]{1,3}){3}\b",
+        "str": r"b?'[^'\n]*'|b?\"[^\"\n]*\"",
+        "bool_true": r"\bTrue\b",
+        "bool_false": r"\bFalse\b",
+        "none": r"\bNone\b",
+        "number": r"(?<![\w.])-?[0-9]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?\b",
+    }
+    """Style names (without `base_style`) and their patterns. The default is a fast subset of `ReprHighlighter`."""
+    base_style: ClassVar[str] = "repr."
+
+    def __init__(self, patterns: Mapping[str, str] | None = None, *, base_style: str | None = None) -> None:
+        """Create a CombinedRegexHighlighter.
+
+        Args:
+            patterns: Style names (without `base_style`) and their patterns, or `None` for the class patterns.
+            base_style: Prefix of the style names, or `None` for the class base style.
+        """
+        patterns = self.patterns if patterns is None else patterns
+        self._base_style = self.base_style if base_style is None else base_style
+        self._regex = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns.items()))
+
+    def highlight(self, text: Text) -> None:
+        base_style = self._base_style
+        append = text.spans.append
+        for match in self._regex.finditer(text.plain):
+            start, end = match.span()
+            if start < end:
+                append(Span(start, end, f"{base_style}{match.lastgroup}"))
+
+
+class LogLevelHighlighter(CombinedRegexHighlighter):
+    """Highlights log levels only, like ERROR or warning, with the logging level styles."""
+
+    patterns = {
+        "critical": r"\b(?:CRITICAL|FATAL|critical|fatal)\b",
+        "error": r"\b(?:ERROR|error)\b",
+        "warning": r"\b(?:WARN|WARNING|warn|warning)\b",
+        "info": r"\b(?:INFO|info)\b",
+        "debug": r"\b(?:DEBUG|TRACE|debug|trace)\b",
+    }
+    base_style = "logging.level."
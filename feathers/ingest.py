@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable, Sequence
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal
+
+from rich.console import RenderableType
+from textual.timer import Timer
+
+from feathers.utils import friendly_list
+
+if TYPE_CHECKING:
+    from feathers.widgets import CachedView
+
+OverflowPolicy = Literal["block", "drop-oldest", "drop-newest"]
+"""The names of the valid overflow policies.
+
+These are the policies that can be used with an [`IngestChannel`][feathers.ingest.IngestChannel].
+"""
+
+_VALID_OVERFLOW_POLICIES = {"block", "drop-oldest", "drop-newest"}
+
+DEFAULT_BATCH_BUDGET = 0.008
+"""Seconds spent writing a batch to a view by default, half of a frame at 60 fps."""
+
+# cost of an entry assumed before any batch is measured, about what a short line costs to add to a CachedView
+_INITIAL_ENTRY_COST = 150e-6
+
+
+class InvalidOverflowPolicy(Exception):
+    """Exception raised if an invalid overflow policy is used."""
+
+
+class BatchSizer:
+    """Sizes the batches written to a view so that writing one takes about `budget` seconds.
+
+    The cost of an entry is measured on every batch written, so the batches follow what the entries actually cost
+    to add to the view. A batch is at most twice as large as the one before, so entries which get more expensive
+    all at once can not stall a frame for long.
+    """
+
+    def __init__(self) -> None:
+        self._entry_cost = _INITIAL_ENTRY_COST
+        self._last_size = 0
+
+    def size(self, budget: float | None, max_batch: int | None) -> int | None:
+        """Number of entries to write in the next batch, or `None` for all of them.
+
+        Args:
+            budget: Seconds to spend writing the batch, or `None` for no time limit.
+            max_batch: Maximum number of entries in the batch, or `None` for no limit.
+        """
+        if budget is None:
+            return max_batch
+        size = max(1, int(budget / self._entry_cost))
+        if self._last_size:
+            size = min(size, 2 * self._last_size)
+        return size if max_batch is None else min(size, max_batch)
+
+    def write(
+        self,
+        view: CachedView,
+        contents: Sequence[RenderableType | object],
+        *,
+        ids: Iterable[str | None] | None = None,
+        timestamps: Iterable[float | None] | None = None,
+    ) -> None:
+        """Write a batch to `view` with `CachedView.add_entries`, measuring what each entry costs."""
+        if not contents:
+            return
+        start = perf_counter()
+        view.add_entries(contents, ids=ids, timestamps=timestamps)
+        # averaged with the previous cost, so a single slow batch does not shrink the next ones to nothing
+        self._entry_cost = (self._entry_cost + (perf_counter() - start) / len(contents)) / 2
+        self._last_size = len(contents)
+
+
+class IngestChannel:
+    """A thread-safe channel to write entries to a `CachedView`.
+
+    Any thread can put entries in the channel. The entries are written to the attached view in batches, on the
+    event loop, each one sized to take about `budget` seconds so that a flood of entries does not freeze the UI.
+    When the channel is full, the overflow policy decides what happens:
+
+    - `block`: `put` waits until there is space, or until its timeout expires. Never use it from the event loop.
+    - `drop-oldest`: the oldest waiting entry is dropped to make space.
+    - `drop-newest`: the entry being put is dropped.
+
+    Attributes:
+        pushed: Number of entries accepted by the channel
+        dropped: Number of entries dropped because the channel was full
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 10_000,
+        policy: OverflowPolicy = "drop-oldest",
+        max_batch: int | None = None,
+        budget: float | None = DEFAULT_BATCH_BUDGET,
+    ) -> None:
+        """Create an IngestChannel.
+
+        Args:
+            maxsize: Maximum number of entries waiting in the channel.
+            policy: What to do when the channel is full. Defaults to "drop-oldest"
+            max_batch: Maximum number of entries written to the view per batch, or `None` for no limit.
+            budget: Seconds spent writing a batch, or `None` to write up to `max_batch` entries whatever they cost.
+        """
+        if policy not in _VALID_OVERFLOW_POLICIES:
+            raise InvalidOverflowPolicy(f"Valid overflow policies are {friendly_list(_VALID_OVERFLOW_POLICIES)}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.max_batch = max_batch
+        self.budget = budget
+        self.pushed = 0
+        self.dropped = 0
+
+        self._entries: deque[tuple[RenderableType | object, str | None]] = deque()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+        self._view: CachedView | None = None
+        self._timer: Timer | None = None
+        self._batches = BatchSizer()
+
+    def put(self, content: RenderableType | object, id: str | None = None, *, timeout: float | None = None) -> bool:
+        """Put an entry in the channel. Safe to call from any thread.
+
+        Args:
+            content: Rich renderable (or text).
+            id: The renderable id, see `CachedView.add_entry`.
+            timeout: Seconds to wait for space with the "block" policy, or `None` to wait forever.
+
+        Returns:
+            True if the entry was accepted.
+        """
+        with self._lock:
+            return self._put(content, id, timeout)
+
+    def put_many(self, contents: Iterable[RenderableType | object], *, timeout: float | None = None) -> int:
+        """Put many entries in the channel, taking the lock once. Safe to call from any thread.
+
+        Args:
+            contents: Rich renderables (or texts).
+            timeout: Seconds to wait for space for each entry with the "block" policy, or `None` to wait forever.
+
+        Returns:
+            The number of entries accepted.
+        """
+        with self._lock:
+            return sum(self._put(content, None, timeout) for content in contents)
+
+    def _put(self, content: RenderableType | object, id: str | None, timeout: float | None) -> bool:
+        if self._closed:
+            return False
+        if len(self._entries) >= self.maxsize:
+            if self.policy == "drop-newest":
+                self.dropped += 1
+                return False
+            if self.policy == "drop-oldest":
+                self._entries.popleft()
+                self.dropped += 1
+            elif not self._not_full.wait_for(lambda: len(self._entries) < self.maxsize or self._closed, timeout):
+                self.dropped += 1
+                return False
+            if self._closed:
+                return False
+        self._entries.append((content, id))
+        self.pushed += 1
+        return True
+
+    def drain(self, max_items: int | None = None) -> list[tuple[RenderableType | object, str | None]]:
+        """Take waiting entries out of the channel, oldest first.
+
+        Args:
+            max_items: Maximum number of entries to take, or `None` to take all.
+
+        Returns:
+            A list of (content, id) tuples.
+        """
+        with self._lock:
+            if max_items is None or max_items >= len(self._entries):
+                entries = list(self._entries)
+                self._entries.clear()
+            else:
+                popleft = self._entries.popleft
+                entries = [popleft() for _ in range(max_items)]
+            if entries:
+                self._not_full.notify_all()
+        return entries
+
+    def attach(self, view: CachedView, interval: float = 1 / 60) -> None:
+        """Write the entries to `view` every `interval` seconds. Must be called from the event loop."""
+        self.detach()
+        self._view = view
+        self._timer = view.set_interval(interval, self.flush)
+
+    def detach(self) -> None:
+        """Stop writing entries to the attached view. Waiting entries stay in the channel."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = None
+        self._view = None
+
+    def flush(self) -> None:
+        """Write a batch of waiting entries to the attached view. Must be called from the event loop."""
+        if self._view is None:
+            return
+        entries = self.drain(self._batches.size(self.budget, self.max_batch))
+        if entries:
+            contents, ids = zip(*entries)
+            self._batches.write(self._view, contents, ids=ids)
+
+    def close(self) -> None:
+        """Detach the channel and reject any new entry. Threads blocked in `put` are released."""
+        self.detach()
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from rich.text import Text
+
+from feathers.ingest import DEFAULT_BATCH_BUDGET, IngestChannel
+
+if TYPE_CHECKING:
+    from feathers.widgets import CachedView
+
+# attributes every log record has, anything else was passed in `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class CachedViewHandler(logging.Handler):
+    """A logging handler which shows records in a `CachedView`.
+
+    Records can be logged from any thread. They are formatted as they are emitted, put in an `IngestChannel` and
+    written to the view in batches, once per frame, each one sized to take about `budget` seconds so that a flood of
+    records does not freeze the UI. When more than `maxsize` records are waiting, the oldest are dropped and
+    counted in `dropped`.
+
+    Without a formatter, records are shown as "time level logger: message", followed by the structured `fields`
+    found on the record. With a formatter, its output is shown as is.
+    """
+
+    def __init__(
+        self,
+        view: CachedView | None = None,
+        level: int | str = logging.NOTSET,
+        *,
+        fields: Iterable[str] | None = (),
+        maxsize: int = 10_000,
+        max_batch: int | None = None,
+        budget: float | None = DEFAULT_BATCH_BUDGET,
+        interval: float = 1 / 60,
+    ) -> None:
+        """Create a CachedViewHandler.
+
+        Args:
+            view: The view to show the records in, or `None` to attach one later with `attach`.
+            level: The minimum level of the records shown.
+            fields: Names of the record attributes (passed with `extra`) shown after the message, or `None` to show
+            all of them.
+            maxsize: Maximum number of records waiting to be shown.
+            max_batch: Maximum number of records shown per batch, or `None` for no limit.
+            budget: Seconds spent showing a batch, or `None` to show up to `max_batch` records whatever they cost.
+            interval: Seconds between batches. Defaults to one frame at 60 fps.
+        """
+        super().__init__(level)
+        self.fields = None if fields is None else tuple(fields)
+        self.channel = IngestChannel(maxsize=maxsize, policy="drop-oldest", max_batch=max_batch, budget=budget)
+        self._interval = interval
+        self._second = -1
+        self._time = ""
+        if view is not None:
+            self.attach(view)
+
+    @property
+    def dropped(self) -> int:
+        """Number of records dropped because too many were waiting"""
+        return self.channel.dropped
+
+    def attach(self, view: CachedView) -> None:
+        """Show the records in `view`. Must be called from the event loop."""
+        self.channel.attach(view, self._interval)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.channel.put(self._render(record))
+        except Exception:
+            self.handleError(record)
+
+    def _render(self, record: logging.LogRecord) -> Text:
+        if self.formatter is not None:
+            return Text(self.format(record))
+
+        text = Text(self._format_time(record.created), style="log.time")
+        text.append(" ")
+        text.append(record.levelname, style=f"logging.level.{record.levelname.lower()}")
+        text.append(f" {record.name}: ")
+        text.append(record.getMessage())
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        if record.exc_text:
+            text.append(f"\n{record.exc_text}", style="logging.level.error")
+
+        names = self.fields
+        if names is None:
+            names = tuple(name for name in vars(record) if name not in _RECORD_ATTRIBUTES)
+        for name in names:
+            if hasattr(record, name):
+                text.append(f" {name}=", style="repr.attrib_name")
+                text.append(str(getattr(record, name)), style="repr.attrib_value")
+        return text
+
+    def _format_time(self, created: float) -> str:
+        # records come in bursts, most of them within the same second as the previous one
+        second = int(created)
+        if second != self._second:
+            self._second = second
+            self._time = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._time
+
+    def close(self) -> None:
+        self.channel.close()
+        super().close()
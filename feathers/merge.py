@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import AsyncIterable
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING, cast
+
+from rich.console import Group, RenderableType
+from rich.protocol import is_renderable
+from rich.style import Style
+from rich.text import Text
+from textual.timer import Timer
+
+from feathers.ingest import DEFAULT_BATCH_BUDGET, BatchSizer
+from feathers.renderables import LazyPretty
+
+if TYPE_CHECKING:
+    from feathers.widgets import CachedView
+
+
+class _Source:
+    def __init__(self, name: str, tag: Text | None) -> None:
+        self.name = name
+        self.tag = tag
+        # heap of (timestamp, sequence, arrival time, content) waiting to be written
+        self.records: list[tuple[float, int, float, RenderableType | object]] = []
+        self.paused = False
+        self.finished = False
+        self.task: asyncio.Task[None] | None = None
+        self.can_read = asyncio.Event()
+        self.can_read.set()
+
+
+class StreamMerger:
+    """Merges live streams of `(timestamp, renderable)` records into a `CachedView`, in timestamp order.
+
+    Each source is read in its own task. The oldest waiting record of every source is kept in a heap, so picking the
+    next record costs O(log N) for N sources. A record is written once every running source has a record waiting,
+    which proves nothing older can come, or once it has waited `reorder_window` seconds, which lets records which
+    are a little late from one source still be shown in order. Records are written in batches, once per frame, each
+    one sized to take about `budget` seconds.
+
+    Attributes:
+        merged: Number of records written to the view
+        late: Number of records written after a record with a later timestamp
+    """
+
+    def __init__(
+        self,
+        view: CachedView,
+        *,
+        reorder_window: float = 0.5,
+        max_pending: int = 1_000,
+        max_batch: int | None = None,
+        budget: float | None = DEFAULT_BATCH_BUDGET,
+        interval: float = 1 / 60,
+    ) -> None:
+        """Create a StreamMerger. Must be called from the event loop.
+
+        Args:
+            view: The view to write to.
+            reorder_window: Seconds a record waits for older records from sources which have nothing waiting.
+            max_pending: Number of records waiting per source above which reading the source stops.
+            max_batch: Maximum number of records written per batch, or `None` for no limit.
+            budget: Seconds spent writing a batch, or `None` to write up to `max_batch` records whatever they cost.
+            interval: Seconds between batches. Defaults to one frame at 60 fps.
+        """
+        self.reorder_window = reorder_window
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.budget = budget
+        self.merged = 0
+        self.late = 0
+
+        self._view = view
+        self._interval = interval
+        self._sources: dict[str, _Source] = {}
+        # (timestamp, sequence, source name) of the oldest record of each source, entries go stale as records go
+        self._heads: list[tuple[float, int, str]] = []
+        # running sources with nothing waiting
+        self._starving: set[str] = set()
+        self._sequence = count()
+        self._last_timestamp = float("-inf")
+        self._timer: Timer | None = None
+        self._batches = BatchSizer()
+
+    def add_source(
+        self,
+        name: str,
+        source: AsyncIterable[tuple[float, RenderableType | object]],
+        *,
+        color: str | None = None,
+    ) -> None:
+        """Start reading a source. Its records must come mostly in timestamp order.
+
+        Args:
+            name: A unique name for the source, used to pause or resume it.
+            source: The records, as (timestamp, content) tuples.
+            color: Show the name of the source in this color before each of its records, or `None` to not show it.
+        """
+        if name in self._sources:
+            raise ValueError(f"There is already a source named {name!r}")
+        tag = None if color is None else Text(f"{name} ", style=Style(color=color, bold=True), end="")
+        merged_source = self._sources[name] = _Source(name, tag)
+        self._starving.add(name)
+        merged_source.task = asyncio.create_task(self._read(merged_source, source))
+        if self._timer is None:
+            self._timer = self._view.set_interval(self._interval, self.flush)
+
+    def pause(self, name: str) -> None:
+        """Stop reading and showing the records of a source, other sources are merged without it"""
+        source = self._sources[name]
+        source.paused = True
+        source.can_read.clear()
+        self._starving.discard(name)
+
+    def resume(self, name: str) -> None:
+        """Read and show the records of a paused source again"""
+        source = self._sources[name]
+        if not source.paused:
+            return
+        source.paused = False
+        self._update_can_read(source)
+        if source.records:
+            self._push_head(source)
+        elif not source.finished:
+            self._starving.add(name)
+
+    async def wait(self) -> None:
+        """Wait until every source is read to the end. The last records are written on the next batch."""
+        await asyncio.gather(*(source.task for source in self._sources.values() if source.task is not None))
+
+    def close(self) -> None:
+        """Stop reading all the sources and writing to the view"""
+        for source in self._sources.values():
+            if source.task is not None:
+                source.task.cancel()
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    async def _read(self, source: _Source, records: AsyncIterable[tuple[float, RenderableType | object]]) -> None:
+        try:
+            async for timestamp, content in records:
+                record = (timestamp, next(self._sequence), monotonic(), content)
+                heapq.heappush(source.records, record)
+                if source.records[0] is record and not source.paused:
+                    self._starving.discard(source.name)
+                    self._push_head(source)
+                self._update_can_read(source)
+                await source.can_read.wait()
+        finally:
+            source.finished = True
+            self._starving.discard(source.name)
+
+    def _update_can_read(self, source: _Source) -> None:
+        if source.paused or len(source.records) >= self.max_pending:
+            source.can_read.clear()
+        else:
+            source.can_read.set()
+
+    def _push_head(self, source: _Source) -> None:
+        timestamp, sequence, _, _ = source.records[0]
+        heapq.heappush(self._heads, (timestamp, sequence, source.name))
+
+    def flush(self) -> None:
+        """Write the records which are ready to the view, in timestamp order. Must be called from the event loop."""
+        now = monotonic()
+        heads = self._heads
+        contents: list[RenderableType | object] = []
+        timestamps: list[float] = []
+        size = self._batches.size(self.budget, self.max_batch)
+        while heads and (size is None or len(contents) < size):
+            _, sequence, name = heads[0]
+            source = self._sources[name]
+            if source.paused or not source.records or source.records[0][1] != sequence:
+                # the source was paused or got an older record since
+                heapq.heappop(heads)
+                continue
+            timestamp, _, arrived, content = source.records[0]
+            if self._starving and now - arrived < self.reorder_window:
+                break
+
+            heapq.heappop(heads)
+            heapq.heappop(source.records)
+            if source.records:
+                self._push_head(source)
+            elif not source.finished:
+                self._starving.add(name)
+            self._update_can_read(source)
+
+            if timestamp < self._last_timestamp:
+                self.late += 1
+            self._last_timestamp = max(self._last_timestamp, timestamp)
+            contents.append(self._tagged(source, content))
+            timestamps.append(timestamp)
+
+        self.merged += len(contents)
+        self._batches.write(self._view, contents, timestamps=timestamps)
+
+    def _tagged(self, source: _Source, content: RenderableType | object) -> RenderableType | object:
+        if source.tag is None:
+            return content
+        if isinstance(content, str):
+            content = Text(content)
+        if isinstance(content, Text):
+            return Text.assemble(source.tag, content)
+        if not is_renderable(content):
+            content = LazyPretty(content)
+        return Group(source.tag, cast(RenderableType, content))
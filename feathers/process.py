@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import os
+from collections import deque
+from typing import TYPE_CHECKING
+
+from rich.style import StyleType
+from rich.text import Text
+from textual.timer import Timer
+
+from feathers.ingest import DEFAULT_BATCH_BUDGET, BatchSizer
+
+if TYPE_CHECKING:
+    from feathers.widgets import CachedView
+
+
+class ProcessStream:
+    """Streams the output of a subprocess into a `CachedView`, one entry per line.
+
+    stdout and stderr are read in large chunks and split into lines as they come. The lines are written to the view
+    in batches, once per frame, each one sized to take about `budget` seconds. When more than `max_pending` lines
+    are waiting to be written, reading stops until the view catches up, which in turn blocks the process once its
+    pipe buffer is full.
+
+    Attributes:
+        lines: Number of lines read
+        read_pauses: Number of times reading stopped to let the view catch up
+    """
+
+    def __init__(
+        self,
+        view: CachedView,
+        *,
+        chunk_size: int = 64 * 1024,
+        max_pending: int = 10_000,
+        max_batch: int | None = None,
+        budget: float | None = DEFAULT_BATCH_BUDGET,
+        encoding: str = "utf-8",
+        stdout_style: StyleType = "",
+        stderr_style: StyleType = "red",
+    ) -> None:
+        """Create a ProcessStream. Use `CachedView.attach_process` to create and start one.
+
+        Args:
+            view: The view to write to.
+            chunk_size: Maximum bytes read at once from each pipe.
+            max_pending: Number of lines waiting to be written above which reading stops.
+            max_batch: Maximum number of lines written per frame, or `None` for no limit.
+            budget: Seconds spent writing a batch, or `None` to write up to `max_batch` lines whatever they cost.
+            encoding: The encoding of the output. Bytes which can not be decoded are replaced.
+            stdout_style: Style of the lines from stdout.
+            stderr_style: Style of the lines from stderr.
+        """
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.budget = budget
+        self.encoding = encoding
+        self.stdout_style = stdout_style
+        self.stderr_style = stderr_style
+        self.lines = 0
+        self.read_pauses = 0
+
+        self._view = view
+        self._pending: deque[Text] = deque()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._process: asyncio.subprocess.Process | None = None
+        self._readers: list[asyncio.Task[None]] = []
+        self._timer: Timer | None = None
+        self._batches = BatchSizer()
+
+    @property
+    def returncode(self) -> int | None:
+        """The exit code of the process, or `None` while it runs"""
+        return None if self._process is None else self._process.returncode
+
+    @property
+    def is_reading(self) -> bool:
+        return any(not reader.done() for reader in self._readers)
+
+    async def start(
+        self,
+        program: str | os.PathLike[str],
+        *args: str | os.PathLike[str],
+        cwd: str | os.PathLike[str] | None = None,
+        env: dict[str, str] | None = None,
+        interval: float = 1 / 60,
+    ) -> None:
+        """Start the process and stream its output. Must be called from the event loop.
+
+        Args:
+            program: The program to run.
+            *args: The arguments of the program.
+            cwd: The working directory of the process.
+            env: The environment of the process, or `None` to inherit it.
+            interval: Seconds between batches. Defaults to one frame at 60 fps.
+        """
+        self._process = process = await asyncio.create_subprocess_exec(
+            program,
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        self._readers = [
+            asyncio.create_task(self._read(process.stdout, self.stdout_style)),
+            asyncio.create_task(self._read(process.stderr, self.stderr_style)),
+        ]
+        self._timer = self._view.set_interval(interval, self.flush)
+
+    async def _read(self, stream: asyncio.StreamReader, style: StyleType) -> None:
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        partial = ""
+        while True:
+            if len(self._pending) >= self.max_pending:
+                self.read_pauses += 1
+                self._has_space.clear()
+                await self._has_space.wait()
+                continue
+
+            chunk = await stream.read(self.chunk_size)
+            lines = (partial + decoder.decode(chunk, final=not chunk)).split("\n")
+            partial = lines.pop()
+            if not chunk and partial:
+                lines.append(partial)
+            self._pending.extend(Text(line.rstrip("\r"), style=style) for line in lines)
+            self.lines += len(lines)
+            if not chunk:
+                return
+
+    def flush(self) -> None:
+        """Write a batch of waiting lines to the view. Must be called from the event loop."""
+        pending = self._pending
+        size = self._batches.size(self.budget, self.max_batch)
+        if size is None or size >= len(pending):
+            batch = list(pending)
+            pending.clear()
+        else:
+            batch = [pending.popleft() for _ in range(size)]
+        self._batches.write(self._view, batch)
+        if len(pending) < self.max_pending:
+            self._has_space.set()
+
+        if not pending and not self.is_reading and self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    async def wait(self) -> int:
+        """Wait for the process to exit and all of its output to be read.
+
+        Returns:
+            The exit code of the process.
+        """
+        assert self._process is not None, "the process is not started"
+        await asyncio.gather(*self._readers)
+        return await self._process.wait()
+
+    def terminate(self) -> None:
+        """Ask the process to stop. Output written before it exits is still shown."""
+        if self._process is not None and self._process.returncode is None:
+            self._process.terminate()
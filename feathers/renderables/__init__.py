@@ -1,3 +1,5 @@
 from ._divider import DividerWithLabel
+from ._lazy_pretty import LazyPretty
+from ._sparkline import Sparkline, SummaryType
 
-__all__ = ["DividerWithLabel"]
+__all__ = ["DividerWithLabel", "LazyPretty", "Sparkline", "SummaryType"]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import reprlib
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields, is_dataclass
+from itertools import islice
+from typing import Any
+
+from rich.cells import cell_len
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.highlighter import ReprHighlighter
+from rich.measure import Measurement
+from rich.style import Style
+from rich.text import Text
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+_SUMMARY_STYLE = Style(dim=True)
+_highlighter = ReprHighlighter()
+
+
+class _BoundedRepr(reprlib.Repr):
+    """A `reprlib.Repr` which also bounds the repr of subclasses of the builtin containers, dataclasses and named
+    tuples.
+
+    `reprlib.Repr` finds how to shorten a value by the name of its type, any other type gets its full builtin repr
+    built and then truncated. The repr of other objects is still built in full, it can not be shortened from outside.
+    """
+
+    def repr1(self, x: Any, level: int) -> str:
+        if is_dataclass(x) and not isinstance(x, type) and type(x).__dataclass_params__.repr:  # type: ignore
+            return self._repr_fields(x, [field.name for field in fields(x) if field.repr], level)
+        if isinstance(x, tuple) and hasattr(x, "_fields"):
+            return self._repr_fields(x, list(x._fields), level)
+        for base in _CONTAINERS:
+            if isinstance(x, base) and type(x) is not base:
+                inner = getattr(self, f"repr_{base.__name__}")(x, level)
+                return f"{type(x).__name__}({inner})"
+        return super().repr1(x, level)
+
+    def _repr_fields(self, x: Any, names: list[str], level: int) -> str:
+        name = type(x).__name__
+        if level <= 0:
+            return f"{name}(...)"
+        shown = [f"{field}={self.repr1(getattr(x, field), level - 1)}" for field in names[: self.maxlist]]
+        if len(names) > self.maxlist:
+            shown.append("...")
+        return f"{name}({', '.join(shown)})"
+
+
+@dataclass(frozen=True)
+class _Row:
+    depth: int
+    path: tuple[int, ...]
+    label: str
+    summary: str
+    expanded: bool | None = None
+    more: bool = False
+
+
+class LazyPretty:
+    """A bounded, expandable view of a Python object, for objects too big to pretty print.
+
+    Dicts, lists, tuples and sets are shown as a tree, one row per item. Only the first `max_length` items of a
+    container are shown, containers deeper than `max_depth` are collapsed and the other values are shown with a repr
+    of at most `max_string` characters. Only the rows shown are ever worked out, so the cost does not depend on the
+    size of the object. `activate` expands or collapses a container, or shows more of its items.
+    """
+
+    def __init__(self, obj: Any, *, max_depth: int = 1, max_length: int = 20, max_string: int = 80) -> None:
+        """Create a LazyPretty renderable.
+
+        Args:
+            obj: The object to show.
+            max_depth: Number of levels of containers expanded up front. Defaults to 1
+            max_length: Number of items of a container shown at once. Defaults to 20
+            max_string: Maximum length of the repr of a value. Defaults to 80
+        """
+        self.obj = obj
+        self.max_depth = max_depth
+        self.max_length = max_length
+        self.max_string = max_string
+
+        self._repr = _BoundedRepr()
+        self._repr.maxstring = self._repr.maxother = max_string
+        self._repr.maxlevel = 1
+        # number of items shown by expanded containers, 0 if collapsed on demand
+        self._shown: dict[tuple[int, ...], int] = {}
+        self._rows: list[_Row] | None = None
+
+    @property
+    def plain(self) -> str:
+        return "\n".join(self._row_text(row).plain for row in self._visible_rows)
+
+    @property
+    def _visible_rows(self) -> list[_Row]:
+        if self._rows is None:
+            self._rows = list(self._node_rows(self.obj, (), 0, ""))
+        return self._rows
+
+    def activate(self, line: int) -> bool:
+        """Expand or collapse the container at row `line`, or show more items if it is a "more" row.
+
+        Returns:
+            True if the rows changed.
+        """
+        if not 0 <= line < len(self._visible_rows):
+            return False
+        row = self._visible_rows[line]
+        if row.more:
+            self._shown[row.path] = self._shown_count(row.path) + self.max_length
+        elif row.expanded is not None:
+            self._shown[row.path] = 0 if row.expanded else self.max_length
+        else:
+            return False
+        self._rows = None
+        return True
+
+    def _shown_count(self, path: tuple[int, ...]) -> int:
+        shown = self._shown.get(path)
+        if shown is None:
+            return self.max_length if len(path) < self.max_depth else 0
+        return shown
+
+    def _node_rows(self, obj: Any, path: tuple[int, ...], depth: int, label: str) -> Iterator[_Row]:
+        if not isinstance(obj, _CONTAINERS):
+            yield _Row(depth, path, label, self._repr.repr(obj))
+            return
+
+        size = len(obj)
+        shown = min(self._shown_count(path), size)
+        noun = "item" if size == 1 else "items"
+        yield _Row(depth, path, label, f"{type(obj).__name__} ({size} {noun})", expanded=shown > 0)
+        if not shown:
+            return
+
+        items: Iterator[tuple[str, Any]]
+        if isinstance(obj, Mapping):
+            items = ((f"{self._repr.repr(key)}: ", value) for key, value in obj.items())
+        else:
+            items = (("", value) for value in obj)
+        for index, (child_label, child) in enumerate(islice(items, shown)):
+            yield from self._node_rows(child, (*path, index), depth + 1, child_label)
+        if size > shown:
+            yield _Row(depth + 1, path, "", f"… {size - shown} more", more=True)
+
+    def _row_text(self, row: _Row) -> Text:
+        marker = "" if row.expanded is None else ("▼ " if row.expanded else "▶ ")
+        text = Text("  " * row.depth + marker, no_wrap=True, overflow="ellipsis")
+        text.append(_highlighter(row.label))
+        if row.expanded is not None or row.more:
+            text.append(row.summary, _SUMMARY_STYLE)
+        else:
+            text.append(_highlighter(row.summary))
+        return text
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        for row in self._visible_rows:
+            yield self._row_text(row)
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        width = max(
+            (2 * row.depth + 2 + cell_len(row.label) + cell_len(row.summary) for row in self._visible_rows), default=0
+        )
+        return Measurement(width, width).with_maximum(options.max_width)
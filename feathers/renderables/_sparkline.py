@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from itertools import islice
+from typing import Literal
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import StyleType
+
+from feathers.utils import numpy as _numpy
+
+SummaryType = Literal["min", "max", "mean"]
+"""The names of the values a [`Sparkline`][feathers.renderables.Sparkline] can draw for each bucket."""
+
+_BARS = " ▁▂▃▄▅▆▇█"
+_SUMMARY_INDEX = {"min": 0, "max": 1, "mean": 2}
+
+
+class Sparkline:
+    """A one line chart of the latest values of a metric, such as throughput or latency.
+
+    The values are kept in a ring buffer of `capacity` floats. To draw it, the values are split in one bucket per
+    cell, and each bucket is drawn by its min, max or mean. The buckets are updated as values are added, so adding a
+    value only costs a few comparisons, and `append` tells when a bucket completes: that is the only time the chart
+    changes, so the only time it needs to be rendered again. The buckets are rebuilt from the ring buffer when the
+    width changes, with NumPy if it is installed.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        *,
+        width: int | None = None,
+        summary: SummaryType = "mean",
+        style: StyleType = "",
+        min_value: float | None = None,
+        max_value: float | None = None,
+    ) -> None:
+        """Create a Sparkline renderable.
+
+        Args:
+            capacity: Number of values kept. Defaults to 100_000
+            width: The width of the chart. Defaults to console_options.max_width
+            summary: The value drawn for each bucket. Defaults to "mean"
+            style: Style of the chart.
+            min_value: The value at the bottom of the chart. Defaults to the lowest value drawn
+            max_value: The value at the top of the chart. Defaults to the highest value drawn
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.width = width
+        self.summary = summary
+        self.style = style
+        self.min_value = min_value
+        self.max_value = max_value
+
+        self._values = array("d", bytes(8 * capacity))
+        self._total = 0
+        # completed buckets, as (min, max, mean)
+        self._buckets: deque[tuple[float, float, float]] = deque()
+        self._bucket_width = 0
+        self._bucket_size = 0
+        self._low = math.inf
+        self._high = -math.inf
+        self._sum = 0.0
+        self._count = 0
+        self._version = 0
+        self._rendered: tuple[tuple[object, ...], list[Segment]] | None = None
+        if width is not None:
+            self._rebuild(width)
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    @property
+    def version(self) -> int:
+        """Changes each time the chart changes"""
+        return self._version
+
+    def append(self, value: float) -> bool:
+        """Add a value, dropping the oldest one if there are `capacity` values.
+
+        Returns:
+            True if the chart changed and should be rendered again.
+        """
+        self._values[self._total % self.capacity] = value
+        self._total += 1
+        if not self._bucket_size:
+            return False
+        if value < self._low:
+            self._low = value
+        if value > self._high:
+            self._high = value
+        self._sum += value
+        self._count += 1
+        if self._total % self._bucket_size:
+            return False
+        self._buckets.append((self._low, self._high, self._sum / self._count))
+        self._low = math.inf
+        self._high = -math.inf
+        self._sum = 0.0
+        self._count = 0
+        self._version += 1
+        return True
+
+    def extend(self, values: Iterable[float]) -> bool:
+        """Add values, dropping the oldest ones past `capacity`.
+
+        Returns:
+            True if the chart changed and should be rendered again.
+        """
+        changed = False
+        for value in values:
+            changed = self.append(value) or changed
+        return changed
+
+    def _ordered(self) -> array[float]:
+        """The values kept, oldest first"""
+        if self._total <= self.capacity:
+            return self._values[: self._total]
+        start = self._total % self.capacity
+        return self._values[start:] + self._values[:start]
+
+    def _first_bucket(self, size: int) -> int:
+        """Where the oldest bucket with all of its values still kept starts"""
+        first = max(0, self._total - self.capacity)
+        return -(-first // size) * size
+
+    def _rebuild(self, width: int) -> None:
+        """Split the values kept in buckets for a chart `width` cells wide"""
+        size = max(1, math.ceil(self.capacity / width))
+        values = self._ordered()
+        first = self._total - len(values)
+        completed = self._total - self._total % size
+        # buckets are aligned on the number of values added, so they do not move as values are added
+        offsets = [
+            start - first for start in range(max(self._first_bucket(size), completed - width * size), completed, size)
+        ]
+
+        buckets: Iterable[tuple[float, float, float]]
+        if _numpy is not None and offsets:
+            samples = _numpy.frombuffer(values, dtype=_numpy.float64)[: completed - first]
+            buckets = zip(
+                _numpy.minimum.reduceat(samples, offsets).tolist(),
+                _numpy.maximum.reduceat(samples, offsets).tolist(),
+                (_numpy.add.reduceat(samples, offsets) / size).tolist(),
+            )
+        else:
+            buckets = (
+                (
+                    min(values[start : start + size]),
+                    max(values[start : start + size]),
+                    sum(values[start : start + size]) / size,
+                )
+                for start in offsets
+            )
+        self._buckets = deque(buckets, maxlen=width)
+
+        partial = values[completed - first :]
+        self._low = min(partial, default=math.inf)
+        self._high = max(partial, default=-math.inf)
+        self._sum = sum(partial)
+        self._count = len(partial)
+        self._bucket_width = width
+        self._bucket_size = size
+        self._version += 1
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        width = self.width or options.max_width
+        if width != self._bucket_width:
+            self._rebuild(width)
+        key = (width, self._version, self.summary, self.style, self.min_value, self.max_value)
+        if self._rendered is None or self._rendered[0] != key:
+            self._rendered = (key, self._render(console, width))
+        yield from self._rendered[1]
+
+    def _render(self, console: Console, width: int) -> list[Segment]:
+        index = _SUMMARY_INDEX[self.summary]
+        size = self._bucket_size
+        # buckets which lost some of their values to the ring buffer are not drawn
+        shown = max(0, (self._total - self._total % size - self._first_bucket(size)) // size)
+        points = [bucket[index] for bucket in islice(self._buckets, max(0, len(self._buckets) - shown), None)]
+        low = self.min_value if self.min_value is not None else min(points, default=0.0)
+        high = self.max_value if self.max_value is not None else max(points, default=0.0)
+        scale = (len(_BARS) - 2) / (high - low) if high > low else 0.0
+        top = len(_BARS) - 1
+        bars = "".join(
+            _BARS[min(top, max(1, 1 + round((point - low) * scale)))] if point == point else " " for point in points
+        )
+        return [Segment(bars.rjust(width), console.get_style(self.style)), Segment.line()]
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        width = self.width or options.max_width
+        return Measurement(width, width)
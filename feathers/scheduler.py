@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable
+from time import perf_counter
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from textual.app import App
+
+IdleStep = Callable[[float], bool]
+"""A chunk of work. It is given the seconds it may take and returns True once the work is complete."""
+
+
+class IdleTask:
+    """Work registered with an `IdleScheduler`, run one step at a time until complete or cancelled.
+
+    Attributes:
+        name: A name to tell the task apart when debugging
+        priority: Tasks with a higher priority run first
+        time_used: Seconds spent running the steps of this task
+    """
+
+    def __init__(self, step: IdleStep, priority: int, name: str | None) -> None:
+        self.name = name
+        self.priority = priority
+        self.time_used = 0.0
+        self._step = step
+        self._cancelled = False
+        self._done = False
+
+    @property
+    def is_active(self) -> bool:
+        """True until the task is complete or cancelled"""
+        return not (self._done or self._cancelled)
+
+    def cancel(self) -> None:
+        """Stop running the task. A step already running is not interrupted"""
+        self._cancelled = True
+
+
+class IdleScheduler:
+    """Runs prioritised, cancellable chunks of work once the event loop is idle, within a time budget per frame.
+
+    Steps run after pending messages are processed and the screen is refreshed, so they never delay input or
+    painting by more than one step. Tasks with the same priority take turns, one step at a time. Use
+    `get_scheduler` to get the scheduler shared by all the widgets of an app.
+
+    Attributes:
+        frame_budget: Seconds spent running steps before yielding back to the event loop
+        time_used: Seconds spent running steps since the scheduler was created
+        last_frame_time: Seconds spent running steps in the last frame
+    """
+
+    def __init__(self, app: App, *, frame_budget: float = 0.008) -> None:
+        self.frame_budget = frame_budget
+        self.time_used = 0.0
+        self.last_frame_time = 0.0
+
+        self._app = app
+        self._queue: list[tuple[int, int, IdleTask]] = []
+        self._sequence = 0
+        self._scheduled = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks waiting to run"""
+        return sum(1 for _, _, task in self._queue if task.is_active)
+
+    def schedule(self, step: IdleStep, *, priority: int = 0, name: str | None = None) -> IdleTask:
+        """Run `step` when idle, until it returns True.
+
+        Args:
+            step: The chunk of work. It is given the seconds left in the frame budget.
+            priority: Tasks with a higher priority run first.
+            name: A name to tell the task apart when debugging.
+
+        Returns:
+            The task, which can be cancelled.
+        """
+        task = IdleTask(step, priority, name)
+        self._push(task)
+        self._wake()
+        return task
+
+    def _push(self, task: IdleTask) -> None:
+        self._sequence += 1
+        heapq.heappush(self._queue, (-task.priority, self._sequence, task))
+
+    def _wake(self) -> None:
+        if self._scheduled or not self._queue:
+            return
+        self._scheduled = True
+        self._app.call_after_refresh(self._run_frame)
+
+    def _run_frame(self) -> None:
+        self._scheduled = False
+        started = perf_counter()
+        deadline = started + self.frame_budget
+        try:
+            while self._queue:
+                now = perf_counter()
+                if now >= deadline:
+                    break
+                _, _, task = heapq.heappop(self._queue)
+                if not task.is_active:
+                    continue
+                try:
+                    task._done = task._step(deadline - now)
+                except BaseException:
+                    task.cancel()
+                    raise
+                finally:
+                    task.time_used += perf_counter() - now
+                if task.is_active:
+                    self._push(task)
+        finally:
+            self.last_frame_time = perf_counter() - started
+            self.time_used += self.last_frame_time
+            self._wake()
+
+
+_schedulers: WeakKeyDictionary[App, IdleScheduler] = WeakKeyDictionary()
+
+
+def get_scheduler(app: App) -> IdleScheduler:
+    """Get the idle scheduler shared by the widgets of `app`"""
+    scheduler = _schedulers.get(app)
+    if scheduler is None:
+        scheduler = _schedulers[app] = IdleScheduler(app)
+    return scheduler
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import asyncio
+import errno
+import os
+import socket
+import stat
+import struct
+from collections import deque
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Literal
+
+from rich.text import Text
+from textual.timer import Timer
+
+from feathers.ingest import DEFAULT_BATCH_BUDGET, BatchSizer
+from feathers.utils import friendly_list
+
+if TYPE_CHECKING:
+    from feathers.widgets import CachedView
+
+FramingType = Literal["newline", "length"]
+"""The names of the valid framings.
+
+These are the framings that can be used with an [`IngestServer`][feathers.server.IngestServer]:
+
+- `newline`: each line is an entry. The encoding must be ASCII compatible, like UTF-8.
+- `length`: each entry is sent as its length in bytes, a 4 byte big-endian unsigned integer, then its bytes.
+"""
+
+_VALID_FRAMINGS = {"newline", "length"}
+_LENGTH = struct.Struct(">I")
+
+
+class InvalidFraming(Exception):
+    """Exception raised if an invalid framing is used."""
+
+
+class FrameTooLarge(Exception):
+    """Exception raised when a producer sends a frame larger than `max_frame`."""
+
+
+class IngestConnection:
+    """A producer connected to an `IngestServer`.
+
+    Attributes:
+        peer: The address of the producer
+        frames: Number of entries received
+        bytes_received: Number of bytes received
+        read_pauses: Number of times reading stopped to let the view catch up
+        closed: True once the producer is disconnected
+    """
+
+    def __init__(self, peer: str) -> None:
+        self.peer = peer
+        self.frames = 0
+        self.bytes_received = 0
+        self.read_pauses = 0
+        self.closed = False
+        self._pending: deque[Text] = deque()
+        self._can_read = asyncio.Event()
+        self._can_read.set()
+
+    @property
+    def pending(self) -> int:
+        """Number of entries waiting to be written to the view"""
+        return len(self._pending)
+
+
+class IngestServer:
+    """A local socket server which writes the entries sent by other processes to a `CachedView`.
+
+    It listens on a Unix domain socket or a local TCP port. Each connection is read in large chunks which are split
+    into frames and decoded in bulk. The entries are written to the view in batches, once per frame, taking from
+    each connection in turn, each batch sized to take about `budget` seconds. When more than `max_pending` entries
+    of a connection are waiting, reading that connection stops until the view catches up, which in turn blocks the
+    producer once the socket buffers are full.
+
+    Attributes:
+        frames: Number of entries received
+        bytes_received: Number of bytes received
+        connections_total: Number of connections accepted
+        read_pauses: Number of times reading a connection stopped to let the view catch up
+        oversized: Number of connections closed because of a frame larger than `max_frame`
+    """
+
+    def __init__(
+        self,
+        view: CachedView,
+        *,
+        framing: FramingType = "newline",
+        encoding: str = "utf-8",
+        max_pending: int = 10_000,
+        max_batch: int | None = None,
+        budget: float | None = DEFAULT_BATCH_BUDGET,
+        max_frame: int = 1024 * 1024,
+        read_size: int = 64 * 1024,
+    ) -> None:
+        """Create an IngestServer.
+
+        Args:
+            view: The view to write to.
+            framing: How entries are delimited. Defaults to "newline"
+            encoding: The encoding of the entries. Bytes which can not be decoded are replaced.
+            max_pending: Number of entries of a connection waiting to be written above which reading it stops.
+            max_batch: Maximum number of entries written per batch, or `None` for no limit.
+            budget: Seconds spent writing a batch, or `None` to write up to `max_batch` entries whatever they cost.
+            max_frame: Maximum size of an entry in bytes, a larger one closes the connection.
+            read_size: Maximum bytes read at once from a connection.
+        """
+        if framing not in _VALID_FRAMINGS:
+            raise InvalidFraming(f"Valid framings are {friendly_list(_VALID_FRAMINGS)}")
+        self.framing = framing
+        self.encoding = encoding
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.budget = budget
+        self.max_frame = max_frame
+        self.read_size = read_size
+        self.frames = 0
+        self.bytes_received = 0
+        self.connections_total = 0
+        self.read_pauses = 0
+        self.oversized = 0
+
+        self._view = view
+        self._server: asyncio.AbstractServer | None = None
+        self._address: str | tuple[str, int] | None = None
+        self._connections: list[IngestConnection] = []
+        self._handlers: set[asyncio.Task[None]] = set()
+        self._timer: Timer | None = None
+        self._batches = BatchSizer()
+
+    @property
+    def address(self) -> str | tuple[str, int] | None:
+        """The address the server listens on, with the actual port for TCP"""
+        return self._address
+
+    @property
+    def connections(self) -> list[IngestConnection]:
+        """The connections which are open or still have entries waiting"""
+        return list(self._connections)
+
+    async def start_unix(self, path: str | os.PathLike[str], interval: float = 1 / 60) -> str:
+        """Listen on a Unix domain socket. A socket left at `path` by a server which stopped is replaced.
+
+        Args:
+            path: The path of the socket.
+            interval: Seconds between batches. Defaults to one frame at 60 fps.
+
+        Returns:
+            The address of the server.
+
+        Raises:
+            OSError: If another server is listening on `path`.
+        """
+        path = os.fspath(path)
+        try:
+            is_socket = stat.S_ISSOCK(os.stat(path).st_mode)
+        except FileNotFoundError:
+            is_socket = False
+        if is_socket:
+            try:
+                _, writer = await asyncio.open_unix_connection(path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # nothing listens on it anymore
+                os.unlink(path)
+            else:
+                writer.close()
+                raise OSError(errno.EADDRINUSE, f"A server is already listening on {path}")
+        self._server = await asyncio.start_unix_server(self._handle, path, limit=self.read_size)
+        self._address = path
+        self._start_flushing(interval)
+        return path
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0, interval: float = 1 / 60) -> tuple[str, int]:
+        """Listen on a TCP port.
+
+        Args:
+            host: The interface to listen on. Defaults to the local interface only
+            port: The port to listen on, or 0 for any free port.
+            interval: Seconds between batches. Defaults to one frame at 60 fps.
+
+        Returns:
+            The address of the server, with the actual port.
+        """
+        self._server = await asyncio.start_server(self._handle, host, port, limit=self.read_size)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        self._address = (host, port)
+        self._start_flushing(interval)
+        return host, port
+
+    def _start_flushing(self, interval: float) -> None:
+        if self._timer is None:
+            self._timer = self._view.set_interval(interval, self.flush)
+
+    async def close(self) -> None:
+        """Stop listening and disconnect the producers. Entries received are still written, over the next batches."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for handler in list(self._handlers):
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if isinstance(self._address, str):
+            try:
+                os.unlink(self._address)
+            except FileNotFoundError:
+                pass
+        self.flush()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        handler = asyncio.current_task()
+        assert handler is not None
+        self._handlers.add(handler)
+        peer = writer.get_extra_info("peername")
+        connection = IngestConnection(str(peer or "unix"))
+        self._connections.append(connection)
+        self.connections_total += 1
+        try:
+            if self.framing == "newline":
+                await self._read_lines(reader, connection)
+            else:
+                await self._read_frames(reader, connection)
+        except FrameTooLarge:
+            self.oversized += 1
+        except ConnectionError:
+            pass
+        finally:
+            connection.closed = True
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def _read(self, reader: asyncio.StreamReader, connection: IngestConnection) -> bytes:
+        if len(connection._pending) >= self.max_pending:
+            connection.read_pauses += 1
+            self.read_pauses += 1
+            connection._can_read.clear()
+            await connection._can_read.wait()
+        chunk = await reader.read(self.read_size)
+        connection.bytes_received += len(chunk)
+        self.bytes_received += len(chunk)
+        return chunk
+
+    def _add(self, connection: IngestConnection, texts: list[str]) -> None:
+        connection._pending.extend(map(Text, texts))
+        connection.frames += len(texts)
+        self.frames += len(texts)
+
+    async def _read_lines(self, reader: asyncio.StreamReader, connection: IngestConnection) -> None:
+        buffer = bytearray()
+        while True:
+            chunk = await self._read(reader, connection)
+            if not chunk:
+                if buffer:
+                    self._add(connection, [buffer.decode(self.encoding, errors="replace").rstrip("\r")])
+                return
+            buffer += chunk
+            end = buffer.rfind(b"\n")
+            if end == -1:
+                if len(buffer) > self.max_frame:
+                    raise FrameTooLarge()
+                continue
+            # all the complete lines of the chunk are decoded at once
+            text = buffer[:end].decode(self.encoding, errors="replace")
+            del buffer[: end + 1]
+            self._add(connection, text.replace("\r\n", "\n").split("\n"))
+
+    async def _read_frames(self, reader: asyncio.StreamReader, connection: IngestConnection) -> None:
+        buffer = bytearray()
+        while True:
+            chunk = await self._read(reader, connection)
+            if not chunk:
+                return
+            buffer += chunk
+            frames = []
+            position = 0
+            while len(buffer) - position >= _LENGTH.size:
+                (size,) = _LENGTH.unpack_from(buffer, position)
+                if size > self.max_frame:
+                    raise FrameTooLarge()
+                start = position + _LENGTH.size
+                if len(buffer) - start < size:
+                    break
+                frames.append(buffer[start : start + size])
+                position = start + size
+            del buffer[:position]
+            if frames:
+                encoding = self.encoding
+                self._add(connection, [frame.decode(encoding, errors="replace") for frame in frames])
+
+    def flush(self) -> None:
+        """Write a batch of waiting entries to the view. Must be called from the event loop."""
+        size = self._batches.size(self.budget, self.max_batch)
+        batch: list[Text] = []
+        for connection in self._connections:
+            pending = connection._pending
+            if size is None or len(pending) <= size - len(batch):
+                batch.extend(pending)
+                pending.clear()
+            else:
+                popleft = pending.popleft
+                batch.extend(popleft() for _ in range(size - len(batch)))
+            if len(pending) < self.max_pending:
+                connection._can_read.set()
+        # the next batch starts with the next connection, so none of them is starved
+        if len(self._connections) > 1:
+            self._connections.append(self._connections.pop(0))
+        self._connections = [
+            connection for connection in self._connections if not connection.closed or connection._pending
+        ]
+        self._batches.write(self._view, batch)
+
+        if self._server is None and not self._connections and self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+
+class IngestClient:
+    """A blocking client to send entries to an `IngestServer`, from any process or thread."""
+
+    def __init__(
+        self, address: str | tuple[str, int], *, framing: FramingType = "newline", encoding: str = "utf-8"
+    ) -> None:
+        """Connect to an IngestServer.
+
+        Args:
+            address: The path of its Unix domain socket, or its (host, port) TCP address.
+            framing: The framing of the server. With "newline", an entry with newlines shows as several entries.
+            encoding: The encoding of the server.
+        """
+        if framing not in _VALID_FRAMINGS:
+            raise InvalidFraming(f"Valid framings are {friendly_list(_VALID_FRAMINGS)}")
+        self.framing = framing
+        self.encoding = encoding
+        if isinstance(address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(address)
+        else:
+            self._socket = socket.create_connection(address)
+
+    def send(self, entry: str) -> None:
+        """Send an entry, blocking while the server is not reading."""
+        self.send_many([entry])
+
+    def send_many(self, entries: Iterable[str]) -> int:
+        """Send entries in a single write, blocking while the server is not reading.
+
+        Returns:
+            The number of entries sent.
+        """
+        encoding = self.encoding
+        if self.framing == "newline":
+            lines = [entry.encode(encoding) for entry in entries]
+            data = b"\n".join(lines) + b"\n" if lines else b""
+            count = len(lines)
+        else:
+            frames = [entry.encode(encoding) for entry in entries]
+            data = b"".join(_LENGTH.pack(len(frame)) + frame for frame in frames)
+            count = len(frames)
+        self._socket.sendall(data)
+        return count
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def __enter__(self) -> IngestClient:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
@@ -1,3 +1,5 @@
 from ._errors import friendly_list
+from ._optional import numpy
+from ._text import CONTROL_CHARACTERS
 
-__all__ = ["friendly_list"]
+__all__ = ["CONTROL_CHARACTERS", "friendly_list", "numpy"]
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+try:
+    numpy: Any = importlib.import_module("numpy")
+except ImportError:
+    numpy = None
+"""The numpy module if it is installed, else `None`. It is optional, code using it needs a pure Python path."""
@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+CONTROL_CHARACTERS = {code: "\N{REPLACEMENT CHARACTER}" for code in (*range(32), 127)}
+"""A `str.translate` table replacing the control characters, which the terminal would interpret, with `�`."""
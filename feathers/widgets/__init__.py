@@ -1,5 +1,21 @@
 from ._cached_view import CachedView
+from ._diff_view import DiffView
+from ._hex_view import HexView
+from ._json_view import JsonView
+from ._large_file_view import LargeFileView
+from ._log_table import LogTable
 from ._nav_view import NavigableView
 from .help import Help, HelpEntry, HelpProvider
 
-__all__ = ["Help", "HelpEntry", "HelpProvider", "NavigableView", "CachedView"]
+__all__ = [
+    "Help",
+    "HelpEntry",
+    "HelpProvider",
+    "NavigableView",
+    "CachedView",
+    "LargeFileView",
+    "LogTable",
+    "JsonView",
+    "DiffView",
+    "HexView",
+]
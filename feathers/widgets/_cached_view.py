@@ -1,19 +1,71 @@
 from __future__ import annotations
 
-from typing import cast
+import os
+from collections.abc import Callable, Collection, Iterable, Mapping
+from dataclasses import fields, is_dataclass
+from itertools import repeat
+from time import monotonic
+from typing import ClassVar, cast
 
 from rich.console import RenderableType
-from rich.highlighter import ReprHighlighter
+from rich.highlighter import Highlighter, ReprHighlighter
 from rich.pretty import Pretty
 from rich.protocol import is_renderable
+from rich.style import StyleType
 from rich.text import Text
-from textual.geometry import Size
+from textual import __version__ as textual_version
+from textual import events
+from textual._cache import LRUCache
+from textual.binding import Binding, BindingType
+from textual.geometry import Region, Size
 from textual.strip import Strip
+from textual.timer import Timer
 
 from feathers.cache import CacheListener, RenderablesCache, RenderableWithOptions
+from feathers.highlighters import MemoizedHighlighter
+from feathers.ingest import DEFAULT_BATCH_BUDGET, IngestChannel, OverflowPolicy
+from feathers.process import ProcessStream
+from feathers.renderables import LazyPretty
+from feathers.scheduler import IdleTask, get_scheduler
 
 from ._nav_view import NavigableView
 
+# background work by priority: reflow fixes line positions, upgrades fix looks, prefetch only saves time later
+_REFLOW_PRIORITY = 2
+_UPGRADE_PRIORITY = 1
+_PREFETCH_PRIORITY = 0
+
+# Textual has no public way to resize the scrollable area without a repaint of the whole widget, the private path of
+# `CachedView._resize_without_repaint` was checked against these releases only
+_PRIVATE_RESIZE_VERSIONS = ("0.24.",)
+
+
+def _has_more_items(obj: object, limit: int) -> bool:
+    """Whether `obj` has more than `limit` items, counting the items of nested containers and dataclass fields.
+
+    The walk stops as soon as the limit is passed, so it costs at most about `limit` steps whatever the size of `obj`.
+    """
+    count = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        children: Collection[object]
+        if isinstance(item, Mapping):
+            children = item.values()
+        elif isinstance(item, str) or isinstance(item, bytes):
+            continue
+        elif isinstance(item, Collection):
+            children = item
+        elif is_dataclass(item) and not isinstance(item, type):
+            children = [getattr(item, field.name) for field in fields(item)]
+        else:
+            continue
+        count += len(children)
+        if count > limit:
+            return True
+        stack.extend(children)
+    return False
+
 
 class CachedView(NavigableView, CacheListener):
     # scrollbar-gutter here is a fix to calculate scrollbar_gutter which impact the scrollable_content_region
@@ -25,11 +77,28 @@ class CachedView(NavigableView, CacheListener):
     }
     """
 
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "activate_cursor", "expand", show=False),
+    ]
+    """
+    | Key(s) | Description |
+    | :- | :- |
+    | enter | Expand or collapse the part of an object under the cursor. |
+    """
+
     max_width: int | None = None
     wrap: bool = False
     highlight: bool = False
     markup: bool = False
     auto_scroll: bool = True
+    reflow_delay: float = 0.1
+    """Seconds without a resize before the off-screen content is reflowed."""
+    reflow_budget: float = 0.008
+    """Seconds spent reflowing or upgrading off-screen content per step of background work."""
+    fidelity_idle: float = 0.3
+    """Seconds without scrolling or writing before previews are rendered fully, with `adaptive_fidelity`."""
+    lazy_pretty_items: int = 500
+    """Number of items, counting nested ones, above which an object is shown with `LazyPretty` instead of `Pretty`."""
 
     def __init__(
         self,
@@ -37,9 +106,13 @@ class CachedView(NavigableView, CacheListener):
         max_width: int | None = None,
         wrap: bool = False,
         highlight: bool = False,
+        highlighter: Highlighter | None = None,
         markup: bool = False,
         auto_scroll: bool = True,
         enable_cursor: bool = False,
+        byte_budget: int | None = None,
+        render_budget: float | None = None,
+        adaptive_fidelity: bool = False,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -50,9 +123,17 @@ class CachedView(NavigableView, CacheListener):
         Args:
             wrap: Enable word wrapping (default is off).
             highlight: Automatically highlight content.
+            highlighter: The highlighter used on text content with `highlight`. Defaults to a `ReprHighlighter` which
+            remembers the highlights of the texts it has seen.
             markup: Apply Rich console markup.
             auto_scroll: Enable automatic scrolling to end.
             enable_cursor: Enable cursor which name this view navigable. This also make this view focusable.
+            byte_budget: Approximate memory, in bytes, the rendered content can use. Content far from the viewport is
+            rendered again when needed. Defaults to no limit.
+            render_budget: Seconds a renderable can take to render before it is shown as a placeholder and finished
+            in the background. Defaults to no limit.
+            adaptive_fidelity: While scrolling fast or writing a lot, render new content as plain text previews and
+            render it fully once idle for `fidelity_idle` seconds.
             name: The name of the text log.
             id: The ID of the text log in the DOM.
             classes: The CSS classes of the text log.
@@ -69,11 +150,34 @@ class CachedView(NavigableView, CacheListener):
         """Apply Rich console markup."""
         self.auto_scroll = auto_scroll
         """Automatically scroll to the end on write."""
-        self.highlighter = ReprHighlighter()
+        self.highlighter: Highlighter | None = (
+            highlighter if highlighter is not None else MemoizedHighlighter(ReprHighlighter())
+        )
+        """The highlighter used on text content with `highlight`."""
 
-        self._renderables_cache: RenderablesCache = RenderablesCache(self.app.console, listener=self)
+        self._renderables_cache: RenderablesCache = RenderablesCache(
+            self.app.console, listener=self, byte_budget=byte_budget, render_budget=render_budget
+        )
+        # final output strips keyed by (line index, scroll_x, width, style generation, cursor x or -1, line version)
+        self._line_cache: LRUCache[tuple[int, int, int, int, int, int], Strip] = LRUCache(1024)
+        # versions of the lines changed in place, bumping one leaves its cached strips to age out of the cache
+        self._line_versions: dict[int, int] = {}
+        # the line after the last line with a cached strip
+        self._line_cache_end = 0
+        self._style_generation = 0
+        self._reflow_timer: Timer | None = None
+        self._reflow_task: IdleTask | None = None
+        self.adaptive_fidelity = adaptive_fidelity
+        """Render previews while scrolling fast or writing a lot."""
+        self._last_activity = 0.0
+        self._settle_timer: Timer | None = None
+        self._upgrade_task: IdleTask | None = None
+        self._prefetch_task: IdleTask | None = None
 
     def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._style_generation += 1
+        self._clear_line_cache()
         self._renderables_cache.refresh()
 
     def _extract_renderable(
@@ -83,22 +187,23 @@ class CachedView(NavigableView, CacheListener):
         width: int | None = None,
         expand: bool | None = None,
         shrink: bool | None = None,
+        timestamp: float | None = None,
     ) -> RenderableWithOptions:
         renderable: RenderableType
         if not is_renderable(content):
-            renderable = Pretty(content)
+            renderable = LazyPretty(content) if _has_more_items(content, self.lazy_pretty_items) else Pretty(content)
         else:
             if isinstance(content, str):
                 if self.markup:
                     renderable = Text.from_markup(content)
                 else:
                     renderable = Text(content)
-                if self.highlighter is not None:
+                if self.highlight and self.highlighter is not None:
                     renderable = self.highlighter(renderable)
             else:
                 renderable = cast(RenderableType, content)
 
-        return RenderableWithOptions(renderable, id, width, expand, shrink, self.wrap)
+        return RenderableWithOptions(renderable, id, width, expand, shrink, self.wrap, timestamp)
 
     def add_entry(
         self,
@@ -109,11 +214,13 @@ class CachedView(NavigableView, CacheListener):
         expand: bool = False,
         shrink: bool = True,
         scroll_end: bool | None = None,
+        timestamp: float | None = None,
     ) -> CachedView:
         """Write text or a rich renderable.
 
         Args:
-            content: Rich renderable (or text).
+            content: Rich renderable (or text). Other objects are pretty printed, or shown with `LazyPretty` and
+            expanded with enter if they have more than `lazy_pretty_items` items.
             id: The renderable id which can later be used to remove or update the renderable. Can be missing if no
             update or remove is intended
             width: Width to render or `None` to use optimal width. Only used if either or both expand and shrink are
@@ -121,13 +228,16 @@ class CachedView(NavigableView, CacheListener):
             expand: Enable expand to widget width, or `False` to use `width`.
             shrink: Enable shrinking of content to fit width.
             scroll_end: Enable automatic scroll to end, or `None` to use `self.auto_scroll`.
+            timestamp: A monotonic timestamp for the entry, used by `scroll_to_time` and `ids_between_times`.
 
         Returns:
             The `CachedView` instance.
         """
 
         width = width or self.max_width
-        renderable = self._extract_renderable(content, id, width, expand, shrink)
+        self._note_activity()
+        self._pause_if_hidden()
+        renderable = self._extract_renderable(content, id, width, expand, shrink, timestamp)
         self._renderables_cache.add(renderable)
 
         auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
@@ -136,6 +246,137 @@ class CachedView(NavigableView, CacheListener):
 
         return self
 
+    def add_entries(
+        self,
+        contents: Iterable[RenderableType | object],
+        *,
+        ids: Iterable[str | None] | None = None,
+        timestamps: Iterable[float | None] | None = None,
+        scroll_end: bool | None = None,
+    ) -> CachedView:
+        """Write many texts or rich renderables with a single cache update.
+
+        Args:
+            contents: Rich renderables (or texts).
+            ids: The renderable ids, in the same order as `contents`. Defaults to no ids.
+            timestamps: The entry timestamps, in the same order as `contents`. Defaults to no timestamps.
+            scroll_end: Enable automatic scroll to end, or `None` to use `self.auto_scroll`.
+
+        Returns:
+            The `CachedView` instance.
+        """
+        width = self.max_width
+        self._note_activity()
+        self._pause_if_hidden()
+        renderables = [
+            self._extract_renderable(content, id, width, False, True, timestamp)
+            for content, id, timestamp in zip(
+                contents,
+                ids if ids is not None else repeat(None),
+                timestamps if timestamps is not None else repeat(None),
+            )
+        ]
+        self._renderables_cache.add_many(renderables)
+
+        auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
+        if auto_scroll:
+            self.scroll_end(animate=False)
+
+        return self
+
+    def create_ingest_channel(
+        self,
+        *,
+        maxsize: int = 10_000,
+        policy: OverflowPolicy = "drop-oldest",
+        max_batch: int | None = None,
+        budget: float | None = DEFAULT_BATCH_BUDGET,
+        interval: float = 1 / 60,
+    ) -> IngestChannel:
+        """Create a channel which lets any thread write to this view.
+
+        Entries put in the channel are written to this view in batches, once every `interval` seconds. This should
+        be called once the view is mounted.
+
+        Args:
+            maxsize: Maximum number of entries waiting in the channel.
+            policy: What to do when the channel is full. See `IngestChannel`.
+            max_batch: Maximum number of entries written per batch, or `None` for no limit.
+            budget: Seconds spent writing a batch, or `None` to write up to `max_batch` entries whatever they cost.
+            interval: Seconds between batches. Defaults to one frame at 60 fps.
+
+        Returns:
+            The channel.
+        """
+        channel = IngestChannel(maxsize=maxsize, policy=policy, max_batch=max_batch, budget=budget)
+        channel.attach(self, interval)
+        return channel
+
+    async def attach_process(
+        self,
+        program: str | os.PathLike[str],
+        *args: str | os.PathLike[str],
+        cwd: str | os.PathLike[str] | None = None,
+        env: dict[str, str] | None = None,
+        max_pending: int = 10_000,
+        stdout_style: StyleType = "",
+        stderr_style: StyleType = "red",
+        interval: float = 1 / 60,
+    ) -> ProcessStream:
+        """Run a program and write each line of its output to this view, in batches.
+
+        Args:
+            program: The program to run.
+            *args: The arguments of the program.
+            cwd: The working directory of the process.
+            env: The environment of the process, or `None` to inherit it.
+            max_pending: Number of lines waiting to be written above which reading the output stops.
+            stdout_style: Style of the lines from stdout.
+            stderr_style: Style of the lines from stderr.
+            interval: Seconds between batches. Defaults to one frame at 60 fps.
+
+        Returns:
+            The stream, to wait for the process or terminate it.
+        """
+        stream = ProcessStream(self, max_pending=max_pending, stdout_style=stdout_style, stderr_style=stderr_style)
+        await stream.start(program, *args, cwd=cwd, env=env, interval=interval)
+        return stream
+
+    def scroll_to_time(self, timestamp: float, *, animate: bool = False) -> bool:
+        """Scroll to the earliest entry with a timestamp at or after `timestamp`.
+
+        Args:
+            timestamp: The timestamp to scroll to.
+            animate: Animate the scroll.
+
+        Returns:
+            False if there is no such entry, in which case the view does not scroll.
+        """
+        line = self._renderables_cache.line_at_time(timestamp)
+        if line is None:
+            return False
+        self.scroll_to(y=line, animate=animate)
+        return True
+
+    def action_activate_cursor(self) -> None:
+        """Expand or collapse the part of an object entry under the cursor, or show more of its items."""
+        if self.cursor_disabled:
+            return
+        _, scroll_y = self.scroll_offset
+        cache = self._renderables_cache
+        entry = cache.entry_at(scroll_y + self.cursor_position.y)
+        if entry is None:
+            return
+        id, offset = entry
+        renderable = cache.get(id)
+        if renderable is not None and isinstance(renderable.renderableType, LazyPretty):
+            if renderable.renderableType.activate(offset):
+                cache.rerender(id)
+
+    def ids_between_times(self, start: float, end: float) -> list[str]:
+        """Get the ids of the entries with a timestamp from `start` up to (not including) `end`, in time order."""
+        return list(self._renderables_cache.ids_between_times(start, end))
+
     def remove_entry(self, id: str) -> CachedView:
         """Remove a renderable from cache.
 
@@ -150,18 +391,231 @@ class CachedView(NavigableView, CacheListener):
 
     def clear(self) -> CachedView:
         self._renderables_cache.clear()
+        self._clear_line_cache()
         self.max_width = 0
         self.virtual_size = Size(0, 0)
         self.refresh()
         return self
 
     def on_resize(self):
-        self._renderables_cache.content_width = self.scrollable_content_region.width
+        # only the viewport is reflowed right away, the rest is reflowed in chunks once resizing settles
+        _, scroll_y = self.scroll_offset
+        width, height = self.scrollable_content_region.size
+        if width <= 0:
+            # collapsed, keep the content at its last width
+            return
+        self._renderables_cache.reflow(width, scroll_y, scroll_y + height)
+
+        self._cancel_reflow()
+        if self._renderables_cache.is_reflowing:
+            self._reflow_timer = self.set_timer(self.reflow_delay, self._start_reflow)
+
+    def on_show(self, _: events.Show) -> None:
+        self._resume()
+
+    def on_hide(self, _: events.Hide) -> None:
+        self._pause()
+
+    def on_unmount(self, _: events.Unmount) -> None:
+        self._pause()
+        self._renderables_cache.close()
+
+    def _pause_if_hidden(self) -> None:
+        # not every version of Textual sends Hide when a widget or one of its ancestors stops being displayed
+        if not self._renderables_cache.is_paused and not self.region:
+            self._pause()
+
+    def _pause(self) -> None:
+        """Stop rendering while not visible. The cache is kept, entries written meanwhile are only queued"""
+        self._renderables_cache.pause()
+        self._cancel_reflow()
+        self._cancel_upgrade()
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
+
+    def _resume(self) -> None:
+        cache = self._renderables_cache
+        if not cache.is_paused:
+            return
+        cache.resume()
+        if cache.is_reflowing and self._reflow_timer is None and self._reflow_task is None:
+            self._reflow_timer = self.set_timer(self.reflow_delay, self._start_reflow)
+        if (cache.preview_mode or cache.has_previews) and self._settle_timer is None and self._upgrade_task is None:
+            self._settle_timer = self.set_timer(self.fidelity_idle, self._settle)
+
+    def _cancel_reflow(self) -> None:
+        if self._reflow_timer is not None:
+            self._reflow_timer.stop()
+            self._reflow_timer = None
+        if self._reflow_task is not None:
+            self._reflow_task.cancel()
+            self._reflow_task = None
+
+    def _start_reflow(self) -> None:
+        self._reflow_timer = None
+        self._reflow_task = get_scheduler(self.app).schedule(
+            self._reflow_step, priority=_REFLOW_PRIORITY, name=f"reflow {self!r}"
+        )
+
+    def _reflow_step(self, budget: float) -> bool:
+        cache = self._renderables_cache
+        done = self._anchored(lambda: cache.reflow_step(min(budget, self.reflow_budget)))
+        if done:
+            self._reflow_task = None
+        return done
+
+    def _anchored(self, update: Callable[[], bool]) -> bool:
+        """Run a cache update, keeping the first visible line in place while the content above it changes height"""
+        _, scroll_y = self.scroll_offset
+        anchor = None if self.auto_scroll else self._renderables_cache.entry_at(scroll_y)
+        done = update()
+
+        if anchor is not None:
+            anchor_id, offset = anchor
+            line = self._renderables_cache.line_of(anchor_id)
+            if line is not None:
+                self.scroll_to(y=line + offset, animate=False)
+        return done
 
     def on_cache_update(self):
-        self.virtual_size = self._renderables_cache.virtual_size
+        changes = self._renderables_cache.pop_changes()
+        self._discard_cached_lines(changes)
+
+        virtual_size = self._renderables_cache.virtual_size
+        if virtual_size != self.virtual_size:
+            self._resize_without_repaint(virtual_size)
+
         if self.auto_scroll:
             self.scroll_end(animate=False)
+        self._refresh_changed_lines(changes)
+
+    def _resize_without_repaint(self, virtual_size: Size) -> None:
+        """Set the virtual size, repainting only the scrollbars so that the unchanged lines are not painted again."""
+        if not textual_version.startswith(_PRIVATE_RESIZE_VERSIONS):
+            self.virtual_size = virtual_size
+            return
+        # what setting the reactive does in these releases, without its repaint and its watchers (there are none)
+        self._reactive_virtual_size = virtual_size
+        self._stabilize_scrollbar = None
+        self._scroll_update(virtual_size)
+        self.refresh(layout=True, repaint=False)
+
+    def _discard_cached_lines(self, changes: list[tuple[int, int | None]]) -> None:
+        versions = self._line_versions
+        for start, end in changes:
+            if start >= self._line_cache_end:
+                # nothing is cached from there, as when lines are added at the end
+                continue
+            if end is None:
+                # the lines from `start` moved, any cached line after it may be wrong
+                self._clear_line_cache()
+                return
+            for index in range(start, min(end, self._line_cache_end)):
+                versions[index] = versions.get(index, 0) + 1
+        if len(versions) > self._line_cache.maxsize:
+            self._clear_line_cache()
+
+    def _clear_line_cache(self) -> None:
+        self._line_cache.clear()
+        self._line_versions.clear()
+        self._line_cache_end = 0
+
+    def _refresh_changed_lines(self, changes: list[tuple[int, int | None]]) -> None:
+        _, scroll_y = self.scroll_offset
+        width, height = self.content_size
+        regions = []
+        for start, end in changes:
+            top = max(start, scroll_y)
+            bottom = scroll_y + height if end is None else min(end, scroll_y + height)
+            if top < bottom:
+                regions.append(Region(0, top - scroll_y, width, bottom - top))
+        if regions:
+            self.refresh(*regions)
+
+    def watch_scroll_x(self, old_value: float, new_value: float) -> None:
+        if round(old_value) != round(new_value):
+            if self.show_horizontal_scrollbar:
+                self.horizontal_scrollbar.position = round(new_value)
+            # only the content moves, the borders and padding stay as they are
+            self.refresh(self.content_size.region)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        if round(old_value) != round(new_value):
+            if self.show_vertical_scrollbar:
+                self.vertical_scrollbar.position = round(new_value)
+            self.refresh(self.content_size.region)
+            self._note_activity()
+            self._prefetch()
+
+    def _note_activity(self) -> None:
+        """Switch to previews if there was other scrolling or writing within `fidelity_idle` seconds"""
+        if not self.adaptive_fidelity:
+            return
+        now = monotonic()
+        busy = now - self._last_activity < self.fidelity_idle
+        self._last_activity = now
+        if not busy and not self._renderables_cache.preview_mode:
+            return
+
+        self._renderables_cache.preview_mode = True
+        self._cancel_upgrade()
+        self._settle_timer = self.set_timer(self.fidelity_idle, self._settle)
+
+    def _cancel_upgrade(self) -> None:
+        if self._settle_timer is not None:
+            self._settle_timer.stop()
+            self._settle_timer = None
+        if self._upgrade_task is not None:
+            self._upgrade_task.cancel()
+            self._upgrade_task = None
+
+    def _settle(self) -> None:
+        self._settle_timer = None
+        self._renderables_cache.preview_mode = False
+        self._upgrade_task = get_scheduler(self.app).schedule(
+            self._upgrade_step, priority=_UPGRADE_PRIORITY, name=f"upgrade previews {self!r}"
+        )
+
+    def _upgrade_step(self, budget: float) -> bool:
+        _, scroll_y = self.scroll_offset
+        height = self.scrollable_content_region.height
+        cache = self._renderables_cache
+        done = self._anchored(
+            lambda: cache.upgrade_previews(min(budget, self.reflow_budget), scroll_y, scroll_y + height)
+        )
+        if done:
+            self._upgrade_task = None
+        return done
+
+    def _prefetch(self) -> None:
+        """Render again, when idle, the evicted content within a page above and below the viewport"""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
+        if self._renderables_cache.byte_budget is None:
+            return
+
+        _, scroll_y = self.scroll_offset
+        height = self.scrollable_content_region.height
+        line = scroll_y - height
+        end = scroll_y + 2 * height
+
+        def step(budget: float) -> bool:
+            nonlocal line
+            line = self._renderables_cache.prefetch(line, end, budget)
+            done = line >= end
+            if done:
+                self._prefetch_task = None
+            return done
+
+        self._prefetch_task = get_scheduler(self.app).schedule(
+            step, priority=_PREFETCH_PRIORITY, name=f"prefetch {self!r}"
+        )
+
+    def on_deferred_render(self):
+        # called from the render thread
+        self.call_later(self._renderables_cache.complete_deferred)
 
     def line_count(self) -> int:
         return len(self._renderables_cache)
@@ -174,12 +628,54 @@ class CachedView(NavigableView, CacheListener):
         return line.cell_length
 
     def render_line(self, y: int) -> Strip:
+        batched_line = self.batched_line(y)
+        if batched_line is not None:
+            return batched_line
+
         scroll_x, scroll_y = self.scroll_offset
-        line = self._render_line(scroll_y + y, scroll_x, self.size.width)
-        strip = line.apply_style(self.rich_style)
-        strip = self.add_cursor(y, line)
+        width = self.size.width
+        index = scroll_y + y
+        cursor_x = self.cursor_position.x if self._has_cursor_at(y) else -1
+
+        key = (index, scroll_x, width, self._style_generation, cursor_x, self._line_versions.get(index, 0))
+        strip = self._line_cache.get(key)
+        if strip is not None:
+            return strip
+
+        line = self._render_line(index, scroll_x, width)
+        # the style of the widget goes under the cursor, so the cursor has to be added first
+        strip = self.add_cursor(y, line).apply_style(self.rich_style)
+        if index >= self.line_count():
+            # rows past the end are not cached, lines added at the end then leave the cached lines alone
+            return strip
+        self._line_cache[key] = strip
+        self._line_cache_end = max(self._line_cache_end, index + 1)
         return strip
 
+    def render_content_lines(self, start: int, end: int) -> list[Strip]:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        rich_style = self.rich_style
+        style_generation = self._style_generation
+        line_cache = self._line_cache
+        versions = self._line_versions
+
+        strips = self._renderables_cache.strips_between(scroll_y + start, scroll_y + end)
+        lines: list[Strip] = []
+        for index, strip in enumerate(strips, scroll_y + start):
+            key = (index, scroll_x, width, style_generation, -1, versions.get(index, 0))
+            line = line_cache.get(key)
+            if line is None:
+                line = strip.crop(scroll_x, scroll_x + width).apply_style(rich_style)
+                line_cache[key] = line
+            lines.append(line)
+        self._line_cache_end = max(self._line_cache_end, scroll_y + start + len(strips))
+
+        if len(lines) < end - start:
+            blank = Strip.blank(width, rich_style)
+            lines.extend(blank for _ in range(end - start - len(lines)))
+        return lines
+
     def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
         strip = self._renderables_cache.strip_at(y)
         if strip is None:
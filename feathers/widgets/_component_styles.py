@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from rich.style import Style
+from textual.widget import Widget
+
+
+class CachedComponentStyles(Widget):
+    """A widget which caches the rich styles of its components until its styles are updated.
+
+    Textual also caches these styles, but it drops them on every repaint, so widgets which refresh often resolve
+    them again and again on hot paths.
+
+    Textual only takes the default CSS of the first base class, so list this one after the Textual widget class.
+    """
+
+    _resolved_component_styles: dict[tuple[str, bool], Style] | None = None
+
+    def get_component_rich_style(self, name: str, *, partial: bool = False) -> Style:
+        styles = self._resolved_component_styles
+        if styles is None:
+            styles = self._resolved_component_styles = {}
+        key = (name, partial)
+        style = styles.get(key)
+        if style is None:
+            style = styles[key] = super().get_component_rich_style(name, partial=partial)
+        return style
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._resolved_component_styles = None
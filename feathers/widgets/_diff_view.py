@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from difflib import SequenceMatcher
+from pathlib import Path
+from time import monotonic
+from typing import ClassVar
+
+from rich.cells import cell_len, set_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from textual.binding import Binding, BindingType
+from textual.geometry import Size
+from textual.message import Message
+from textual.strip import Strip
+
+from feathers.utils import CONTROL_CHARACTERS
+
+from ._nav_view import NavigableView
+
+
+def _equal_run(before: Sequence[str], after: Sequence[str], i: int, j: int) -> int:
+    """Count the equal lines from `before[i]` and `after[j]`, comparing slices of growing size"""
+    limit = min(len(before) - i, len(after) - j)
+    run = 0
+    step = 64
+    while run < limit:
+        size = min(step, limit - run)
+        if before[i + run : i + run + size] == after[j + run : j + run + size]:
+            run += size
+            step *= 2
+        elif size == 1:
+            break
+        else:
+            step = size // 2
+    return run
+
+
+def _diff(before: Sequence[str], after: Sequence[str], window: int) -> Iterator[tuple[str, int, int, int, int]]:
+    """Diff two sequences of lines in order, as opcodes like `SequenceMatcher.get_opcodes`.
+
+    Equal runs are skipped by comparing slices. At a difference, `SequenceMatcher` runs on the next `window` lines of
+    each side, growing the window until the two sides match again, so the cost follows the size of the changes
+    rather than the size of the files.
+    """
+    i = j = 0
+    n, m = len(before), len(after)
+    while True:
+        run = _equal_run(before, after, i, j)
+        if run:
+            yield ("equal", i, i + run, j, j + run)
+            i += run
+            j += run
+        if i >= n or j >= m:
+            break
+
+        size = window
+        while True:
+            opcodes = SequenceMatcher(None, before[i : i + size], after[j : j + size], autojunk=False).get_opcodes()
+            synced = next((index for index, opcode in enumerate(opcodes) if opcode[0] == "equal"), None)
+            if synced is not None or (i + size >= n and j + size >= m):
+                break
+            size *= 2
+        for tag, i1, i2, j1, j2 in opcodes[:synced]:
+            yield (tag, i + i1, i + i2, j + j1, j + j2)
+        if synced is None:
+            return
+        _, i1, _, j1, _ = opcodes[synced]
+        i += i1
+        j += j1
+    if i < n:
+        yield ("delete", i, n, j, j)
+    if j < m:
+        yield ("insert", i, i, j, m)
+
+
+class _Run:
+    """Rows of the diff: equal lines, changed lines side by side, or a stub for collapsed equal lines"""
+
+    __slots__ = ("tag", "i1", "i2", "j1", "j2")
+
+    def __init__(self, tag: str, i1: int, i2: int, j1: int, j2: int) -> None:
+        self.tag = tag
+        self.i1 = i1
+        self.i2 = i2
+        self.j1 = j1
+        self.j2 = j2
+
+    @property
+    def rows(self) -> int:
+        if self.tag == "stub":
+            return 1
+        return max(self.i2 - self.i1, self.j2 - self.j1)
+
+
+class DiffView(NavigableView):
+    """A side by side view of the differences between two texts.
+
+    The diff is computed in a background thread and shown as it goes, so the first changes show before the rest of
+    the files are compared. Equal lines are skipped by comparing slices, so files which are mostly identical are
+    diffed in about the time it takes to compare them. Runs of equal lines are collapsed into a stub, which can be
+    expanded with enter. Only the rows in the viewport are rendered.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "expand_cursor", "expand", show=False),
+    ]
+    """
+    | Key(s) | Description |
+    | :- | :- |
+    | enter | Expand the unchanged lines under the cursor. |
+    """
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {"diff-view--removed", "diff-view--added", "diff-view--stub"}
+    """
+    | Class | Description |
+    | :- | :- |
+    | `diff-view--removed` | Target the lines only in the text before. |
+    | `diff-view--added` | Target the lines only in the text after. |
+    | `diff-view--stub` | Target the collapsed unchanged lines. |
+    """
+
+    DEFAULT_CSS = """
+    DiffView > .diff-view--removed {
+        background: $error 30%;
+    }
+    DiffView > .diff-view--added {
+        background: $success 30%;
+    }
+    DiffView > .diff-view--stub {
+        color: $text-muted;
+        background: $boost;
+    }
+    """
+
+    class Computed(Message):
+        """Posted when the whole diff is computed.
+
+        Attributes:
+            diff_view: Reference to the originating DiffView
+            changes: Number of changed blocks
+        """
+
+        def __init__(self, diff_view: DiffView, changes: int) -> None:
+            super().__init__()
+            self.diff_view = diff_view
+            self.changes = changes
+
+        @property
+        def control(self) -> DiffView:  # type: ignore
+            """Alias for self.diff_view."""
+            return self.diff_view
+
+    context: int = 3
+    """Number of unchanged lines shown around each change."""
+    window: int = 100
+    """Number of lines looked at past a difference to match the two sides again."""
+    refresh_interval: float = 0.1
+    """Seconds between updates of the rows while the diff is computed."""
+
+    def __init__(
+        self,
+        before: Sequence[str] | None = None,
+        after: Sequence[str] | None = None,
+        *,
+        enable_cursor: bool = True,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a DiffView widget.
+
+        Args:
+            before: The lines of the text before, or `None` to compare later with `compare`.
+            after: The lines of the text after.
+            enable_cursor: Enable cursor which name this view navigable. This also make this view focusable.
+            name: The name of the view.
+            id: The ID of the view in the DOM.
+            classes: The CSS classes of the view.
+            disabled: Whether the view is disabled or not.
+        """
+        super().__init__(disable_cursor=not enable_cursor, name=name, id=id, classes=classes, disabled=disabled)
+        self._before: Sequence[str] = before or []
+        self._after: Sequence[str] = after or []
+        self._compare_on_mount = before is not None or after is not None
+        self._runs: list[_Run] = []
+        # first row of each run
+        self._starts: list[int] = []
+        self._row_count = 0
+        self._changes = 0
+        self._computed = False
+        self._worker: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def is_computed(self) -> bool:
+        """True once the whole diff is computed"""
+        return self._computed
+
+    @property
+    def changes(self) -> int:
+        """Number of changed blocks found so far"""
+        return self._changes
+
+    def on_mount(self) -> None:
+        if self._compare_on_mount:
+            self.compare(self._before, self._after)
+
+    def on_unmount(self) -> None:
+        self._stop_worker()
+
+    def compare(self, before: Sequence[str], after: Sequence[str]) -> DiffView:
+        """Show the differences between two sequences of lines, replacing the ones shown before.
+
+        Returns:
+            The `DiffView` instance.
+        """
+        self._stop_worker()
+        self._before = before
+        self._after = after
+        self._runs = []
+        self._starts = []
+        self._row_count = 0
+        self._changes = 0
+        self._computed = False
+        self._update_size()
+        self.scroll_home(animate=False)
+
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._compute, args=(before, after, self._stop), name="feathers-diff", daemon=True
+        )
+        self._worker.start()
+        return self
+
+    def compare_files(self, before: str | os.PathLike[str], after: str | os.PathLike[str]) -> DiffView:
+        """Show the differences between two text files. Bytes which can not be decoded are replaced.
+
+        Returns:
+            The `DiffView` instance.
+        """
+        return self.compare(
+            Path(before).read_text(errors="replace").splitlines(), Path(after).read_text(errors="replace").splitlines()
+        )
+
+    def _stop_worker(self) -> None:
+        if self._worker is not None:
+            self._stop.set()
+            self._worker.join()
+            self._worker = None
+
+    def _compute(self, before: Sequence[str], after: Sequence[str], stop: threading.Event) -> None:
+        batch: list[tuple[str, int, int, int, int]] = []
+        last_update = monotonic()
+        shown_change = False
+        for block in _diff(before, after, self.window):
+            if stop.is_set():
+                return
+            batch.append(block)
+            now = monotonic()
+            if (block[0] != "equal" and not shown_change) or now - last_update >= self.refresh_interval:
+                shown_change = shown_change or block[0] != "equal"
+                last_update = now
+                self.call_later(self._add_blocks, batch, stop)
+                batch = []
+        self.call_later(self._add_blocks, batch, stop, True)
+
+    def _add_blocks(
+        self, blocks: list[tuple[str, int, int, int, int]], stop: threading.Event, last: bool = False
+    ) -> None:
+        if stop is not self._stop or stop.is_set():
+            # from an earlier comparison
+            return
+        for tag, i1, i2, j1, j2 in blocks:
+            if tag != "equal":
+                self._changes += 1
+                self._add_run(_Run("change", i1, i2, j1, j2))
+                continue
+
+            # keep the context around the changes, collapse the rest
+            head = 0 if i1 == 0 else self.context
+            tail = 0 if i2 == len(self._before) and j2 == len(self._after) else self.context
+            if i2 - i1 <= head + tail + 1:
+                self._add_run(_Run("equal", i1, i2, j1, j2))
+                continue
+            if head:
+                self._add_run(_Run("equal", i1, i1 + head, j1, j1 + head))
+            self._add_run(_Run("stub", i1 + head, i2 - tail, j1 + head, j2 - tail))
+            if tail:
+                self._add_run(_Run("equal", i2 - tail, i2, j2 - tail, j2))
+
+        self._update_size()
+        self.refresh()
+        if last:
+            self._computed = True
+            self.post_message(self.Computed(self, self._changes))
+
+    def _add_run(self, run: _Run) -> None:
+        self._runs.append(run)
+        self._starts.append(self._row_count)
+        self._row_count += run.rows
+
+    def _update_size(self) -> None:
+        self.virtual_size = Size(0, self._row_count)
+
+    def line_count(self) -> int:
+        return self._row_count
+
+    def line_width(self, y: int) -> int:
+        return self.size.width
+
+    def action_expand_cursor(self) -> None:
+        """Expand the unchanged lines under the cursor."""
+        if self.cursor_disabled:
+            return
+        _, scroll_y = self.scroll_offset
+        self.expand_unchanged(scroll_y + self.cursor_position.y)
+
+    def expand_unchanged(self, line: int) -> bool:
+        """Show the unchanged lines collapsed at row `line`.
+
+        Returns:
+            True if there were collapsed lines at `line`.
+        """
+        if not 0 <= line < self._row_count:
+            return False
+        index = bisect_right(self._starts, line) - 1
+        run = self._runs[index]
+        if run.tag != "stub":
+            return False
+        run.tag = "equal"
+        added = run.rows - 1
+        for following in range(index + 1, len(self._starts)):
+            self._starts[following] += added
+        self._row_count += added
+        self._update_size()
+        self.refresh()
+        return True
+
+    def _half(self, lines: Sequence[str], number: int | None, marker: str, width: int, style: Style | None) -> Segment:
+        if width <= 0:
+            return Segment("")
+        if number is None:
+            return Segment(" " * width)
+        digits = len(str(max(len(self._before), len(self._after))))
+        text = f"{number + 1:>{digits}} {marker} {lines[number].expandtabs().translate(CONTROL_CHARACTERS)}"
+        length = cell_len(text)
+        text = text + " " * (width - length) if length <= width else set_cell_size(text, width)
+        return Segment(text, style)
+
+    def _row(self, line: int, width: int) -> Strip:
+        index = bisect_right(self._starts, line) - 1
+        run = self._runs[index]
+        offset = line - self._starts[index]
+        if run.tag == "stub":
+            text = f"⋯ {run.i2 - run.i1} unchanged lines"
+            return Strip([Segment(set_cell_size(text, width), self.get_component_rich_style("diff-view--stub"))], width)
+
+        left = run.i1 + offset if run.i1 + offset < run.i2 else None
+        right = run.j1 + offset if run.j1 + offset < run.j2 else None
+        left_width = (width - 1) // 2
+        if run.tag == "equal":
+            left_segment = self._half(self._before, left, " ", left_width, None)
+            right_segment = self._half(self._after, right, " ", width - 1 - left_width, None)
+        else:
+            removed = self.get_component_rich_style("diff-view--removed")
+            added = self.get_component_rich_style("diff-view--added")
+            left_segment = self._half(self._before, left, "-", left_width, removed)
+            right_segment = self._half(self._after, right, "+", width - 1 - left_width, added)
+        return Strip([left_segment, Segment("│"), right_segment], width)
+
+    def render_line(self, y: int) -> Strip:
+        _, scroll_y = self.scroll_offset
+        width = self.size.width
+        line = scroll_y + y
+        if not 0 <= line < self._row_count:
+            return Strip.blank(width, self.rich_style)
+        return self.add_cursor(y, self._row(line, width)).apply_style(self.rich_style)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import mmap
+import os
+from typing import Any, ClassVar
+
+from rich.segment import Segment
+from textual.geometry import Offset, Size
+from textual.strip import Strip
+
+from ._nav_view import NavigableView
+
+BYTES_PER_ROW = 16
+_HALF_ROW = BYTES_PER_ROW // 2
+# "hh hh hh hh hh hh hh hh  hh hh hh hh hh hh hh hh"
+_HEX_WIDTH = 3 * BYTES_PER_ROW
+# printable ASCII is shown as is, any other byte as a dot
+_ASCII = bytes(byte if 32 <= byte < 127 else ord(".") for byte in range(256))
+
+
+class HexView(NavigableView):
+    """A hex and ASCII view of a binary file of any size, 16 bytes per row.
+
+    The file is memory-mapped and nothing is read up front: a row is read and formatted only when it is shown, so
+    memory use does not depend on the size of the file. The row of an offset is found by division, so jumping to any
+    offset is immediate. The cursor moves one byte at a time and is shown on both the hex and the ASCII columns.
+    """
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {"hex-view--offset", "hex-view--ascii"}
+    """
+    | Class | Description |
+    | :- | :- |
+    | `hex-view--offset` | Target the offsets at the start of the rows. |
+    | `hex-view--ascii` | Target the ASCII column. |
+    """
+
+    DEFAULT_CSS = """
+    HexView > .hex-view--offset {
+        color: $text-muted;
+    }
+    HexView > .hex-view--ascii {
+        color: $text-muted;
+    }
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        enable_cursor: bool = True,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a HexView widget.
+
+        Args:
+            path: The file to show, or `None` to open one later with `open`.
+            enable_cursor: Enable cursor which name this view navigable. This also make this view focusable.
+            name: The name of the view.
+            id: The ID of the view in the DOM.
+            classes: The CSS classes of the view.
+            disabled: Whether the view is disabled or not.
+        """
+        super().__init__(disable_cursor=not enable_cursor, name=name, id=id, classes=classes, disabled=disabled)
+        self._path = path
+        self._file: Any = None
+        self._mmap: mmap.mmap | None = None
+        self._file_size = 0
+        self._offset_digits = 8
+
+    @property
+    def file_size(self) -> int:
+        return self._file_size
+
+    @property
+    def cursor_offset(self) -> int:
+        """Offset in the file of the byte under the cursor"""
+        _, scroll_y = self.scroll_offset
+        return (scroll_y + self.cursor_position.y) * BYTES_PER_ROW + self.cursor_position.x
+
+    def on_mount(self) -> None:
+        if self._path is not None and self._mmap is None:
+            self.open(self._path)
+
+    def on_unmount(self) -> None:
+        self.close()
+
+    def open(self, path: str | os.PathLike[str]) -> HexView:
+        """Show a file, closing the one shown before.
+
+        Returns:
+            The `HexView` instance.
+        """
+        self.close()
+        self._path = path
+        self._file = open(path, "rb")
+        self._file_size = os.fstat(self._file.fileno()).st_size
+        if self._file_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offset_digits = max(8, len(f"{self._file_size:x}"))
+        self._update_size()
+        self.scroll_home(animate=False)
+        self.cursor_position = Offset(0, 0)
+        return self
+
+    def close(self) -> HexView:
+        """Stop showing the file.
+
+        Returns:
+            The `HexView` instance.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._file_size = 0
+        self._update_size()
+        return self
+
+    def jump_to(self, offset: int) -> HexView:
+        """Move the cursor to the byte at `offset`, scrolling it into view.
+
+        Returns:
+            The `HexView` instance.
+        """
+        if not self._file_size:
+            return self
+        offset = max(0, min(offset, self._file_size - 1))
+        row, column = divmod(offset, BYTES_PER_ROW)
+        _, scroll_y = self.scroll_offset
+        height = self.scrollable_content_region.height
+        if not scroll_y <= row < scroll_y + height:
+            self.scroll_to(y=max(0, row - height // 2), animate=False)
+            _, scroll_y = self.scroll_offset
+        self.cursor_position = Offset(column, row - scroll_y)
+        return self
+
+    def _update_size(self) -> None:
+        self.virtual_size = Size(self._row_width(), self.line_count())
+
+    def _row_width(self) -> int:
+        # offset, 2 spaces, hex, 1 space, |ascii|
+        return self._offset_digits + 2 + _HEX_WIDTH + 1 + BYTES_PER_ROW + 2
+
+    def line_count(self) -> int:
+        return -(-self._file_size // BYTES_PER_ROW)
+
+    def line_width(self, y: int) -> int:
+        """Number of bytes in row `y` of the viewport, the cursor moves over bytes rather than cells"""
+        _, scroll_y = self.scroll_offset
+        start = (scroll_y + y) * BYTES_PER_ROW
+        return max(0, min(BYTES_PER_ROW, self._file_size - start))
+
+    def action_cursor_left(self) -> None:
+        """Move the cursor to the previous byte."""
+        if self.cursor_position.x == 0 and not self.cursor_disabled:
+            self.jump_to(self.cursor_offset - 1)
+        else:
+            super().action_cursor_left()
+
+    def action_cursor_right(self) -> None:
+        """Move the cursor to the next byte."""
+        if self.cursor_position.x >= BYTES_PER_ROW - 1 and not self.cursor_disabled:
+            self.jump_to(self.cursor_offset + 1)
+        else:
+            super().action_cursor_right()
+
+    def _row(self, row: int) -> Strip:
+        assert self._mmap is not None
+        start = row * BYTES_PER_ROW
+        data = self._mmap[start : start + BYTES_PER_ROW]
+        hex_text = data[:_HALF_ROW].hex(" ")
+        if len(data) > _HALF_ROW:
+            hex_text += "  " + data[_HALF_ROW:].hex(" ")
+        ascii_text = data.translate(_ASCII).decode("ascii")
+        return Strip(
+            [
+                Segment(f"{start:0{self._offset_digits}x}", self.get_component_rich_style("hex-view--offset")),
+                Segment(f"  {hex_text:<{_HEX_WIDTH}} |"),
+                Segment(ascii_text, self.get_component_rich_style("hex-view--ascii")),
+                Segment("|"),
+            ],
+            self._offset_digits + 2 + _HEX_WIDTH + 2 + len(data) + 1,
+        )
+
+    def add_cursor(self, y: int, line: Strip) -> Strip:
+        if not self._has_cursor_at(y):
+            return line
+        style = self.get_component_rich_style("navigation-box--cursor")
+        column = self.cursor_position.x
+        hex_start = self._offset_digits + 2 + 3 * column + (column >= _HALF_ROW)
+        ascii_start = self._offset_digits + 2 + _HEX_WIDTH + 2 + column
+        parts = list(line.divide([hex_start, hex_start + 2, ascii_start, ascii_start + 1, line.cell_length]))
+        if len(parts) < 5:
+            return line
+        parts[1] = parts[1].apply_style(style)
+        parts[3] = parts[3].apply_style(style)
+        return Strip.join(parts)
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        row = scroll_y + y
+        if not 0 <= row < self.line_count():
+            return Strip.blank(width, self.rich_style)
+        strip = self.add_cursor(y, self._row(row))
+        return strip.crop(scroll_x, scroll_x + width).apply_style(self.rich_style)
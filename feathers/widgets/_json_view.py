@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+from typing import Any, ClassVar, Union
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.binding import Binding, BindingType
+from textual.geometry import Size
+from textual.strip import Strip
+
+from feathers.utils import CONTROL_CHARACTERS
+
+from ._nav_view import NavigableView
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# numbers, true, false and null
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+# strings are matched whole, so the brackets inside them are skipped
+_STRUCTURE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]', re.DOTALL)
+_ESCAPE = re.compile(rb"\\.", re.DOTALL)
+_NOT_STRUCTURE = bytes(byte for byte in range(256) if byte not in b'"[]{}')
+_QUOTED = re.compile(rb'"[^"]*"')
+_FIRST_BLOCK = 1024
+_MAX_BLOCK = 1024 * 1024
+_OPEN = b"[{"
+_CLOSE = b"]}"
+_KEYWORD_STYLES = {"true": "json.bool_true", "false": "json.bool_false", "null": "json.null"}
+_SUMMARY_STYLE = Style(dim=True)
+
+
+class InvalidJson(Exception):
+    pass
+
+
+def _skip_whitespace(buffer: Any, position: int) -> int:
+    match = _WHITESPACE.match(buffer, position)
+    assert match is not None
+    return match.end()
+
+
+def _container_end(buffer: Any, position: int) -> int:
+    """Find where the array or object starting at `position` ends.
+
+    The bytes are taken in growing blocks, cut outside of strings. Once its escapes, strings and matching pairs of
+    brackets are removed, a block is left with the brackets it closes and opens. Blocks which do not close the
+    container are skipped in one go, only a small block where it ends is walked bracket by bracket.
+    """
+    start = position
+    size = len(buffer)
+    depth = 1
+    position += 1
+    block = _FIRST_BLOCK
+    while position < size:
+        end = min(position + block, size)
+        chunk = buffer[position:end]
+        if b"\\" in chunk:
+            # same length, so offsets in the chunk stay offsets in the buffer
+            chunk = _ESCAPE.sub(b"  ", chunk)
+            if chunk.endswith(b"\\"):
+                chunk = chunk[:-1]
+        if chunk.count(b'"') % 2:
+            # cut before the string which goes on past the block
+            chunk = chunk[: chunk.rfind(b'"')]
+            if not chunk:
+                string = _STRING.match(buffer, position)
+                if string is None:
+                    break
+                position = string.end()
+                continue
+        end = position + len(chunk)
+
+        # most strings have no brackets, remove them without a regular expression
+        brackets = chunk.translate(None, _NOT_STRUCTURE).replace(b'""', b"")
+        if b'"' in brackets:
+            brackets = _QUOTED.sub(b"", brackets)
+        while True:
+            unmatched = brackets.replace(b"[]", b"").replace(b"{}", b"")
+            if len(unmatched) == len(brackets):
+                break
+            brackets = unmatched
+        closes = len(brackets) - len(brackets.lstrip(_CLOSE))
+        if closes < depth:
+            depth += len(brackets) - 2 * closes
+            position = end
+            block = min(2 * block, _MAX_BLOCK)
+        elif block > _FIRST_BLOCK:
+            # the container ends in this block, look for it in smaller ones
+            block = _FIRST_BLOCK
+        else:
+            for match in _STRUCTURE.finditer(buffer, position, end):
+                token = buffer[match.start() : match.start() + 1]
+                if token in _OPEN:
+                    depth += 1
+                elif token in _CLOSE:
+                    depth -= 1
+                    if depth == 0:
+                        return match.end()
+            break
+    raise InvalidJson(f"Unclosed {buffer[start:start + 1].decode()} at byte {start}")
+
+
+def _value_end(buffer: Any, position: int) -> int:
+    """Find where the value starting at `position` ends, without parsing it"""
+    first = buffer[position : position + 1]
+    if first and first in _OPEN:
+        return _container_end(buffer, position)
+    scalar = _STRING.match(buffer, position) if first == b'"' else _SCALAR.match(buffer, position)
+    if scalar is None:
+        raise InvalidJson(f"Expected a value at byte {position}")
+    return scalar.end()
+
+
+def _format_size(size: int) -> str:
+    if size < 1000:
+        return f"{size} bytes"
+    value = size / 1000
+    for unit in ("kB", "MB"):
+        if value < 1000:
+            return f"{value:.1f} {unit}"
+        value /= 1000
+    return f"{value:.1f} GB"
+
+
+class _Node:
+    """A value of the document, known by its offsets until it is expanded"""
+
+    __slots__ = ("label", "start", "end", "depth", "expanded", "children", "next_child", "line")
+
+    def __init__(self, label: str | None, start: int, end: int, depth: int) -> None:
+        self.label = label
+        self.start = start
+        self.end = end
+        self.depth = depth
+        self.expanded = False
+        self.children: list[_Node] = []
+        # offset of the next child to scan, None once all the children are scanned
+        self.next_child: int | None = start + 1
+        self.line: Strip | None = None
+
+
+class _Stub:
+    """A row which is not a value: more children to scan, or an error. An error on the whole document has no parent"""
+
+    __slots__ = ("parent", "depth", "text", "line")
+
+    def __init__(self, parent: _Node | None, text: str) -> None:
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.text = text
+        self.line: Strip | None = None
+
+
+_Row = Union[_Node, _Stub]
+
+
+class JsonView(NavigableView):
+    """An explorer for JSON documents of any size, one row per value.
+
+    The file is memory-mapped and never parsed as a whole. A container is only known by its offsets until it is
+    expanded, then its children are scanned a page at a time; skipping over a child scans its bytes with regular
+    expressions, without building it. The rows shown are kept in a flat list, so expanding or collapsing a container
+    only costs the rows it adds or removes, and only the rows in the viewport are drawn.
+
+    Brackets are matched but the document is not validated: it is an explorer, not a parser.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "toggle_cursor", "expand", show=False),
+    ]
+    """
+    | Key(s) | Description |
+    | :- | :- |
+    | enter | Expand or collapse the value under the cursor, or show more of its parent. |
+    """
+
+    page_size: int = 100
+    """Number of children of a container scanned at once."""
+    max_preview: int = 200
+    """Maximum number of bytes of a value shown."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        enable_cursor: bool = True,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a JsonView widget.
+
+        Args:
+            path: The JSON file to show, or `None` to open one later with `open`.
+            enable_cursor: Enable cursor which name this view navigable. This also make this view focusable.
+            name: The name of the view.
+            id: The ID of the view in the DOM.
+            classes: The CSS classes of the view.
+            disabled: Whether the view is disabled or not.
+        """
+        super().__init__(disable_cursor=not enable_cursor, name=name, id=id, classes=classes, disabled=disabled)
+        self._path = path
+        self._file: Any = None
+        self._buffer: Any = b""
+        self._rows: list[_Row] = []
+        self._max_width = 0
+
+    def on_mount(self) -> None:
+        if self._path is not None and self._file is None:
+            self.open(self._path)
+
+    def on_unmount(self) -> None:
+        self.close()
+
+    def open(self, path: str | os.PathLike[str]) -> JsonView:
+        """Show a JSON file, closing the one shown before. The root value is expanded.
+
+        Returns:
+            The `JsonView` instance.
+        """
+        self.close()
+        self._path = path
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._max_width = 0
+        start = _skip_whitespace(self._buffer, 0)
+        if start >= len(self._buffer):
+            self._replace(0, len(self._rows), [_Stub(None, "⚠ The document is empty")])
+        else:
+            # the end of the root is not needed, finding it would scan the whole document
+            root = _Node(None, start, len(self._buffer), 0)
+            self._rows = [root]
+            self._measure([root])
+            self.toggle(0)
+        self.scroll_home(animate=False)
+        return self
+
+    def close(self) -> JsonView:
+        """Stop showing the file.
+
+        Returns:
+            The `JsonView` instance.
+        """
+        self._rows = []
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = b""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._update_size()
+        return self
+
+    def line_count(self) -> int:
+        return len(self._rows)
+
+    def line_width(self, y: int) -> int:
+        _, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        if not 0 <= index < len(self._rows):
+            return 0
+        return self._row_line(self._rows[index]).cell_length
+
+    def action_toggle_cursor(self) -> None:
+        """Expand or collapse the value under the cursor, or show more of its parent."""
+        if self.cursor_disabled:
+            return
+        _, scroll_y = self.scroll_offset
+        self.toggle(scroll_y + self.cursor_position.y)
+
+    def toggle(self, line: int) -> bool:
+        """Expand or collapse the container at row `line`, or scan more children if it is a "more" row.
+
+        Returns:
+            True if the rows changed.
+        """
+        if not 0 <= line < len(self._rows):
+            return False
+        row = self._rows[line]
+        if isinstance(row, _Stub):
+            if row.parent is None or row.parent.next_child is None:
+                return False
+            added = self._scan_children(row.parent)
+            self._replace(line, line + 1, added)
+        elif not self._is_container(row):
+            return False
+        elif row.expanded:
+            row.expanded = False
+            end = line + 1
+            while end < len(self._rows) and self._rows[end].depth > row.depth:
+                end += 1
+            self._replace(line + 1, end, [])
+        else:
+            row.expanded = True
+            if not row.children and row.next_child is not None:
+                added = self._scan_children(row)
+            else:
+                added = list(self._visible_children(row))
+            self._replace(line + 1, line + 1, added)
+        row.line = None
+        return True
+
+    def _is_container(self, node: _Node) -> bool:
+        return self._buffer[node.start : node.start + 1] in (b"[", b"{")
+
+    def _visible_children(self, node: _Node) -> list[_Row]:
+        """The rows below an expanded container whose children were scanned before"""
+        rows: list[_Row] = []
+        for child in node.children:
+            rows.append(child)
+            if child.expanded:
+                rows.extend(self._visible_children(child))
+        if node.next_child is not None:
+            rows.append(_Stub(node, "… more"))
+        return rows
+
+    def _scan_children(self, node: _Node) -> list[_Row]:
+        """Scan the next page of children of a container, and get the rows to add for them"""
+        buffer = self._buffer
+        is_object = buffer[node.start : node.start + 1] == b"{"
+        close = b"}" if is_object else b"]"
+        position = node.next_child
+        assert position is not None
+        children: list[_Row] = []
+        try:
+            while len(children) < self.page_size:
+                position = _skip_whitespace(buffer, position)
+                first = buffer[position : position + 1]
+                if not first:
+                    raise InvalidJson(f"Unclosed {buffer[node.start:node.start + 1].decode()} at byte {node.start}")
+                if first == close:
+                    node.next_child = None
+                    break
+                if is_object:
+                    key = _STRING.match(buffer, position)
+                    if key is None:
+                        raise InvalidJson(f"Expected a key at byte {position}")
+                    try:
+                        label = json.loads(buffer[key.start() : key.end()])
+                    except ValueError:
+                        # the key pattern lets through escapes which JSON rejects
+                        raise InvalidJson(f"Invalid key at byte {position}") from None
+                    position = _skip_whitespace(buffer, key.end())
+                    if buffer[position : position + 1] != b":":
+                        raise InvalidJson(f"Expected ':' at byte {position}")
+                    position = _skip_whitespace(buffer, position + 1)
+                else:
+                    label = str(len(node.children))
+                child = _Node(label, position, _value_end(buffer, position), node.depth + 1)
+                node.children.append(child)
+                children.append(child)
+                position = _skip_whitespace(buffer, child.end)
+                if buffer[position : position + 1] == b",":
+                    position += 1
+                node.next_child = position
+        except InvalidJson as error:
+            node.next_child = None
+            children.append(_Stub(node, f"⚠ {error}"))
+        if node.next_child is not None:
+            children.append(_Stub(node, "… more"))
+        return children
+
+    def _replace(self, start: int, end: int, rows: list[_Row]) -> None:
+        self._rows[start:end] = rows
+        self._measure(rows)
+        self._update_size()
+        self.refresh()
+
+    def _measure(self, rows: list[_Row]) -> None:
+        for row in rows:
+            self._max_width = max(self._max_width, self._row_line(row).cell_length)
+
+    def _update_size(self) -> None:
+        self.virtual_size = Size(self._max_width, len(self._rows))
+
+    def _row_line(self, row: _Row) -> Strip:
+        if row.line is not None:
+            return row.line
+        indent = Segment("  " * row.depth)
+        if isinstance(row, _Stub):
+            row.line = Strip([indent, Segment(row.text, _SUMMARY_STYLE)])
+            return row.line
+
+        buffer = self._buffer
+        segments = [indent]
+        if self._is_container(row):
+            segments.append(Segment("▼ " if row.expanded else "▶ "))
+        if row.label is not None:
+            segments.append(Segment(row.label.translate(CONTROL_CHARACTERS), self._style("json.key")))
+            segments.append(Segment(": "))
+        first = buffer[row.start : row.start + 1]
+        if first in (b"[", b"{"):
+            brackets = "{…}" if first == b"{" else "[…]"
+            segments.append(Segment(f"{brackets} {_format_size(row.end - row.start)}", _SUMMARY_STYLE))
+        else:
+            end = min(row.end, row.start + self.max_preview)
+            text = buffer[row.start : end].decode("utf-8", errors="replace").translate(CONTROL_CHARACTERS)
+            if end < row.end:
+                text += "…"
+            segments.append(Segment(text, self._style(self._scalar_style(first, text))))
+        row.line = Strip(segments)
+        return row.line
+
+    @staticmethod
+    def _scalar_style(first: bytes, text: str) -> str:
+        if first == b'"':
+            return "json.str"
+        return _KEYWORD_STYLES.get(text, "json.number")
+
+    def _style(self, name: str) -> Style:
+        return self.app.console.get_style(name, default="")
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        index = scroll_y + y
+        if not 0 <= index < len(self._rows):
+            return Strip.blank(width, self.rich_style)
+        strip = self.add_cursor(y, self._row_line(self._rows[index]).crop(scroll_x, scroll_x + width))
+        return strip.apply_style(self.rich_style)
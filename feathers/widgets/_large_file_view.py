@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+from array import array
+from time import monotonic
+from typing import Any
+
+from rich.segment import Segment
+from textual._cache import LRUCache
+from textual.geometry import Size
+from textual.strip import Strip
+
+from feathers.utils import CONTROL_CHARACTERS
+from feathers.utils import numpy as _numpy
+
+from ._nav_view import NavigableView
+
+# a tab is expanded to at most this many more cells than its byte
+_TAB_EXTRA_CELLS = 7
+
+
+class LargeFileView(NavigableView):
+    """A view of a text file of any size, one row per line.
+
+    The file is memory-mapped and only the visible lines are decoded. The offsets of the lines are found in chunks:
+    the first chunk right away, so the first screen shows at once, the rest in a background thread. The newline scan
+    is vectorised when numpy is installed.
+
+    The scrollable width is found while indexing, without decoding the lines: it is their length in bytes, with room
+    for their tabs to be expanded. No line is ever clipped, but the width is more than the widest line when the
+    widest lines have multibyte characters.
+
+    Attributes:
+        chunk_size: Bytes scanned for newlines per chunk
+        first_chunk_size: Bytes scanned when the file is opened, before the view is shown
+    """
+
+    chunk_size: int = 16 * 1024 * 1024
+    first_chunk_size: int = 1024 * 1024
+    index_refresh: float = 0.1
+    """Seconds between updates of the scrollable size while the file is being indexed."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        encoding: str = "utf-8",
+        enable_cursor: bool = False,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a LargeFileView widget.
+
+        Args:
+            path: The file to show, or `None` to open one later with `open`.
+            encoding: The encoding of the file. Bytes which can not be decoded are replaced.
+            enable_cursor: Enable cursor which name this view navigable. This also make this view focusable.
+            name: The name of the view.
+            id: The ID of the view in the DOM.
+            classes: The CSS classes of the view.
+            disabled: Whether the view is disabled or not.
+        """
+        super().__init__(disable_cursor=not enable_cursor, name=name, id=id, classes=classes, disabled=disabled)
+        self.encoding = encoding
+        self._path = path
+        self._file: Any = None
+        self._mmap: mmap.mmap | None = None
+        self._file_size = 0
+        # offset of the start of each line, the last one is where the next line starts
+        self._offsets = array("q", [0])
+        self._indexed = 0
+        self._max_width = 0
+        # tabs found after the last newline, on the line still being indexed
+        self._open_line_tabs = 0
+        self._indexer: threading.Thread | None = None
+        self._stop_indexing = threading.Event()
+        self._lines: LRUCache[int, Strip] = LRUCache(1024)
+
+    @property
+    def is_indexed(self) -> bool:
+        """True once all the lines of the file are found"""
+        return self._indexed >= self._file_size
+
+    @property
+    def indexed_bytes(self) -> int:
+        return self._indexed
+
+    def on_mount(self) -> None:
+        if self._path is not None and self._mmap is None:
+            self.open(self._path)
+
+    def on_unmount(self) -> None:
+        self.close()
+
+    def open(self, path: str | os.PathLike[str]) -> LargeFileView:
+        """Show a file, closing the one shown before.
+
+        Returns:
+            The `LargeFileView` instance.
+        """
+        self.close()
+        self._path = path
+        self._file = open(path, "rb")
+        self._file_size = os.fstat(self._file.fileno()).st_size
+        if self._file_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index_chunk(min(self.first_chunk_size, self._file_size))
+        self._update_size()
+        self.scroll_home(animate=False)
+
+        if not self.is_indexed:
+            self._stop_indexing.clear()
+            self._indexer = threading.Thread(target=self._index, name="feathers-file-index", daemon=True)
+            self._indexer.start()
+        return self
+
+    def close(self) -> LargeFileView:
+        """Stop showing the file.
+
+        Returns:
+            The `LargeFileView` instance.
+        """
+        if self._indexer is not None:
+            self._stop_indexing.set()
+            self._indexer.join()
+            self._indexer = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._file_size = 0
+        self._offsets = array("q", [0])
+        self._indexed = 0
+        self._max_width = 0
+        self._open_line_tabs = 0
+        self._lines.clear()
+        self._update_size()
+        return self
+
+    def _index(self) -> None:
+        last_refresh = monotonic()
+        while not self.is_indexed and not self._stop_indexing.is_set():
+            self._index_chunk(min(self._indexed + self.chunk_size, self._file_size))
+            now = monotonic()
+            if self.is_indexed or now - last_refresh >= self.index_refresh:
+                last_refresh = now
+                self.call_later(self._update_size)
+
+    def _index_chunk(self, end: int) -> None:
+        """Find the lines starting up to `end`, carrying on from where the last chunk stopped"""
+        assert self._mmap is not None
+        start = self._indexed
+        offsets = self._offsets
+        if _numpy is not None:
+            chunk = _numpy.frombuffer(self._mmap, dtype=_numpy.uint8, count=end - start, offset=start)
+            newlines = _numpy.flatnonzero(chunk == 10)
+            # number of tabs on each line ending in the chunk, then on the line left open at its end
+            tabs = _numpy.bincount(
+                _numpy.searchsorted(newlines, _numpy.flatnonzero(chunk == 9)), minlength=len(newlines) + 1
+            )
+            tabs[0] += self._open_line_tabs
+            if len(newlines):
+                found = newlines + (start + 1)
+                widths = _numpy.diff(found, prepend=offsets[-1]) - 1 + _TAB_EXTRA_CELLS * tabs[:-1]
+                self._max_width = max(self._max_width, int(widths.max()))
+                offsets.frombytes(found.astype("<i8").tobytes())
+            self._open_line_tabs = int(tabs[-1])
+        else:
+            data = self._mmap
+            # counting the tabs needs a copy of each line, only worth it if there are tabs
+            has_tabs = data.find(b"\t", start, end) != -1
+            position = data.find(b"\n", start, end)
+            max_width = self._max_width
+            open_line_tabs = self._open_line_tabs
+            while position != -1:
+                line_start = offsets[-1]
+                width = position - line_start + _TAB_EXTRA_CELLS * open_line_tabs
+                open_line_tabs = 0
+                if has_tabs:
+                    width += _TAB_EXTRA_CELLS * data[max(line_start, start) : position].count(b"\t")
+                max_width = max(max_width, width)
+                offsets.append(position + 1)
+                position = data.find(b"\n", position + 1, end)
+            if has_tabs:
+                open_line_tabs += data[max(offsets[-1], start) : end].count(b"\t")
+            self._max_width = max_width
+            self._open_line_tabs = open_line_tabs
+        if end >= self._file_size:
+            last_width = self._file_size - offsets[-1] + _TAB_EXTRA_CELLS * self._open_line_tabs
+            self._max_width = max(self._max_width, last_width)
+        self._indexed = end
+
+    def _update_size(self) -> None:
+        self.virtual_size = Size(self._max_width, self.line_count())
+
+    def line_count(self) -> int:
+        count = len(self._offsets) - 1
+        if self.is_indexed and self._offsets[-1] < self._file_size:
+            # the last line has no newline
+            count += 1
+        return count
+
+    def line_width(self, y: int) -> int:
+        _, scroll_y = self.scroll_offset
+        line = self._line(scroll_y + y)
+        return 0 if line is None else line.cell_length
+
+    def _line(self, index: int) -> Strip | None:
+        """Decode the line at `index`, or get None if it is not indexed"""
+        line = self._lines.get(index)
+        if line is not None:
+            return line
+        if not 0 <= index < self.line_count() or self._mmap is None:
+            return None
+
+        start = self._offsets[index]
+        end = self._offsets[index + 1] - 1 if index + 1 < len(self._offsets) else self._file_size
+        text = self._mmap[start:end].decode(self.encoding, errors="replace").rstrip("\r").expandtabs()
+        text = text.translate(CONTROL_CHARACTERS)
+        line = Strip([Segment(text)]) if text else Strip.blank(0)
+        self._lines[index] = line
+        return line
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        line = self._line(scroll_y + y)
+        if line is None:
+            return Strip.blank(width, self.rich_style)
+        strip = self.add_cursor(y, line.crop(scroll_x, scroll_x + width))
+        return strip.apply_style(self.rich_style)
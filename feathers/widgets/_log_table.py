@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from itertools import compress
+from operator import itemgetter
+from typing import ClassVar
+
+from rich.cells import cell_len, set_cell_size
+from rich.segment import Segment
+from textual._cache import LRUCache
+from textual.geometry import Size
+from textual.strip import Strip
+
+from feathers.utils import CONTROL_CHARACTERS, friendly_list
+
+from ._nav_view import NavigableView
+
+_SEPARATOR = "  "
+
+
+class UnknownColumn(Exception):
+    pass
+
+
+def _sort_key(value: str) -> tuple[int, float, str]:
+    """Sort numbers by value, before the other strings. "nan", "inf" and "infinity" are strings, as they are in logs"""
+    try:
+        number = float(value)
+    except ValueError:
+        return (1, 0.0, value)
+    if not math.isfinite(number):
+        # NaN compares false with everything, it would leave the sort order undefined
+        return (1, 0.0, value)
+    return (0, number, "")
+
+
+def _fit(text: str, width: int) -> str:
+    """Pad or truncate `text` to `width` cells"""
+    text = text.translate(CONTROL_CHARACTERS)
+    length = cell_len(text)
+    if length <= width:
+        return text + " " * (width - length)
+    return set_cell_size(text, width - 1) + "…"
+
+
+class _Column:
+    """The values of a column, stored as codes into the list of its distinct values"""
+
+    __slots__ = ("name", "codes", "values", "lookup", "max_width")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.codes = array("I")
+        self.values: list[str] = []
+        self.lookup: dict[str, int] = {}
+        # leave room for the sort marker
+        self.max_width = cell_len(name) + 1
+
+    def intern(self, value: object) -> int:
+        text = value if isinstance(value, str) else str(value)
+        code = self.lookup.get(text)
+        if code is None:
+            code = self.lookup[text] = len(self.values)
+            self.values.append(text)
+            self.max_width = max(self.max_width, cell_len(text))
+        return code
+
+
+class LogTable(NavigableView):
+    """A table of structured log records, for millions of rows.
+
+    Each column is stored as an array of codes into the list of its distinct values, so repeated values (levels,
+    hosts, loggers) are stored once. Column widths come from the widest value seen so far, capped at
+    `max_column_width`. Sorting and filtering only compute a permutation of the row numbers: the values are never
+    copied, and filters are evaluated once per distinct value. Only the visible rows are rendered.
+
+    The first line shows the column names and stays at the top.
+    """
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {"log-table--header"}
+    """
+    | Class | Description |
+    | :- | :- |
+    | `log-table--header` | Target the row of column names. |
+    """
+
+    DEFAULT_CSS = """
+    LogTable > .log-table--header {
+        text-style: bold;
+    }
+    """
+
+    max_column_width: int = 40
+    """Maximum width of a column, longer values are truncated."""
+
+    def __init__(
+        self,
+        columns: Iterable[str],
+        *,
+        enable_cursor: bool = False,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Create a LogTable widget.
+
+        Args:
+            columns: The names of the columns.
+            enable_cursor: Enable cursor which name this view navigable. This also make this view focusable.
+            name: The name of the view.
+            id: The ID of the view in the DOM.
+            classes: The CSS classes of the view.
+            disabled: Whether the view is disabled or not.
+        """
+        super().__init__(disable_cursor=not enable_cursor, name=name, id=id, classes=classes, disabled=disabled)
+        self._columns = [_Column(column) for column in columns]
+        self._column_index = {column.name: index for index, column in enumerate(self._columns)}
+        self._row_count = 0
+        # rows in sorted order, or None for the order they were added in
+        self._order: array[int] | None = None
+        self._sort_column: str | None = None
+        self._sort_reverse = False
+        # column index -> (predicate, whether each distinct value of the column passes it)
+        self._filters: dict[int, tuple[Callable[[str], bool], list[bool]]] = {}
+        # rows shown, in order, or None when there is no filter
+        self._shown: array[int] | None = None
+        self._widths = [min(column.max_width, self.max_column_width) for column in self._columns]
+        self._lines: LRUCache[int, Strip] = LRUCache(1024)
+
+    @property
+    def columns(self) -> list[str]:
+        return [column.name for column in self._columns]
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows, including the ones filtered out"""
+        return self._row_count
+
+    @property
+    def shown_count(self) -> int:
+        """Number of rows passing the filters"""
+        return self._row_count if self._shown is None else len(self._shown)
+
+    def add_row(self, *values: object) -> LogTable:
+        """Add a row, with a value for each column.
+
+        Returns:
+            The `LogTable` instance.
+        """
+        return self.add_rows([values])
+
+    def add_rows(self, rows: Iterable[Sequence[object]]) -> LogTable:
+        """Add rows, each with a value for each column. New rows are shown after the others, even when sorted.
+
+        Returns:
+            The `LogTable` instance.
+        """
+        columns = self._columns
+        rows = list(rows)
+        for row in rows:
+            if len(row) != len(columns):
+                raise ValueError(f"Expected {len(columns)} values, got {len(row)}")
+        # column by column, so each column interns its values in one tight loop
+        for index, column in enumerate(columns):
+            column.codes.extend(map(column.intern, map(itemgetter(index), rows)))
+        first = self._row_count
+        self._row_count += len(rows)
+
+        added = range(first, self._row_count)
+        if self._order is not None:
+            self._order.extend(added)
+        if self._shown is not None:
+            self._shown.extend(self._filtered(added))
+        self._update_size()
+        return self
+
+    def value(self, row: int, column: str) -> str:
+        """Get the value of a cell, `row` being the number of the row in the order it was added"""
+        values = self._columns[self._get_column_index(column)]
+        return values.values[values.codes[row]]
+
+    def row_at(self, line: int) -> int | None:
+        """Get the number of the row shown at content line `line`, in the order it was added"""
+        index = line - 1
+        if not 0 <= index < self.shown_count:
+            return None
+        if self._shown is not None:
+            return self._shown[index]
+        return index if self._order is None else self._order[index]
+
+    def sort(self, column: str | None, *, reverse: bool = False) -> LogTable:
+        """Sort the rows by the values of a column, numbers by value. The sort is stable.
+
+        Args:
+            column: The column to sort by, or `None` to show the rows in the order they were added.
+            reverse: Sort in descending order.
+
+        Returns:
+            The `LogTable` instance.
+        """
+        if column is None:
+            self._order = None
+        else:
+            values = self._columns[self._get_column_index(column)]
+            # rank the distinct values once, then sort the rows by the rank of their value
+            distinct = values.values
+            ranks = [0] * len(distinct)
+            for rank, code in enumerate(sorted(range(len(distinct)), key=lambda code: _sort_key(distinct[code]))):
+                ranks[code] = rank
+            keys = list(map(ranks.__getitem__, values.codes))
+            self._order = array("I", sorted(range(self._row_count), key=keys.__getitem__, reverse=reverse))
+        self._sort_column = column
+        self._sort_reverse = reverse
+        self._refilter()
+        return self
+
+    def filter(self, column: str, predicate: Callable[[str], bool] | None) -> LogTable:
+        """Only show the rows where the value of `column` passes `predicate`, on top of the filters of other columns.
+
+        Args:
+            column: The column to filter on.
+            predicate: Called once per distinct value of the column, or `None` to remove the filter of the column.
+
+        Returns:
+            The `LogTable` instance.
+        """
+        index = self._get_column_index(column)
+        if predicate is None:
+            self._filters.pop(index, None)
+        else:
+            self._filters[index] = (predicate, [])
+        self._refilter()
+        return self
+
+    def _get_column_index(self, column: str) -> int:
+        try:
+            return self._column_index[column]
+        except KeyError:
+            raise UnknownColumn(f"Valid columns are {friendly_list(self.columns)}") from None
+
+    def _filtered(self, rows: Sequence[int]) -> array[int]:
+        filtered = array("I", rows)
+        for index, (predicate, passes) in self._filters.items():
+            values = self._columns[index]
+            # evaluate the predicate on the distinct values added since last time
+            passes.extend(bool(predicate(value)) for value in values.values[len(passes) :])
+            filtered = array("I", compress(filtered, map(passes.__getitem__, map(values.codes.__getitem__, filtered))))
+        return filtered
+
+    def _refilter(self) -> None:
+        rows: Sequence[int] = range(self._row_count) if self._order is None else self._order
+        self._shown = self._filtered(rows) if self._filters else None
+        self._lines.clear()
+        self._update_size()
+        self.refresh()
+
+    def _update_size(self) -> None:
+        widths = [min(column.max_width, self.max_column_width) for column in self._columns]
+        if widths != self._widths:
+            self._widths = widths
+            self._lines.clear()
+            self.refresh()
+        self.virtual_size = Size(self._table_width(), self.shown_count + 1)
+
+    def _table_width(self) -> int:
+        return sum(self._widths) + len(_SEPARATOR) * max(0, len(self._widths) - 1)
+
+    def line_count(self) -> int:
+        return self.shown_count + 1
+
+    def line_width(self, y: int) -> int:
+        return self._table_width()
+
+    def _header(self) -> Strip:
+        names = []
+        for column, width in zip(self._columns, self._widths):
+            name = column.name
+            if column.name == self._sort_column:
+                name += "▼" if self._sort_reverse else "▲"
+            names.append(_fit(name, width))
+        style = self.get_component_rich_style("log-table--header")
+        return Strip([Segment(_SEPARATOR.join(names), style)], self._table_width())
+
+    def _row_line(self, row: int) -> Strip:
+        line = self._lines.get(row)
+        if line is None:
+            cells = (
+                _fit(column.values[column.codes[row]], width) for column, width in zip(self._columns, self._widths)
+            )
+            line = self._lines[row] = Strip([Segment(_SEPARATOR.join(cells))], self._table_width())
+        return line
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        if y == 0:
+            line = self._header()
+        else:
+            row = self.row_at(scroll_y + y)
+            if row is None:
+                return Strip.blank(width, self.rich_style)
+            line = self._row_line(row)
+        strip = self.add_cursor(y, line.crop(scroll_x, scroll_x + width))
+        return strip.apply_style(self.rich_style)
@@ -7,14 +7,16 @@ from rich.repr import Result
 from rich.style import Style
 from textual.binding import Binding, BindingType
 from textual.events import Blur, Focus
-from textual.geometry import Offset
+from textual.geometry import Offset, Region
 from textual.message import Message
 from textual.reactive import reactive
 from textual.scroll_view import ScrollView
 from textual.strip import Strip
 
+from ._component_styles import CachedComponentStyles
 
-class NavigableView(ScrollView, can_focus=True):
+
+class NavigableView(ScrollView, CachedComponentStyles, can_focus=True):
     """A view which can be navigated using a cursor.
 
     This should be used as a base class of other scrollable views.
@@ -154,6 +156,8 @@ class NavigableView(ScrollView, can_focus=True):
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self.cursor_disabled = disable_cursor
+        self._batch_range: tuple[int, int] | None = None
+        self._batched_lines: dict[int, Strip] | None = None
         if disable_cursor:
             NavigableView.BINDINGS.clear()
             self.can_focus = False
@@ -166,8 +170,63 @@ class NavigableView(ScrollView, can_focus=True):
     def line_width(self, y: int) -> int:
         pass
 
+    def render_lines(self, crop: Region) -> list[Strip]:
+        """Render the widget in to lines.
+
+        Textual calls `render_line` for the rows inside `crop` which are not cached. On the first of these calls, the
+        content rows from there to the end of `crop` are resolved in one pass using `render_content_lines`. The row
+        under the cursor is left to `render_line`. Subclasses should return `batched_line(y)` from `render_line` when
+        it is set.
+
+        Args:
+            crop: Region within visible area to render.
+
+        Returns:
+            A list of strips.
+        """
+        gutter_top = self.styles.gutter.top
+        start = max(0, crop.y - gutter_top)
+        end = max(start, min(self.content_region.height, crop.bottom - gutter_top))
+        self._batch_range = (start, end)
+        try:
+            return super().render_lines(crop)
+        finally:
+            self._batch_range = None
+            self._batched_lines = None
+
+    def render_content_lines(self, start: int, end: int) -> list[Strip] | None:
+        """Render the content rows between `start` and `end` (relative to the viewport) in one pass.
+
+        Implement this in a subclass to batch the work of `render_line`. The returned strips are final, styled with
+        the style of the widget. They must not contain the cursor, the style of the widget would go over it, the row
+        under the cursor is rendered by `render_line` instead. Return `None` to render row by row.
+
+        Args:
+            start: First content row to render.
+            end: Row after the last content row to render.
+
+        Returns:
+            A strip per row, or `None`.
+        """
+        return None
+
+    def batched_line(self, y: int) -> Strip | None:
+        """Get the row prepared by `render_lines`, if any. The row under the cursor is never prepared."""
+        if self._batch_range is None or self._has_cursor_at(y):
+            return None
+        if self._batched_lines is None or y not in self._batched_lines:
+            start, end = self._batch_range
+            if not start <= y < end:
+                return None
+            lines = self.render_content_lines(y, end)
+            if lines is None:
+                self._batch_range = None
+                return None
+            self._batched_lines = dict(zip(range(y, end), lines))
+        return self._batched_lines.get(y)
+
     def add_cursor(self, y: int, line: Strip) -> Strip:
-        if self.cursor_position.y != y or self._is_cursor_hidden:
+        if not self._has_cursor_at(y):
             return line
 
         cursor_style = self.get_component_rich_style("navigation-box--cursor")
@@ -188,6 +247,9 @@ class NavigableView(ScrollView, can_focus=True):
         changed_strips[1] = cursor_strip.apply_style(style)
         return Strip.join(changed_strips)
 
+    def _has_cursor_at(self, y: int) -> bool:
+        return self.cursor_position.y == y and not self._is_cursor_hidden
+
     @property
     def _is_cursor_hidden(self) -> bool:
         return self.cursor_disabled or not self._cursor_visible
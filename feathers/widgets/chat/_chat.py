@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from collections import deque
 from enum import Enum
+from time import perf_counter
 from typing import Literal
 
+from textual import events
+
+from feathers.scheduler import IdleTask, get_scheduler
 from feathers.utils import friendly_list
 from feathers.widgets import CachedView
 
@@ -17,6 +22,9 @@ These are the styles that can be used with a [`Chat`][feathers.widgets._chat].
 
 _VALID_CHAT_STYLES = {"minimal"}
 
+# warming up only saves time later, like the prefetch of CachedView
+_WARM_UP_PRIORITY = 0
+
 
 class InvalidChatStyle(Exception):
     """Exception raised if an invalid chat style is used."""
@@ -63,6 +71,8 @@ class Chat(CachedView):
             else:
                 raise InvalidChatStyle(f"Valid chat styles are {friendly_list(_VALID_CHAT_STYLES)}")
         self._renderer = renderer
+        self._unwarmed: deque[ChatEntry] = deque()
+        self._warm_up_task: IdleTask | None = None
 
     def validate_chat_style(self, chat_style: str) -> str:
         """Validate the chat style."""
@@ -73,11 +83,40 @@ class Chat(CachedView):
     def add_chat(self, entry: ChatEntry) -> None:
         self._entries.append(entry)
         renderable = ChatRenderable(self._renderer, entry)
-        self.add_entry(renderable)
+        self.add_entry(renderable, timestamp=entry.timestamp)
+        # entries added while the view is hidden, or before it is mounted, are only rendered later, all at once
+        self._unwarmed.append(entry)
+        self._schedule_warm_up()
+
+    def on_unmount(self, _: events.Unmount) -> None:
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+
+    def _schedule_warm_up(self) -> None:
+        """Let the renderer do ahead of time the work of rendering the entries added, when idle"""
+        if not self._unwarmed or (self._warm_up_task is not None and self._warm_up_task.is_active):
+            return
+
+        def step(budget: float) -> bool:
+            deadline = perf_counter() + budget
+            while self._unwarmed:
+                self._renderer.warm(self._unwarmed.popleft())
+                if perf_counter() >= deadline:
+                    break
+            done = not self._unwarmed
+            if done:
+                self._warm_up_task = None
+            return done
+
+        self._warm_up_task = get_scheduler(self.app).schedule(
+            step, priority=_WARM_UP_PRIORITY, name=f"warm up {self!r}"
+        )
 
     def get_entries(self) -> list[ChatEntry]:
         return self._entries
 
     def clear_all_chats(self) -> None:
         self._entries.clear()
+        self._unwarmed.clear()
         self.clear()
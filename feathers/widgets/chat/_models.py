@@ -31,13 +31,27 @@ class ChatRenderer:
     def render(self, entry: ChatEntry, console: Console, options: ConsoleOptions) -> RenderResult:
         pass
 
+    def warm(self, entry: ChatEntry) -> None:
+        """Do the work of rendering `entry` which does not depend on the widget, ahead of its render.
+
+        Called when the app is idle. Does nothing by default.
+        """
+
 
 class ChatRenderable:
     """An object that supports the console protocol and can render a chat"""
 
+    # the renderers read the styles and size of the widget, which is only safe on the event loop
+    render_on_event_loop = True
+
     def __init__(self, renderer: ChatRenderer, entry: ChatEntry) -> None:
         self._renderer = renderer
         self._entry = entry
 
+    @property
+    def plain(self) -> str:
+        """Plain text of the chat, used as a cheap preview"""
+        return f"{self._entry.participant.name}: {self._entry.message}"
+
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         return self._renderer.render(self._entry, console, options)
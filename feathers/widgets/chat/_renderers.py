@@ -4,6 +4,7 @@ from rich.console import Console, ConsoleOptions, ConsoleRenderable, RenderResul
 from rich.markdown import Markdown
 from rich.style import Style
 from rich.text import Text
+from textual._cache import LRUCache
 from textual.widget import Widget
 
 from feathers.renderables import DividerWithLabel
@@ -40,6 +41,17 @@ class MarkdownChatRenderer(ChatRenderer):
         self._max_width = max_width
         self._prompt_renderable = prompt_renderable
         self._blank_line = Text(style=self._widget.rich_style)
+        # parsed documents by message, parsing is most of the work of rendering an entry and does not depend on width
+        self._documents: LRUCache[str, Markdown] = LRUCache(1024)
+
+    def warm(self, entry: ChatEntry) -> None:
+        self._document(entry.message)
+
+    def _document(self, message: str) -> Markdown:
+        document = self._documents.get(message)
+        if document is None:
+            document = self._documents[message] = Markdown(message, code_theme="github-dark")
+        return document
 
     def render(self, entry: ChatEntry, console: Console, options: ConsoleOptions) -> RenderResult:
         divider_style = self._widget.get_component_rich_style("chat--divider")
@@ -53,5 +65,5 @@ class MarkdownChatRenderer(ChatRenderer):
         )
 
         yield prompt_renderable
-        yield Markdown(entry.message, code_theme="github-dark")
+        yield self._document(entry.message)
         yield self._blank_line
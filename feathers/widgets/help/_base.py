@@ -6,10 +6,11 @@ from rich.text import Text
 from textual.widget import Widget, events
 from textual.widgets import Static
 
+from .._component_styles import CachedComponentStyles
 from ._models import HelpEntry
 
 
-class BaseHelp(Static):
+class BaseHelp(Static, CachedComponentStyles):
     # called by textual
     def _on_resize(self, _: events.Resize) -> None:
         self.__reset(None)
@@ -0,0 +1,25 @@
+import pytest
+
+from feathers.widgets import CachedView
+
+
+@pytest.mark.asyncio
+async def test_component_styles_cached_until_style_update(view_app):
+    """Should resolve component styles again only after a style update, not after a repaint"""
+    app = view_app(CachedView, enable_cursor=True)
+    async with app.run_test() as pilot:
+        view = app.view
+        resolved = []
+        get_component_styles = view.get_component_styles
+        view.get_component_styles = lambda name: resolved.append(name) or get_component_styles(name)
+
+        style = view.get_component_rich_style("navigation-box--cursor")
+        view.refresh()
+        assert view.get_component_rich_style("navigation-box--cursor") is style
+        assert len(resolved) == 1
+
+        view.styles.color = "red"
+        view.notify_style_update()
+        view.get_component_rich_style("navigation-box--cursor")
+        assert len(resolved) == 2
+        await pilot.pause()
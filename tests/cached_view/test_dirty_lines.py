@@ -0,0 +1,70 @@
+import pytest
+
+from feathers.widgets import CachedView
+
+
+async def _rendered_rows(app, pilot, update) -> set:
+    """Apply an update and collect the content rows rendered on the next paint"""
+    rows = set()
+    render_content_lines = app.view.render_content_lines
+
+    def spy(start, end):
+        rows.update(range(start, end))
+        return render_content_lines(start, end)
+
+    app.view.render_content_lines = spy
+    update()
+    await pilot.pause()
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_remove_repaints_rows_below(view_app):
+    """Should repaint only the rows from the removed entry down"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        for i in range(30):
+            app.view.add_entry(f"line {i}", id=str(i))
+        await pilot.pause()
+
+        rows = await _rendered_rows(app, pilot, lambda: app.view.remove_entry("5"))
+
+        assert min(rows) == 5
+        assert app.view.render_line(5).text.startswith("line 6")
+
+
+@pytest.mark.asyncio
+async def test_append_offscreen_repaints_nothing(view_app):
+    """Should not repaint any row when lines are added below the viewport"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        for i in range(30):
+            app.view.add_entry(f"line {i}")
+        await pilot.pause()
+
+        rows = await _rendered_rows(app, pilot, lambda: app.view.add_entry("new line"))
+
+        assert rows == set()
+        assert app.view.virtual_size.height == 31
+
+
+@pytest.mark.asyncio
+async def test_line_cache_keeps_lines_which_did_not_change(view_app):
+    """Should keep the cached lines when lines are added at the end, and drop only the lines changed in place"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        for i in range(5):
+            app.view.add_entry(f"line {i}", id=str(i))
+        await pilot.pause()
+        first, third = app.view.render_line(0), app.view.render_line(2)
+
+        app.view.add_entry("new line")
+        await pilot.pause()
+        assert app.view.render_line(0) is first
+        assert app.view.render_line(2) is third
+
+        app.view._renderables_cache.rerender("2")
+        await pilot.pause()
+        assert app.view.render_line(0) is first
+        assert app.view.render_line(2) is not third
+        assert app.view.render_line(2).text.startswith("line 2")
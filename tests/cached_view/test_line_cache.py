@@ -0,0 +1,70 @@
+import pytest
+
+from feathers.widgets import CachedView
+
+
+@pytest.mark.asyncio
+async def test_line_cache_reused_for_same_key(view_app):
+    """Should return the cached strip when nothing changed"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        for i in range(5):
+            app.view.add_entry(f"line {i}")
+        await pilot.pause()
+
+        first = app.view.render_line(0)
+        assert app.view.render_line(0) is first
+        assert first.text.startswith("line 0")
+
+
+@pytest.mark.asyncio
+async def test_line_cache_invalidated_on_content_change(view_app):
+    """Should re-render lines once the cache content changes"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        app.view.add_entry("first", id="first")
+        app.view.add_entry("second")
+        await pilot.pause()
+        assert app.view.render_line(0).text.startswith("first")
+
+        app.view.remove_entry("first")
+        await pilot.pause()
+        assert app.view.render_line(0).text.startswith("second")
+
+
+@pytest.mark.asyncio
+async def test_line_cache_invalidated_on_style_update(view_app):
+    """Should re-render lines after a style update"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        app.view.add_entry("line")
+        await pilot.pause()
+
+        first = app.view.render_line(0)
+        app.view.notify_style_update()
+        assert app.view.render_line(0) is not first
+
+
+@pytest.mark.asyncio
+async def test_cursor_keeps_its_colours_over_the_widget_style(view_app):
+    """Should show the colours of the cursor on the cursor cell, not those of the widget"""
+    css = """
+    CachedView { background: blue; color: white; }
+    CachedView > .navigation-box--cursor { background: red; color: yellow; text-style: none; }
+    """
+    app = view_app(CachedView, auto_scroll=False, enable_cursor=True, css=css)
+    async with app.run_test() as pilot:
+        for i in range(5):
+            app.view.add_entry(f"line {i}")
+        app.view.focus()
+        await pilot.press("down")
+
+        cursor_style = app.view.get_component_rich_style("navigation-box--cursor")
+        widget_style = app.view.rich_style
+        assert cursor_style.bgcolor != widget_style.bgcolor
+
+        cursor, rest = app.view.render_line(1).divide([1, 40])
+        assert [(segment.style.color, segment.style.bgcolor) for segment in cursor] == [
+            (cursor_style.color, cursor_style.bgcolor)
+        ]
+        assert all(segment.style.bgcolor == widget_style.bgcolor for segment in rest)
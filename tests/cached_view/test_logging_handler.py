@@ -0,0 +1,75 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from feathers.logging_handler import CachedViewHandler
+from feathers.widgets import CachedView
+
+
+@pytest.mark.asyncio
+async def test_records_from_threads_are_shown_in_batches(view_app):
+    """Should show the records at or above the level, with their fields, and count the dropped ones"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        handler = CachedViewHandler(app.view, logging.INFO, fields=["user"], maxsize=1000)
+        logger = logging.getLogger("feathers.test")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        try:
+
+            def work() -> None:
+                for i in range(2000):
+                    logger.info("request %d", i, extra={"user": "ada"})
+                    logger.debug("hidden")
+
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            logger.warning("done")
+            for _ in range(100):
+                if not len(handler.channel):
+                    break
+                await pilot.pause(0.02)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        cache = app.view._renderables_cache
+        assert handler.dropped + len(cache._all_renderables) == 8001
+        assert handler.dropped > 0
+        text = "".join(cache.strip_at(line).text for line in range(len(cache)))
+        assert text.rstrip().endswith(" WARNING feathers.test: done")
+        assert "user=ada" in text and "hidden" not in text
+
+
+@pytest.mark.asyncio
+async def test_flush_of_a_full_queue_is_bounded(view_app):
+    """Should show only what fits in the budget of a batch when the queue is full, dropping the oldest records"""
+    app = view_app(CachedView)
+    async with app.run_test():
+        handler = CachedViewHandler(budget=0.01)
+        logger = logging.getLogger("feathers.test.flood")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(12_000):
+                logger.warning("request %d", i)
+            handler.attach(app.view)
+
+            start = time.perf_counter()
+            handler.channel.flush()
+            elapsed = time.perf_counter() - start
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        shown = list(app.view._renderables_cache._all_renderables.values())
+        assert 0 < len(shown) < 1_000
+        assert handler.dropped == 2_000
+        assert elapsed < 0.2
+        assert shown[0].renderableType.plain.endswith("request 2000")
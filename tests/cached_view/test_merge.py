@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from feathers.merge import StreamMerger
+from feathers.widgets import CachedView
+
+
+async def _records(timestamps, delay=0.0):
+    for timestamp in timestamps:
+        if delay:
+            await asyncio.sleep(delay)
+        yield timestamp, f"t={timestamp}"
+
+
+@pytest.mark.asyncio
+async def test_sources_are_merged_in_timestamp_order(view_app):
+    """Should write the records of all the sources in timestamp order, tagged with their source"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        merger = StreamMerger(app.view, reorder_window=10)
+        merger.add_source("even", _records(range(0, 200, 2)), color="green")
+        merger.add_source("odd", _records(range(1, 200, 2)), color="blue")
+        # a little late against the others, but in the reorder window
+        merger.add_source("late", _records([0.5, 99.5], delay=0.01))
+        await merger.wait()
+        while merger._heads:
+            await pilot.pause(0.02)
+        merger.close()
+
+        cache = app.view._renderables_cache
+        assert merger.merged == len(cache._all_renderables) == 202
+        assert merger.late == 0
+        assert [entry.timestamp for entry in cache._all_renderables.values()][:4] == [0, 0.5, 1, 2]
+        assert next(iter(cache._all_renderables.values())).renderableType.plain == "even t=0"
+
+
+@pytest.mark.asyncio
+async def test_paused_source_is_held_back(view_app):
+    """Should merge the other sources without a paused one, and write its records once resumed"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        merger = StreamMerger(app.view, reorder_window=0.05)
+        merger.add_source("a", _records([1, 2, 3]))
+        merger.add_source("b", _records([4, 5, 6]))
+        merger.pause("a")
+        await pilot.pause(0.2)
+        cache = app.view._renderables_cache
+        assert [entry.timestamp for entry in cache._all_renderables.values()] == [4, 5, 6]
+
+        merger.resume("a")
+        await merger.wait()
+        await pilot.pause(0.1)
+        merger.close()
+        assert [entry.timestamp for entry in cache._all_renderables.values()] == [4, 5, 6, 1, 2, 3]
+        assert merger.late == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_is_bounded_by_the_budget(view_app):
+    """Should write only what fits in the budget of a batch, and the other ready records in the next batches"""
+    app = view_app(CachedView)
+    async with app.run_test():
+        merger = StreamMerger(app.view, max_pending=10_000, budget=0.01, interval=60)
+        merger.add_source("even", _records(range(0, 10_000, 2)))
+        merger.add_source("odd", _records(range(1, 10_000, 2)))
+        await merger.wait()
+
+        merger.flush()
+        assert 0 < merger.merged < 1_000
+
+        while merger._heads:
+            merger.flush()
+        merger.close()
+        cache = app.view._renderables_cache
+        assert [entry.timestamp for entry in cache._all_renderables.values()] == list(range(10_000))
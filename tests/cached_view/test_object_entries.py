@@ -0,0 +1,41 @@
+import pytest
+from rich.pretty import Pretty
+
+from feathers.renderables import LazyPretty
+from feathers.widgets import CachedView
+
+
+@pytest.mark.asyncio
+async def test_enter_expands_object_under_cursor(view_app):
+    """Should show objects as a bounded tree and expand the part under the cursor on enter"""
+    app = view_app(CachedView, enable_cursor=True, auto_scroll=False)
+    async with app.run_test() as pilot:
+        view = app.view
+        view.add_entry({"numbers": list(range(1000)), "name": "feathers"})
+        view.focus()
+        await pilot.pause()
+        assert len(view._renderables_cache) == 3
+
+        await pilot.press("down", "enter")
+        await pilot.pause()
+        assert len(view._renderables_cache) == 24
+        assert view._renderables_cache.strip_at(2).text.strip() == "0"
+
+        await pilot.press("enter")
+        await pilot.pause()
+        assert len(view._renderables_cache) == 3
+
+
+@pytest.mark.asyncio
+async def test_small_objects_are_pretty_printed(view_app):
+    """Should pretty print small objects in full, and only show objects over `lazy_pretty_items` lazily"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        view = app.view
+        view.add_entry({"name": "feathers", "tags": [{"id": 1}, {"id": 2}]}, id="small")
+        view.add_entry({"values": [list(range(300)), list(range(300))]}, id="large")
+        await pilot.pause()
+
+        cache = view._renderables_cache
+        assert isinstance(cache.get("small").renderableType, Pretty)
+        assert isinstance(cache.get("large").renderableType, LazyPretty)
@@ -0,0 +1,53 @@
+import sys
+
+import pytest
+from rich.text import Text
+
+from feathers.process import ProcessStream
+from feathers.widgets import CachedView
+
+SCRIPT = """
+import sys
+for i in range(2000):
+    print("out", i)
+print("oops", file=sys.stderr)
+sys.stdout.write("no newline")
+"""
+
+
+@pytest.mark.asyncio
+async def test_attach_process_streams_lines_in_batches(view_app):
+    """Should write every line of stdout and stderr, styled by stream, while holding back reads over the limit"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        view = app.view
+        batches = []
+        add_entries = view.add_entries
+        view.add_entries = lambda contents, **kwargs: batches.append(list(contents)) or add_entries(batches[-1])
+
+        stream = await view.attach_process(sys.executable, "-c", SCRIPT, max_pending=100)
+        assert await stream.wait() == 0
+        while stream._timer is not None:
+            await pilot.pause(0.02)
+
+        lines = [entry for batch in batches for entry in batch]
+        assert stream.lines == len(lines) == 2002
+        assert len(batches) < len(lines)
+        assert stream.read_pauses > 0
+        stdout = [line.plain for line in lines if line.style != "red"]
+        assert stdout[0] == "out 0" and stdout[-1] == "no newline"
+        assert [line.plain for line in lines if line.style == "red"] == ["oops"]
+
+
+@pytest.mark.asyncio
+async def test_flush_is_bounded_by_the_budget(view_app):
+    """Should write only what fits in the budget of a batch when a chatty process is far ahead"""
+    app = view_app(CachedView)
+    async with app.run_test():
+        stream = ProcessStream(app.view, budget=0.01)
+        stream._pending.extend(Text(f"line {i}") for i in range(10_000))
+
+        stream.flush()
+
+        assert 0 < app.view.line_count() < 1_000
+        assert len(stream._pending) == 10_000 - app.view.line_count()
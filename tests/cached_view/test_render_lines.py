@@ -0,0 +1,62 @@
+import pytest
+from textual.widget import Widget
+
+from feathers.widgets import CachedView
+
+
+@pytest.mark.asyncio
+async def test_render_lines_matches_row_by_row(view_app):
+    """Should render the same lines in one pass as row by row"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        for i in range(30):
+            app.view.add_entry(f"line {i}")
+        await pilot.pause()
+        app.view.scroll_to(y=7, animate=False)
+        await pilot.pause()
+
+        region = app.view.size.region
+        batched = app.view.render_lines(region)
+        app.view._line_cache.clear()
+        app.view._styles_cache.clear()
+        row_by_row = Widget.render_lines(app.view, region)
+
+        assert [strip.text for strip in batched] == [strip.text for strip in row_by_row]
+        assert batched[0].text.startswith("line 7")
+
+
+@pytest.mark.asyncio
+async def test_render_lines_adds_cursor_to_one_row(view_app):
+    """Should style only the row under the cursor"""
+    app = view_app(CachedView, auto_scroll=False, enable_cursor=True)
+    async with app.run_test() as pilot:
+        for i in range(5):
+            app.view.add_entry(f"line {i}")
+        app.view.focus()
+        await pilot.press("down")
+
+        cursor_style = app.view.get_component_rich_style("navigation-box--cursor")
+        lines = app.view.render_lines(app.view.size.region)
+        rows_with_cursor = [y for y, line in enumerate(lines) if any(s.style == cursor_style for s in line)]
+        assert rows_with_cursor == [1]
+
+
+@pytest.mark.asyncio
+async def test_render_lines_keeps_the_cursor_colours(view_app):
+    """Should show the colours of the cursor on the cursor cell when the rows are rendered in one pass"""
+    css = """
+    CachedView { background: blue; color: white; }
+    CachedView > .navigation-box--cursor { background: red; color: yellow; text-style: none; }
+    """
+    app = view_app(CachedView, auto_scroll=False, enable_cursor=True, css=css)
+    async with app.run_test() as pilot:
+        for i in range(5):
+            app.view.add_entry(f"line {i}")
+        app.view.focus()
+        await pilot.press("down")
+
+        cursor_style = app.view.get_component_rich_style("navigation-box--cursor")
+        lines = app.view.render_lines(app.view.size.region)
+        cells = [(segment.style.color, segment.style.bgcolor) for line in lines for segment in line.divide([1])[0]]
+        assert cells.count((cursor_style.color, cursor_style.bgcolor)) == 1
+        assert cells[1] == (cursor_style.color, cursor_style.bgcolor)
@@ -0,0 +1,18 @@
+import pytest
+
+from feathers.widgets import CachedView
+
+
+@pytest.mark.asyncio
+async def test_scroll_to_time(view_app):
+    """Should scroll to the first entry at or after the given time"""
+    app = view_app(CachedView, auto_scroll=False)
+    async with app.run_test() as pilot:
+        for i in range(50):
+            app.view.add_entry(f"line {i}", timestamp=i * 10.0)
+        await pilot.pause()
+
+        assert app.view.scroll_to_time(205.0)
+        assert app.view.scroll_offset.y == 21
+        assert not app.view.scroll_to_time(1000.0)
+        assert len(app.view.ids_between_times(100.0, 200.0)) == 10
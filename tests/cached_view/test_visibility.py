@@ -0,0 +1,32 @@
+import pytest
+
+from feathers.widgets import CachedView
+
+
+@pytest.mark.asyncio
+async def test_hidden_view_keeps_cache(view_app):
+    """Should queue entries while hidden and render only those once shown again"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        view = app.view
+        cache = view._renderables_cache
+        view.add_entries(f"line {i}" for i in range(20))
+        await pilot.pause()
+        assert len(cache) == 20
+
+        view.display = False
+        await pilot.pause()
+        view.add_entries(f"new {i}" for i in range(5))
+        assert cache.is_paused
+        assert len(cache) == 20
+
+        rendered = []
+        render_lines = cache._render_lines
+        cache._render_lines = lambda id, renderable: rendered.append(id) or render_lines(id, renderable)
+
+        view.display = True
+        await pilot.pause()
+        assert not cache.is_paused
+        assert len(cache) == 25
+        assert len(rendered) == 5
+        assert cache.content_width == view.scrollable_content_region.width
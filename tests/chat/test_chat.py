@@ -0,0 +1,26 @@
+import pytest
+
+from feathers.widgets.chat import Chat, ChatEntry, Participant, RendererType
+
+
+@pytest.mark.asyncio
+async def test_markdown_is_parsed_when_idle(view_app, monkeypatch):
+    """Should parse the Markdown of entries added while paused when idle, so that resuming does not parse it"""
+    app = view_app(Chat, RendererType.MARKDOWN, height=20)
+    async with app.run_test() as pilot:
+        chat = app.view
+        chat._renderables_cache.pause()
+        user = Participant("user", color="green")
+        for i in range(50):
+            chat.add_chat(ChatEntry(f"**entry** {i}\n\n- a\n- b", user))
+        while chat._warm_up_task is not None:
+            await pilot.pause(0.02)
+
+        def parse(*_, **__):
+            raise AssertionError("parsed again")
+
+        monkeypatch.setattr("feathers.widgets.chat._renderers.Markdown", parse)
+        chat._renderables_cache.resume()
+        await pilot.pause()
+        assert len(chat._renderables_cache._all_renderables) == 50
+        assert "entry 49" in "".join(strip.text for strip in chat._renderables_cache.strips_between(0, 1000))
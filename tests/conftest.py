@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.message import Message
+from textual.widget import Widget
+
+
+class ViewApp(App):
+    """An app showing a single view, with the id "view", at a fixed size"""
+
+    def __init__(
+        self, view_type: type[Widget], *args: Any, width: int, height: int, css: str = "", **view_kwargs: Any
+    ) -> None:
+        super().__init__()
+        self.CSS = css
+        # the view is made here, some views need the active app when they are created
+        self.view = view_type(*args, id="view", **view_kwargs)
+        self.view.styles.width = width
+        self.view.styles.height = height
+        self.messages: list[Message] = []
+        """The messages posted to the app, including those the view sends up."""
+
+    def compose(self) -> ComposeResult:
+        yield self.view
+
+    def post_message(self, message: Message) -> bool:
+        self.messages.append(message)
+        return super().post_message(message)
+
+
+@pytest.fixture
+def view_app() -> Callable[..., ViewApp]:
+    """Make a `ViewApp` from a view type and its arguments, the view is 40x10 cells unless `width`/`height` are given.
+
+    `css` is added to the stylesheet of the app.
+    """
+
+    def make(
+        view_type: type[Widget], *args: Any, width: int = 40, height: int = 10, css: str = "", **view_kwargs: Any
+    ) -> ViewApp:
+        return ViewApp(view_type, *args, width=width, height=height, css=css, **view_kwargs)
+
+    return make
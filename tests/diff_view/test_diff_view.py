@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from feathers.widgets import DiffView
+from feathers.widgets._diff_view import _diff
+
+
+def test_diff_rebuilds_the_text_after():
+    """Should give opcodes which turn the text before into the text after"""
+    rng = random.Random(0)
+    for _ in range(200):
+        before = [str(rng.randrange(5)) for _ in range(rng.randrange(80))]
+        after = [line for line in before if rng.random() > 0.1]
+        after.insert(rng.randrange(len(after) + 1), "new")
+        rebuilt = []
+        for tag, i1, i2, j1, j2 in _diff(before, after, window=8):
+            if tag == "equal":
+                assert before[i1:i2] == after[j1:j2]
+            rebuilt.extend(after[j1:j2])
+        assert rebuilt == after
+
+
+@pytest.mark.asyncio
+async def test_unchanged_lines_are_collapsed_and_expandable(view_app):
+    """Should show changes side by side with context, and expand the collapsed unchanged lines"""
+    before = [f"line {i}" for i in range(1000)]
+    after = list(before)
+    after[500] = "changed"
+    app = view_app(DiffView, before, after, width=41)
+    async with app.run_test() as pilot:
+        view = app.view
+        view._worker.join()
+        await pilot.pause()
+
+        assert view.is_computed
+        computed = [message for message in app.messages if isinstance(message, DiffView.Computed)]
+        assert [message.changes for message in computed] == [1]
+        # stub, 3 lines of context, the change, 3 lines of context, stub
+        assert view.line_count() == 9
+        assert view.render_line(0).text.rstrip() == "⋯ 497 unchanged lines"
+        assert view.render_line(4).text == " 501 - line 500     │ 501 + changed      "
+
+        view.focus()
+        await pilot.press("enter")
+        assert view.line_count() == 9 + 496
+        assert view.render_line(0).text.startswith("   1   line 0")
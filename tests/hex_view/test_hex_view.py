@@ -0,0 +1,53 @@
+import pytest
+
+from feathers.widgets import HexView
+
+
+@pytest.mark.asyncio
+async def test_rows_show_hex_and_ascii(tmp_path, view_app):
+    """Should show the offset, hex and printable ASCII of each row, the last row being short"""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"Hello, feathers!\x00\x01\xff\n" + bytes(range(256)))
+    app = view_app(HexView, str(path), width=90)
+    async with app.run_test() as pilot:
+        view = app.view
+        await pilot.pause()
+
+        assert view.line_count() == 18
+        assert view.render_line(0).text == (
+            "00000000  48 65 6c 6c 6f 2c 20 66  65 61 74 68 65 72 73 21 |Hello, feathers!|"
+        )
+        assert view.render_line(1).text.startswith(
+            "00000010  00 01 ff 0a 00 01 02 03  04 05 06 07 08 09 0a 0b |........"
+        )
+
+        view.scroll_end(animate=False)
+        await pilot.pause()
+        assert view.render_line(9).text.rstrip() == "00000110  fc fd fe ff" + " " * 37 + " |....|"
+
+
+@pytest.mark.asyncio
+async def test_cursor_moves_by_byte_and_jumps_to_offsets(tmp_path, view_app):
+    """Should move the cursor one byte at a time across rows and jump to any offset"""
+    path = tmp_path / "big.bin"
+    path.write_bytes(bytes(range(256)) * 4096)
+    app = view_app(HexView, str(path), width=90)
+    async with app.run_test() as pilot:
+        view = app.view
+        view.focus()
+        await pilot.pause()
+
+        for _ in range(17):
+            await pilot.press("right")
+        assert view.cursor_offset == 17
+        await pilot.press("left", "left")
+        assert view.cursor_offset == 15
+
+        view.jump_to(1_000_000)
+        await pilot.pause()
+        assert view.cursor_offset == 1_000_000
+        line = view.render_line(view.cursor_position.y)
+        assert line.text.startswith(f"{1_000_000 // 16 * 16:08x}")
+
+        view.jump_to(10**12)
+        assert view.cursor_offset == view.file_size - 1
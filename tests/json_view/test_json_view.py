@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from feathers.widgets import JsonView
+
+
+def _texts(view) -> list[str]:
+    return [view._row_line(row).text for row in view._rows]
+
+
+@pytest.mark.asyncio
+async def test_expands_lazily_by_pages(tmp_path, view_app):
+    """Should scan the children of a container a page at a time, only when expanded"""
+    path = tmp_path / "doc.json"
+    document = {"name": "feathers", "tags": ["a", "b}", 'c"]'], "items": [{"id": i} for i in range(250)], "ok": True}
+    path.write_text(json.dumps(document, indent=2))
+    app = view_app(JsonView, str(path), width=60)
+    app.view.page_size = 100
+    async with app.run_test() as pilot:
+        view = app.view
+        await pilot.pause()
+        assert _texts(view)[1:] == [
+            '  name: "feathers"',
+            "  ▶ tags: […] 35 bytes",
+            "  ▶ items: […] 7.1 kB",
+            "  ok: true",
+        ]
+        assert view._rows[3].children == []
+
+        assert view.toggle(3)
+        assert view.line_count() == 5 + 100 + 1
+        assert view._row_line(view._rows[4]).text == "    ▶ 0: {…} 21 bytes"
+        assert view._row_line(view._rows[104]).text == "    … more"
+
+        view.toggle(104)
+        view.toggle(204)
+        assert view.line_count() == 5 + 250
+        assert _texts(view)[-1] == "  ok: true"
+
+        view.toggle(2)
+        assert _texts(view)[3:6] == ['    0: "a"', '    1: "b}"', '    2: "c\\"]"']
+
+        view.toggle(6)
+        assert view.line_count() == 5 + 3
+        view.toggle(6)
+        assert view.line_count() == 5 + 3 + 250
+
+
+@pytest.mark.asyncio
+async def test_cursor_expands_and_errors_are_shown(tmp_path, view_app):
+    """Should expand the value under the cursor with enter, and show where a broken document stops"""
+    path = tmp_path / "broken.json"
+    path.write_text('[1, {"a": [2, 3]}, {"b": ')
+    app = view_app(JsonView, str(path), width=60)
+    async with app.run_test() as pilot:
+        view = app.view
+        await pilot.pause()
+        assert _texts(view) == ["▼ […] 25 bytes", "  0: 1", "  ▶ 1: {…} 13 bytes", "  ⚠ Unclosed { at byte 19"]
+
+        view.focus()
+        view.cursor_position = view.cursor_position._replace(y=2)
+        await pilot.press("enter")
+        assert _texts(view)[3] == "    ▶ a: […] 6 bytes"
+
+
+def test_value_end_skips_strings_escapes_and_blocks():
+    """Should find the end of a container across blocks, ignoring brackets in strings and escaped quotes"""
+    from feathers.widgets._json_view import _value_end
+
+    value = [{"text": 'a]}\\"[{' * (i % 500), "nested": [[i], {"k": "\\\\"}]} for i in range(3000)]
+    data = json.dumps(value).encode() + b', "after"'
+    assert _value_end(data, 0) == len(data) - len(b', "after"')
+    inner = data.index(b"[[")
+    assert data[inner : _value_end(data, inner)] == b'[[0], {"k": "\\\\\\\\"}]'
+
+
+@pytest.mark.asyncio
+async def test_invalid_key_and_empty_document_are_shown_as_errors(tmp_path, view_app):
+    """Should show a key with an invalid escape, and an empty document, as errors rather than raise"""
+    path = tmp_path / "bad_key.json"
+    path.write_bytes(b'{"a": 1, "b\\x": 2}')
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"  \n")
+    app = view_app(JsonView, str(path), width=60)
+    async with app.run_test() as pilot:
+        view = app.view
+        await pilot.pause()
+        assert _texts(view) == ["▼ {…} 18 bytes", "  a: 1", "  ⚠ Invalid key at byte 9"]
+
+        view.open(empty)
+        await pilot.pause()
+        assert _texts(view) == ["⚠ The document is empty"]
+        assert not view.toggle(0)
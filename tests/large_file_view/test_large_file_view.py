@@ -0,0 +1,61 @@
+import pytest
+
+from feathers.widgets import LargeFileView
+
+
+@pytest.mark.asyncio
+async def test_indexes_in_background_and_renders_visible_lines(tmp_path, view_app):
+    """Should index the file in chunks and decode only the lines shown"""
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"".join(b"line %d\r\n" % i for i in range(5000)) + b"last\tline\x1b")
+    app = view_app(LargeFileView, str(path))
+    app.view.first_chunk_size = 1024
+    app.view.chunk_size = 4096
+    async with app.run_test() as pilot:
+        view = app.view
+        view._indexer.join()
+        await pilot.pause()
+
+        assert view.is_indexed
+        assert view.line_count() == 5001
+        assert view.virtual_size.height == 5001
+        assert view.render_line(0).text.startswith("line 0")
+        assert len(view._lines) <= 10
+
+        view.scroll_end(animate=False)
+        await pilot.pause()
+        assert view.render_line(9).text.startswith("last    line\N{REPLACEMENT CHARACTER}")
+
+
+@pytest.mark.asyncio
+async def test_empty_file(tmp_path, view_app):
+    """Should show nothing for an empty file"""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    app = view_app(LargeFileView, str(path))
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app.view.is_indexed
+        assert app.view.line_count() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("vectorised", [True, False])
+async def test_width_leaves_room_for_tabs(tmp_path, monkeypatch, vectorised, view_app):
+    """Should make the scrollable width at least the width of every line once its tabs are expanded"""
+    if not vectorised:
+        monkeypatch.setattr("feathers.widgets._large_file_view._numpy", None)
+    lines = ["short", "\t" * 12 + "tabs", "é" * 30, "x" * 20 + "\t" * 6, "\t" * 10 + "end"]
+    path = tmp_path / "tabs.txt"
+    path.write_bytes("\n".join(lines).encode())
+    app = view_app(LargeFileView, str(path))
+    app.view.first_chunk_size = 7
+    app.view.chunk_size = 9
+    async with app.run_test() as pilot:
+        view = app.view
+        view._indexer.join()
+        await pilot.pause()
+
+        widest = max(len(line.expandtabs()) for line in lines)
+        bound = max(len(line.encode()) + 7 * line.count("\t") for line in lines)
+        assert widest <= view.virtual_size.width == bound
@@ -0,0 +1,59 @@
+import pytest
+
+from feathers.widgets import LogTable
+from feathers.widgets._log_table import UnknownColumn
+
+
+@pytest.mark.asyncio
+async def test_sort_and_filter_by_permutation(view_app):
+    """Should sort numbers by value and filter on distinct values, without changing the rows"""
+    app = view_app(LogTable, ["level", "latency", "message"], height=5)
+    async with app.run_test() as pilot:
+        view = app.view
+        view.add_rows([("INFO", 120, "ok"), ("ERROR", 9, "failed"), ("INFO", 30, "ok"), ("DEBUG", 1000, "slow")])
+        await pilot.pause()
+
+        assert view.line_count() == 5
+        assert view.render_line(0).text.startswith("level   latency   message")
+        assert view.render_line(1).text.startswith("INFO    120       ok")
+        assert len(view._columns[0].values) == 3
+
+        view.sort("latency")
+        assert [view.row_at(line) for line in range(1, 5)] == [1, 2, 0, 3]
+        assert view.render_line(0).text.startswith("level   latency▲  message")
+
+        view.filter("level", lambda level: level != "DEBUG")
+        view.add_row("DEBUG", 5, "hidden")
+        view.add_row("WARN", 1, "added")
+        assert view.shown_count == 4
+        assert [view.row_at(line) for line in range(1, 5)] == [1, 2, 0, 5]
+        assert view.row_count == 6
+        assert view.value(5, "message") == "added"
+
+        view.sort(None).filter("level", None)
+        assert [view.row_at(line) for line in range(1, 7)] == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_header_stays_and_long_values_are_truncated(view_app):
+    """Should keep the header at the top when scrolled and truncate values wider than max_column_width"""
+    app = view_app(LogTable, ["id", "message"], height=5)
+    app.view.max_column_width = 10
+    async with app.run_test() as pilot:
+        view = app.view
+        view.add_rows((i, "x" * 20) for i in range(100))
+        view.scroll_end(animate=False)
+        await pilot.pause()
+
+        assert view.render_line(0).text.startswith("id   message")
+        assert view.render_line(4).text.rstrip() == "99   xxxxxxxxx…"
+        with pytest.raises(UnknownColumn):
+            view.sort("time")
+
+
+def test_sort_key_treats_non_finite_numbers_as_text():
+    """Should sort finite numbers by value, and "nan", "inf" and words like "Info" as text after them"""
+    from feathers.widgets._log_table import _sort_key
+
+    values = ["Info", "10", "nan", "-inf", "2.5", "Infinity", "NaN", "-3"]
+    assert sorted(values, key=_sort_key) == ["-3", "2.5", "10", "-inf", "Infinity", "Info", "NaN", "nan"]
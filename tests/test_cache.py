@@ -0,0 +1,335 @@
+import threading
+import time
+
+from rich.console import Console
+from rich.markdown import Markdown
+from rich.text import Text
+from textual.strip import Strip
+
+from feathers.cache import CacheListener, RenderablesCache, RenderableWithOptions
+
+
+def _cache(width: int = 20) -> RenderablesCache:
+    cache = RenderablesCache(Console(width=200))
+    cache.content_width = width
+    return cache
+
+
+def _add(cache: RenderablesCache, id: str, length: int) -> None:
+    cache.add(RenderableWithOptions(Text(id[0] * length), id=id))
+
+
+def test_reflow_renders_given_lines_first():
+    """Should reflow the renderables overlapping the given lines and leave the rest stale"""
+    cache = _cache()
+    for id in ("a", "b", "c"):
+        _add(cache, id, 40)
+    assert len(cache) == 6
+
+    cache.reflow(10, 2, 3)
+
+    assert cache.is_reflowing
+    assert len(cache) == 8
+    assert cache.entry_at(2) == ("b", 0)
+    assert cache.line_of("c") == 6
+
+
+def test_reflow_step_completes_reflow():
+    """Should reflow all the stale renderables in steps"""
+    cache = _cache()
+    for id in ("a", "b", "c"):
+        _add(cache, id, 40)
+
+    cache.reflow(10, 2, 3)
+    while not cache.reflow_step(0):
+        pass
+
+    assert not cache.is_reflowing
+    assert len(cache) == 12
+    assert cache.virtual_size.width == 10
+    assert [cache.line_of(id) for id in ("a", "b", "c")] == [0, 4, 8]
+
+
+def test_reflow_step_after_remove():
+    """Should keep line offsets right if a renderable is removed during a reflow"""
+    cache = _cache()
+    for id in ("a", "b", "c", "d"):
+        _add(cache, id, 40)
+
+    cache.reflow(10, 6, 7)
+    cache.reflow_step(0)
+    cache.remove("b")
+    while not cache.reflow_step(0):
+        pass
+
+    assert len(cache) == 12
+    assert [cache.entry_at(line)[0] for line in (0, 4, 8)] == ["a", "c", "d"]
+
+
+def test_evicts_least_recently_used_strips_over_budget():
+    """Should drop the strips of least recently used renderables but keep their line counts"""
+    cache = RenderablesCache(Console(width=200), byte_budget=3000)
+    cache.content_width = 20
+    for i in range(20):
+        cache.add(RenderableWithOptions(Text(f"{i:02}" * 20), id=str(i)))
+
+    assert cache.evictions > 0
+    assert cache.estimated_bytes <= 3000
+    assert len(cache) == 40
+    assert cache.virtual_size.height == 40
+
+
+def test_renders_evicted_strips_again_on_access():
+    """Should render evicted strips again when they are accessed"""
+    cache = RenderablesCache(Console(width=200), byte_budget=3000)
+    cache.content_width = 20
+    for i in range(20):
+        cache.add(RenderableWithOptions(Text(f"{i:02}" * 20), id=str(i)))
+
+    strips = cache.strips_between(0, 2)
+
+    assert cache.rerenders == 1
+    assert [strip.text for strip in strips] == ["00" * 10, "00" * 10]
+    assert len(cache) == 40
+
+
+def test_reflow_keeps_strips_within_budget():
+    """Should evict again the strips rendered to reflow, keeping the strips of the given lines"""
+    cache = RenderablesCache(Console(width=200), byte_budget=3000)
+    cache.content_width = 40
+    for i in range(200):
+        cache.add(RenderableWithOptions(Text(f"{i:03}" * 20), id=str(i)))
+
+    cache.reflow(20, 0, 6)
+    assert cache.estimated_bytes <= 3000
+    assert all(strip is not None for _, strip in cache._cache[:6])
+
+    while not cache.reflow_step(0):
+        assert cache.estimated_bytes <= 3000
+    assert len(cache) == 600
+
+
+def test_prefetch_renders_evicted_strips_in_range():
+    """Should render again the evicted strips in the given range, stopping when out of time"""
+    cache = RenderablesCache(Console(width=200), byte_budget=3000)
+    cache.content_width = 20
+    for i in range(20):
+        cache.add(RenderableWithOptions(Text(f"{i:02}" * 20), id=str(i)))
+
+    assert cache.prefetch(0, 6, budget=0) == 2
+    assert cache.rerenders == 1
+    assert cache.prefetch(2, 6, budget=1) == 6
+    assert cache.rerenders == 3
+    assert cache.prefetch(0, 6, budget=1) == 6
+    assert cache.rerenders == 3
+
+
+class _SlowRenderable:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def __rich_console__(self, console, options):
+        time.sleep(self.delay)
+        yield Text("slow\nrenderable")
+
+
+def test_renderable_over_budget_is_deferred():
+    """Should show a placeholder for a renderable over the render budget and swap it in once rendered"""
+    done = threading.Event()
+
+    class Listener(CacheListener):
+        def on_deferred_render(self):
+            done.set()
+
+    cache = RenderablesCache(Console(width=200), listener=Listener(), render_budget=0.01)
+    cache.content_width = 20
+    cache.add(RenderableWithOptions(_SlowRenderable(0.2), id="slow"))
+    cache.add(RenderableWithOptions(Text("fast"), id="fast"))
+
+    assert cache.deferred_renders == 1
+    assert cache.strip_at(0).text.startswith("… rendering")
+    assert cache.entry_at(1) == ("fast", 0)
+
+    assert done.wait(timeout=2)
+    cache.complete_deferred()
+
+    assert [strip.text.rstrip() for strip in cache.strips_between(0, 3)] == ["slow", "renderable", "fast"]
+
+
+class _ChangingRenderable:
+    def __init__(self, text: str, delay: float) -> None:
+        self.text = text
+        self.delay = delay
+        self.threads: list[str] = []
+
+    def __rich_console__(self, console, options):
+        self.threads.append(threading.current_thread().name)
+        text = self.text
+        time.sleep(self.delay)
+        yield Text(text)
+
+
+def _deferring_cache() -> tuple[RenderablesCache, threading.Event]:
+    done = threading.Event()
+
+    class Listener(CacheListener):
+        def on_deferred_render(self):
+            done.set()
+
+    cache = RenderablesCache(Console(width=200), listener=Listener(), render_budget=0.05)
+    cache.content_width = 20
+    return cache, done
+
+
+def test_slow_renderable_does_not_hold_back_the_next_ones():
+    """Should render the renderables added after a slow one within the budget, in other threads"""
+    cache, _ = _deferring_cache()
+    cache.add(RenderableWithOptions(_SlowRenderable(0.5), id="slow"))
+    cache.add(RenderableWithOptions(Markdown("**fast**"), id="fast"))
+
+    assert cache.deferred_renders == 1
+    assert cache.strip_at(cache.line_of("fast")).text.rstrip() == "fast"
+    cache.close()
+
+
+def test_rerender_while_deferred_shows_the_new_version():
+    """Should not swap in the render of a renderable which changed while it was rendering"""
+    cache, done = _deferring_cache()
+    renderable = _ChangingRenderable("old", 0.2)
+    cache.add(RenderableWithOptions(renderable, id="changing"))
+    renderable.text = "new"
+    cache.rerender("changing")
+    assert cache.deferred_renders == 2
+
+    deadline = time.monotonic() + 2
+    while cache._deferred and time.monotonic() < deadline:
+        done.wait(timeout=0.1)
+        done.clear()
+        cache.complete_deferred()
+
+    assert cache.strip_at(0).text.rstrip() == "new"
+
+
+def test_synchronous_render_drops_the_deferred_one():
+    """Should forget a deferred render once the renderable is rendered again without deferring it"""
+    cache, done = _deferring_cache()
+    renderable = _ChangingRenderable("old", 0.2)
+    cache.add(RenderableWithOptions(renderable, id="changing"))
+    renderable.text = "new"
+    renderable.delay = 0
+    cache._render_budget = None
+    cache.rerender("changing")
+
+    assert not cache._deferred
+    done.wait(timeout=1)
+    cache.complete_deferred()
+    assert cache.strip_at(0).text.rstrip() == "new"
+
+
+def test_renderable_reading_widget_state_is_rendered_on_event_loop():
+    """Should render a renderable with `render_on_event_loop` in the calling thread, whatever the budget"""
+    cache, _ = _deferring_cache()
+    renderable = _ChangingRenderable("chat", 0.1)
+    renderable.render_on_event_loop = True  # type: ignore[attr-defined]
+    cache.add(RenderableWithOptions(renderable, id="chat"))
+
+    assert cache.deferred_renders == 0
+    assert renderable.threads == [threading.current_thread().name]
+
+
+def test_clear_stops_the_render_threads():
+    """Should cancel the deferred renders and shut the render threads down on clear"""
+    cache, _ = _deferring_cache()
+    cache.add(RenderableWithOptions(_SlowRenderable(0.2), id="slow"))
+    assert cache._executor is not None
+
+    cache.clear()
+
+    assert cache._executor is None
+    assert not cache._deferred
+
+
+def test_preview_mode_renders_plain_text_until_upgraded():
+    """Should render previews in preview mode and render them fully once upgraded"""
+    cache = _cache(40)
+    cache.preview_mode = True
+    cache.add(RenderableWithOptions(Markdown("# Title\n\nsome *text*"), id="markdown"))
+
+    assert cache.has_previews
+    assert [strip.text.rstrip() for strip in cache.strips_between(0, 3)] == ["# Title", "", "some *text*"]
+    assert not cache.upgrade_previews(1)
+
+    cache.preview_mode = False
+    assert cache.upgrade_previews(1)
+    assert not cache.has_previews
+    assert "#" not in cache.strip_at(0).text
+
+
+def test_time_index():
+    """Should find renderables by time, including ones added out of order"""
+    cache = _cache()
+    for id, timestamp in (("a", 1.0), ("b", 2.0), ("d", 4.0), ("c", 3.0)):
+        cache.add(RenderableWithOptions(Text(id * 40), id=id, timestamp=timestamp))
+
+    assert cache.line_at_time(2.5) == 6
+    assert cache.line_at_time(3.5) == 4
+    assert cache.line_at_time(5) is None
+    assert cache.ids_between_times(1.5, 4.0) == ["b", "c"]
+
+    cache.remove("b")
+    assert cache.line_at_time(1.5) == 4
+    assert cache.ids_between_times(0, 10) == ["a", "c", "d"]
+
+
+def test_pause_queues_additions_until_resume():
+    """Should keep the cached strips while paused, drop removed ones at once and render the added ones on resume"""
+    cache = _cache()
+    _add(cache, "a", 10)
+    _add(cache, "b", 10)
+    cache.pause()
+    _add(cache, "c", 10)
+    _add(cache, "d", 10)
+    cache.remove("d")
+    cache.remove("a")
+    assert len(cache) == 1
+    assert cache.entry_at(0) == ("b", 0)
+
+    cache.resume()
+    assert len(cache) == 2
+    assert cache.entry_at(0) == ("b", 0)
+    assert cache.entry_at(1) == ("c", 0)
+
+
+def test_reflow_and_restore_after_removal_while_paused():
+    """Should reflow and restore the remaining lines after a renderable is removed while paused"""
+    cache = RenderablesCache(Console(width=200), byte_budget=1)
+    cache.content_width = 20
+    for id in ("a", "b"):
+        _add(cache, id, 40)
+    cache.pause()
+    cache.remove("a")
+
+    assert cache.strip_at(0).text == "b" * 20
+    cache.reflow(10, 0, 4)
+    assert cache.entry_at(0) == ("b", 0)
+    assert len(cache) == 4
+
+
+def test_indexed_strip_crops_like_strip():
+    """Should crop wide strips with many segments exactly like a plain strip"""
+    text = Text()
+    for i in range(200):
+        text.append(f"{i},値{i}," if i % 3 else "", style="bold")
+        text.append(f"cell {i} ", style="red" if i % 2 else "green")
+    cache = RenderablesCache(Console(width=5000))
+    cache.content_width = 100
+    cache.add(RenderableWithOptions(text, id="wide", width=text.cell_len, expand=True))
+    strip = cache.strip_at(0)
+    assert strip is not None
+    assert len(cache) == 1
+    assert type(strip).__name__ == "_IndexedStrip"
+
+    plain = Strip(list(strip), strip.cell_length)
+    for start in range(0, strip.cell_length + 10, 7):
+        for width in (1, 2, 13, 80):
+            assert strip.crop(start, start + width) == plain.crop(start, start + width)
@@ -0,0 +1,57 @@
+import pytest
+
+from feathers.widgets import DiffView, JsonView, LargeFileView, LogTable
+
+CSS = """
+NavigableView { background: blue; color: white; }
+NavigableView > .navigation-box--cursor { background: red; color: yellow; text-style: none; }
+"""
+
+
+def _large_file_view(tmp_path, view_app):
+    path = tmp_path / "file.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(20)))
+    return view_app(LargeFileView, str(path), enable_cursor=True, css=CSS), None
+
+
+def _log_table(tmp_path, view_app):
+    def fill(view):
+        view.add_rows([(f"row {i}", i) for i in range(20)])
+
+    return view_app(LogTable, ["message", "count"], enable_cursor=True, css=CSS), fill
+
+
+def _json_view(tmp_path, view_app):
+    path = tmp_path / "doc.json"
+    path.write_text("[" + ", ".join(f'"item {i}"' for i in range(20)) + "]")
+    return view_app(JsonView, str(path), css=CSS), None
+
+
+def _diff_view(tmp_path, view_app):
+    before = [f"line {i}" for i in range(20)]
+    after = [*before[:10], "changed", *before[11:]]
+    return view_app(DiffView, before, after, css=CSS), None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_app", [_large_file_view, _log_table, _json_view, _diff_view])
+async def test_cursor_keeps_its_colours(tmp_path, view_app, make_app):
+    """Should show the colours of the cursor on the cursor cell, over the style of the view"""
+    app, fill = make_app(tmp_path, view_app)
+    async with app.run_test() as pilot:
+        view = app.view
+        if fill is not None:
+            fill(view)
+        while view.line_count() < 3:
+            await pilot.pause(0.02)
+        view.focus()
+        await pilot.press("down")
+
+        cursor_style = view.get_component_rich_style("navigation-box--cursor")
+        assert cursor_style.bgcolor != view.rich_style.bgcolor
+        y = view.cursor_position.y
+        cursor, rest = view.render_line(y).divide([1, view.size.width])
+        assert [(segment.style.color, segment.style.bgcolor) for segment in cursor] == [
+            (cursor_style.color, cursor_style.bgcolor)
+        ]
+        assert all(segment.style.bgcolor == view.rich_style.bgcolor for segment in rest)
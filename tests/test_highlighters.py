@@ -0,0 +1,53 @@
+import pytest
+from rich.highlighter import ReprHighlighter
+from rich.text import Span, Text
+
+from feathers.highlighters import CombinedRegexHighlighter, LogLevelHighlighter, MemoizedHighlighter
+from feathers.widgets import CachedView
+
+
+def test_memoized_highlighter_reuses_spans():
+    """Should add the same spans as the wrapped highlighter, running it once per distinct string"""
+    highlighter = MemoizedHighlighter(ReprHighlighter())
+    line = "GET /index.html 200 in 12.5ms from 127.0.0.1"
+
+    first = highlighter(Text(line))
+    second = highlighter(Text.from_markup(f"[bold]{line}[/bold]"))
+
+    assert first.spans == ReprHighlighter()(Text(line)).spans
+    assert second.spans == [Span(0, len(line), "bold"), *first.spans]
+    assert (highlighter.hits, highlighter.misses) == (1, 1)
+
+
+def test_combined_regex_highlighter():
+    """Should style each match with the name of the first pattern matching there"""
+    text = CombinedRegexHighlighter()(Text("x=12 ok=True name='a 1' at https://x.io/1"))
+
+    styled = [(text.plain[span.start : span.end], span.style) for span in text.spans]
+    assert styled == [
+        ("12", "repr.number"),
+        ("True", "repr.bool_true"),
+        ("'a 1'", "repr.str"),
+        ("https://x.io/1", "repr.url"),
+    ]
+
+
+def test_log_level_highlighter():
+    """Should only style the log levels"""
+    text = LogLevelHighlighter()(Text("12:00 WARNING disk 90% full, error soon"))
+
+    styled = [(text.plain[span.start : span.end], span.style) for span in text.spans]
+    assert styled == [("WARNING", "logging.level.warning"), ("error", "logging.level.error")]
+
+
+@pytest.mark.asyncio
+async def test_view_highlights_only_with_highlight(view_app):
+    """Should leave text unstyled unless highlight is set"""
+    app = view_app(CachedView)
+    async with app.run_test():
+        plain = app.view._extract_renderable("value 42", None)
+        app.view.highlight = True
+        highlighted = app.view._extract_renderable("value 42", None)
+
+    assert isinstance(plain.renderableType, Text) and plain.renderableType.spans == []
+    assert isinstance(highlighted.renderableType, Text) and highlighted.renderableType.spans
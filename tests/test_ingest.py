@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from feathers.ingest import IngestChannel, InvalidOverflowPolicy
+from feathers.widgets import CachedView
+
+
+def test_drop_oldest():
+    """Should drop the oldest waiting entry when full"""
+    channel = IngestChannel(maxsize=2, policy="drop-oldest")
+    for i in range(3):
+        assert channel.put(str(i))
+
+    assert [content for content, _ in channel.drain()] == ["1", "2"]
+    assert channel.dropped == 1
+
+
+def test_drop_newest():
+    """Should drop the entry being put when full"""
+    channel = IngestChannel(maxsize=2, policy="drop-newest")
+    assert channel.put_many(["0", "1", "2"]) == 2
+
+    assert [content for content, _ in channel.drain()] == ["0", "1"]
+    assert channel.dropped == 1
+
+
+def test_block_until_drained():
+    """Should block a full channel until there is space"""
+    channel = IngestChannel(maxsize=1, policy="block")
+    channel.put("0")
+    assert not channel.put("1", timeout=0.01)
+
+    thread = threading.Thread(target=channel.put, args=("2",))
+    thread.start()
+    assert channel.drain() == [("0", None)]
+    thread.join(timeout=1)
+
+    assert channel.drain() == [("2", None)]
+    assert channel.dropped == 1
+
+
+def test_invalid_policy():
+    """Should reject an unknown overflow policy"""
+    with pytest.raises(InvalidOverflowPolicy):
+        IngestChannel(policy="drop-all")  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_entries_from_threads_are_written_in_batches(view_app):
+    """Should write entries put from other threads to the view"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        channel = app.view.create_ingest_channel(interval=0.01)
+        threads = [
+            threading.Thread(target=channel.put_many, args=([f"{t}-{i}" for i in range(100)],)) for t in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # each batch takes about a budget, so the entries take a few frames
+        for _ in range(100):
+            if not len(channel):
+                break
+            await pilot.pause(0.02)
+
+        assert app.view.line_count() == 400
+        assert len(channel) == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_of_a_full_channel_is_bounded(view_app):
+    """Should write only what fits in the budget of a batch, leaving the rest for the next frames"""
+    app = view_app(CachedView)
+    async with app.run_test():
+        channel = IngestChannel(maxsize=10_000, budget=0.01)
+        channel.put_many(f"entry {i}" for i in range(20_000))
+        channel.attach(app.view, interval=60)
+
+        start = time.perf_counter()
+        channel.flush()
+        elapsed = time.perf_counter() - start
+
+        assert 0 < app.view.line_count() < 1_000
+        assert len(channel) == 10_000 - app.view.line_count()
+        assert channel.dropped == 10_000
+        assert elapsed < 0.2
+        channel.detach()
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+
+from feathers.renderables import LazyPretty
+
+
+def test_bounded_summary():
+    """Should show only the first items of a big container and collapse nested containers"""
+    data = {f"key{i}": {"nested": i} for i in range(100_000)}
+    lines = LazyPretty(data, max_length=3).plain.splitlines()
+
+    assert lines == [
+        "▼ dict (100000 items)",
+        "  ▶ 'key0': dict (1 item)",
+        "  ▶ 'key1': dict (1 item)",
+        "  ▶ 'key2': dict (1 item)",
+        "  … 99997 more",
+    ]
+
+
+def test_activate_expands_collapses_and_shows_more():
+    """Should expand a container, show more of its items and collapse it again"""
+    pretty = LazyPretty({"items": list(range(5)), "name": "x" * 200}, max_length=2, max_string=10)
+
+    assert pretty.activate(1)
+    assert pretty.plain.splitlines()[1:5] == ["  ▼ 'items': list (5 items)", "    0", "    1", "    … 3 more"]
+    assert pretty.activate(4)
+    assert pretty.plain.splitlines()[4:7] == ["    2", "    3", "    … 1 more"]
+    assert pretty.activate(1)
+    assert pretty.plain.splitlines() == ["▼ dict (2 items)", "  ▶ 'items': list (5 items)", "  'name': 'xx...xxx'"]
+    assert not pretty.activate(2)
+
+
+class _Items(list):
+    def __repr__(self):
+        raise AssertionError("the full repr should not be built")
+
+
+@dataclass
+class _Big:
+    name: str
+    values: list
+
+
+def test_repr_is_bounded_without_the_full_repr():
+    """Should shorten container subclasses and dataclasses without building their full repr"""
+    pretty = LazyPretty([_Items(range(100_000)), _Big("big", list(range(100_000)))], max_depth=1)
+
+    assert pretty.plain.splitlines() == [
+        "▼ list (2 items)",
+        "  ▶ _Items (100000 items)",
+        "  _Big(name='big', values=[...])",
+    ]
+    assert LazyPretty(_Items(range(100_000)), max_depth=0).plain == "▶ _Items (100000 items)"
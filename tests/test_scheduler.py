@@ -0,0 +1,35 @@
+import pytest
+from textual.app import App
+
+from feathers.scheduler import get_scheduler
+
+
+@pytest.mark.asyncio
+async def test_runs_tasks_by_priority_when_idle():
+    """Should run the steps of higher priority tasks first and drop cancelled tasks"""
+    app = App()
+    async with app.run_test() as pilot:
+        scheduler = get_scheduler(app)
+        assert get_scheduler(app) is scheduler
+        runs: list[str] = []
+
+        def task(name: str, steps: int):
+            def step(budget: float) -> bool:
+                assert budget > 0
+                runs.append(name)
+                return runs.count(name) == steps
+
+            return step
+
+        scheduler.schedule(task("low", 2), priority=0)
+        high = scheduler.schedule(task("high", 2), priority=1)
+        cancelled = scheduler.schedule(task("cancelled", 1), priority=2)
+        cancelled.cancel()
+        assert scheduler.queue_depth == 2
+        assert runs == []
+
+        await pilot.pause()
+        assert runs == ["high", "high", "low", "low"]
+        assert scheduler.queue_depth == 0
+        assert not high.is_active
+        assert scheduler.time_used >= high.time_used > 0
@@ -0,0 +1,105 @@
+import asyncio
+import socket
+
+import pytest
+
+from feathers.server import IngestClient, IngestServer, InvalidFraming
+from feathers.widgets import CachedView
+
+
+async def _send(address, entries, framing):
+    def send() -> None:
+        with IngestClient(address, framing=framing) as client:
+            for start in range(0, len(entries), 100):
+                client.send_many(entries[start : start + 100])
+
+    await asyncio.get_running_loop().run_in_executor(None, send)
+
+
+@pytest.mark.asyncio
+async def test_entries_from_producers_are_batched(tmp_path, view_app):
+    """Should write the entries of every producer to the view, pausing a producer which is too far ahead"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        server = IngestServer(app.view, max_pending=50, read_size=1024)
+        address = await server.start_unix(tmp_path / "ingest.sock")
+        entries = [f"entry {i} é" for i in range(1000)]
+        await asyncio.gather(_send(address, entries, "newline"), _send(address, entries[:10], "newline"))
+        # with max_pending=50, about 50 entries of each producer are written per batch
+        for _ in range(100):
+            if server.frames == 1010 and not server.connections:
+                break
+            await pilot.pause(0.05)
+
+        assert server.frames == 1010
+        assert server.connections_total == 2
+        assert server.read_pauses > 0
+        assert len(app.view._renderables_cache._all_renderables) == 1010
+        assert server.connections == []
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_length_prefixed_frames_over_tcp(view_app):
+    """Should keep multi-line entries whole with length-prefixed frames, and drop a producer sending a too large one"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        server = IngestServer(app.view, framing="length", max_frame=100)
+        address = await server.start_tcp()
+        await _send(address, ["first\nline", "second"], "length")
+        await _send(address, ["x" * 101, "never shown"], "length")
+        await pilot.pause(0.2)
+
+        entries = [entry.renderableType.plain for entry in app.view._renderables_cache._all_renderables.values()]
+        assert entries == ["first\nline", "second"]
+        assert server.oversized == 1
+        await server.close()
+
+    with pytest.raises(InvalidFraming):
+        IngestServer(app.view, framing="json")
+
+
+@pytest.mark.asyncio
+async def test_flush_is_bounded_by_the_budget(tmp_path, view_app):
+    """Should write only what fits in the budget of a batch when producers flood the server"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        server = IngestServer(app.view, max_pending=100_000, budget=0.01)
+        address = await server.start_unix(tmp_path / "ingest.sock", interval=60)
+        await _send(address, [f"entry {i}" for i in range(10_000)], "newline")
+        while server.frames < 10_000:
+            await pilot.pause(0.01)
+
+        server.flush()
+
+        assert 0 < len(app.view._renderables_cache._all_renderables) < 1_000
+        await server.close()
+        while server.connections:
+            server.flush()
+        assert len(app.view._renderables_cache._all_renderables) == 10_000
+
+
+@pytest.mark.asyncio
+async def test_live_socket_is_not_replaced(tmp_path, view_app):
+    """Should refuse a socket another server listens on, and replace one left by a stopped server"""
+    app = view_app(CachedView)
+    async with app.run_test() as pilot:
+        path = tmp_path / "ingest.sock"
+        first = IngestServer(app.view)
+        await first.start_unix(path)
+
+        with pytest.raises(OSError):
+            await IngestServer(app.view).start_unix(path)
+        await _send(str(path), ["still served"], "newline")
+        while not first.frames:
+            await pilot.pause(0.01)
+
+        # a socket file left behind, as by a server which crashed
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(tmp_path / "stale.sock"))
+        stale.close()
+        second = IngestServer(app.view)
+        assert await second.start_unix(tmp_path / "stale.sock") == str(tmp_path / "stale.sock")
+
+        await first.close()
+        await second.close()
@@ -0,0 +1,36 @@
+from rich.console import Console
+
+from feathers.renderables import Sparkline
+
+
+def _render(sparkline: Sparkline, width: int = 10) -> str:
+    console = Console(width=width, color_system=None)
+    with console.capture() as capture:
+        console.print(sparkline)
+    return capture.get().rstrip("\n")
+
+
+def test_buckets_complete_as_values_are_added():
+    """Should only report a change when a bucket completes, and draw one bar per bucket"""
+    sparkline = Sparkline(100, width=10)
+    changes = [sparkline.append(value) for value in range(100)]
+
+    assert changes == [value % 10 == 9 for value in range(100)]
+    assert _render(sparkline) == "▁▂▃▃▄▅▆▆▇█"
+    version = sparkline.version
+    assert not sparkline.extend([1000] * 9)
+    assert sparkline.version == version
+    assert len(sparkline) == 100
+
+
+def test_rebuild_matches_incremental_buckets():
+    """Should give the same buckets when rebuilt from the ring buffer as when updated value by value"""
+    incremental = Sparkline(50, width=7, summary="max")
+    rebuilt = Sparkline(50, summary="max")
+    values = [(i * 37) % 101 for i in range(333)]
+    incremental.extend(values)
+    rebuilt.extend(values)
+
+    assert _render(rebuilt, 7) == _render(incremental, 7)
+    assert list(rebuilt._buckets) == list(incremental._buckets)[-len(rebuilt._buckets) :]
+    assert _render(Sparkline(10, width=4)) == "    "